@@ -1,49 +1,55 @@
+import time
+
+# Catat waktu mulai untuk rincian waktu startup per fase
+startup_begin = time.perf_counter()
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
 import sys
-import joblib
-import json
-import nltk
-import time
 import traceback
 
-# Setup NLTK - Download resource yang dibutuhkan
-def setup_nltk():
-    """Download semua resource NLTK yang dibutuhkan aplikasi"""
-    print("Menyiapkan resource NLTK...")
-    # Pastikan resource punkt dan stopwords tersedia
-    try:
-        nltk.download('punkt')
-        nltk.download('stopwords')
-        print("Resource NLTK berhasil disiapkan")
-    except Exception as e:
-        print(f"Gagal menyiapkan NLTK: {e}")
-
-# Jalankan setup NLTK pertama kali
-setup_nltk()
-
 # Menambahkan path untuk import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import modul-modul aplikasi
-from utils.preprocessor import preprocess_text
+from utils.preprocessor import preprocess_text, preprocess_document, stem_cache, DEFAULT_STEM_CACHE_PATH
 from models.classifier import DiseaseClassifier
 from models.translator import OutputTranslator
 from models.chatbot import Chatbot
+from models.knowledge_base import KnowledgeBaseWatcher
+from models.artifact import convert_joblib_model
+from utils.config import read_poll_interval
+
+# Mode offline untuk container tanpa akses jaringan: tidak pernah melatih model saat startup,
+# model harus sudah tersedia sebagai artefak. Aktifkan dengan TANYASEHAT_OFFLINE=1
+offline_mode = os.environ.get('TANYASEHAT_OFFLINE', '').lower() in ('1', 'true', 'yes')
+# Jeda pemeriksaan perubahan data/diseases.json dan data/faq.json (detik); 0 menonaktifkan pemuatan ulang
+knowledge_poll_interval = read_poll_interval()
+
+# Rincian waktu startup per fase (detik)
+startup_timings = {'imports': time.perf_counter() - startup_begin}
 
 app = Flask(__name__)
 CORS(app)  # Mengaktifkan CORS untuk integrasi dengan frontend
 
+# Muat resource preprocessing. Stopwords dan tokenizer sudah disertakan di utils.preprocessor,
+# jadi tidak ada resource yang perlu diunduh; cukup muat cache stemming yang tersimpan
+# agar worker tidak perlu men-stem ulang kosakata yang sudah dikenal
+phase_start = time.perf_counter()
+loaded_stems = stem_cache.load(DEFAULT_STEM_CACHE_PATH)
+if loaded_stems:
+    print(f"Cache stemming dimuat: {loaded_stems} token")
+startup_timings['resources'] = time.perf_counter() - phase_start
+
 # Inisialisasi Model
 print("Menginisialisasi model...")
+phase_start = time.perf_counter()
 disease_classifier = DiseaseClassifier()
-output_translator = OutputTranslator()
-chatbot = Chatbot()
 
-# Nama file model
-model_filename = 'disease_classifier.joblib'
-model_format_version = 2  # Versi format model saat ini
+# Nama artefak model (direktori manifest.json + buffer .npy) dan file model format lama
+model_filename = 'disease_classifier'
+legacy_model_filename = 'disease_classifier.joblib'
 
 # Flag untuk memaksa pelatihan ulang (set True untuk memaksa melatih ulang model)
 force_retrain = False
@@ -51,32 +57,117 @@ force_retrain = False
 # Cek apakah model sudah ada
 models_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'models')
 model_path = os.path.join(models_dir, model_filename)
+legacy_model_path = os.path.join(models_dir, legacy_model_filename)
+
+# Menandakan apakah model siap dipakai untuk prediksi
+model_ready = False
+
+def train_on_startup():
+    """Melatih model saat startup, kecuali dalam mode offline"""
+    global model_ready
+    if offline_mode:
+        print("Mode offline: model tidak akan dilatih saat startup. "
+              "Endpoint prediksi tidak tersedia sampai model dilatih melalui /api/train.")
+        return
+    
+    accuracy = disease_classifier.train()
+    saved_path = disease_classifier.save_model(model_filename)
+    stem_cache.save(DEFAULT_STEM_CACHE_PATH)
+    model_ready = True
+    print(f"Model baru telah dilatih dengan akurasi: {accuracy:.4f}")
+    print(f"Model disimpan di: {saved_path}")
+
+# Konversi sekali model format lama (joblib) menjadi artefak terkompilasi
+if not os.path.exists(model_path) and os.path.exists(legacy_model_path) and not force_retrain:
+    try:
+        print(f"Mengonversi model lama {legacy_model_path} menjadi artefak...")
+        convert_joblib_model(legacy_model_path, model_path)
+    except Exception as e:
+        print(f"Gagal mengonversi model lama: {e}")
 
 if os.path.exists(model_path) and not force_retrain:
     try:
         disease_classifier.load_model(model_filename)
+        model_ready = True
         print("Model berhasil dimuat dari", model_path)
     except Exception as e:
         print(f"Error saat memuat model: {e}")
         print("Model baru akan dibuat dan dilatih...")
-        accuracy = disease_classifier.train()
-        disease_classifier.save_model(model_filename)
-        print(f"Model baru telah dilatih dengan akurasi: {accuracy:.4f}")
+        train_on_startup()
 else:
     if force_retrain:
         print("Memaksa pelatihan ulang model...")
     else:
         print("Model tidak ditemukan. Model baru akan dibuat dan dilatih...")
     
-    accuracy = disease_classifier.train()
-    saved_path = disease_classifier.save_model(model_filename)
-    print(f"Model baru telah dilatih dengan akurasi: {accuracy:.4f}")
-    print(f"Model disimpan di: {saved_path}")
+    train_on_startup()
+startup_timings['model_load'] = time.perf_counter() - phase_start
+
+# Muat data penyakit dan FAQ sekali, dipakai bersama oleh translator dan chatbot;
+# file dipantau dan dimuat ulang otomatis saat berubah
+phase_start = time.perf_counter()
+knowledge_base = KnowledgeBaseWatcher(poll_interval=knowledge_poll_interval or None)
+output_translator = OutputTranslator(knowledge_base)
+chatbot = Chatbot(knowledge_base)
+startup_timings['data_load'] = time.perf_counter() - phase_start
+
+startup_timings['total'] = time.perf_counter() - startup_begin
+print("Waktu startup: " + ", ".join(f"{phase} {seconds:.2f} detik" for phase, seconds in startup_timings.items()))
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Endpoint untuk health check"""
-    return jsonify({'status': 'healthy'})
+    return jsonify({
+        'status': 'healthy' if model_ready else 'degraded',
+        'model_ready': model_ready,
+        'offline_mode': offline_mode,
+        'startup_timings': {phase: round(seconds, 4) for phase, seconds in startup_timings.items()},
+        'stem_cache': stem_cache.stats(),
+        'knowledge_base': knowledge_base.stats()
+    })
+
+# Batas jumlah teks dalam satu request /api/predict/batch
+max_batch_size = 1000
+
+def format_prediction(prediction, confidence, top_diseases, reason=None):
+    """
+    Menyusun hasil prediksi satu teks menjadi response beserta rekomendasinya
+    
+    Parameters
+    ----------
+    prediction : str
+        Nama penyakit hasil prediksi
+    confidence : float
+        Tingkat kepercayaan prediksi
+    top_diseases : list of tuple
+        Pasangan (nama_penyakit, probabilitas) dengan probabilitas tertinggi
+    reason : str or None
+        Kode alasan jika prediksi ditentukan tanpa model (misalnya 'no_known_features')
+    
+    Returns
+    -------
+    dict
+        Response prediksi tanpa waktu pemrosesan
+    """
+    # Format top diseases untuk response
+    formatted_top_diseases = [
+        {"name": disease, "probability": prob}
+        for disease, prob in top_diseases
+        if disease != prediction  # Jangan duplikat penyakit utama
+    ]
+    
+    # Generate rekomendasi
+    recommendation = output_translator.translate(prediction, confidence)
+    
+    response = {
+        'prediction': prediction,
+        'confidence': confidence,
+        'recommendation': recommendation,
+        'top_diseases': formatted_top_diseases
+    }
+    if reason is not None:
+        response['reason'] = reason
+    return response
 
 @app.route('/api/predict', methods=['POST'])
 def predict_disease():
@@ -88,34 +179,23 @@ def predict_disease():
         
         if not data or 'text' not in data:
             return jsonify({'error': 'Data input tidak valid'}), 400
+        
+        if not model_ready:
+            return jsonify({'error': 'Model belum tersedia, latih model melalui /api/train'}), 503
           
         # Ambil teks gejala dari request
         symptoms_text = data['text']
         
-        # Preprocessing teks
-        processed_text = preprocess_text(symptoms_text)
-        
-        # Prediksi penyakit
-        prediction, confidence, top_diseases = disease_classifier.predict(processed_text)
+        # Preprocessing teks, cukup sekali per request
+        document = preprocess_document(symptoms_text)
         
-        # Format top diseases untuk response
-        formatted_top_diseases = [
-            {"name": disease, "probability": prob}
-            for disease, prob in top_diseases
-            if disease != prediction  # Jangan duplikat penyakit utama
-        ]
-        
-        # Generate rekomendasi
-        recommendation = output_translator.translate(prediction, confidence)
+        # Prediksi penyakit dari dokumen yang sudah diproses
+        result = disease_classifier.predict(document)
+        prediction, confidence, top_diseases = result
         
         # Menyiapkan response
-        response = {
-            'prediction': prediction,
-            'confidence': confidence,
-            'recommendation': recommendation,
-            'top_diseases': formatted_top_diseases,
-            'processing_time': f"{(time.time() - start_time):.2f} detik"
-        }
+        response = format_prediction(prediction, confidence, top_diseases, getattr(result, 'reason', None))
+        response['processing_time'] = f"{(time.time() - start_time):.2f} detik"
         
         return jsonify(response)
     
@@ -127,6 +207,76 @@ def predict_disease():
             'message': str(e)
         }), 500
 
+@app.route('/api/predict/batch', methods=['POST'])
+def predict_disease_batch():
+    """
+    Endpoint untuk memprediksi penyakit dari banyak teks gejala sekaligus.
+    Menerima array JSON berisi teks (atau objek {"text": ...}), atau objek
+    {"texts": [...]}. Kegagalan satu item dilaporkan di item tersebut tanpa
+    menggagalkan seluruh batch.
+    """
+    start_time = time.time()
+    
+    try:
+        data = request.json
+        items = data.get('texts') if isinstance(data, dict) else data
+        
+        if not isinstance(items, list):
+            return jsonify({'error': 'Data input tidak valid, kirim array teks atau {"texts": [...]}'}), 400
+        
+        if len(items) > max_batch_size:
+            return jsonify({'error': f'Jumlah teks melebihi batas {max_batch_size} per request'}), 413
+        
+        if not model_ready:
+            return jsonify({'error': 'Model belum tersedia, latih model melalui /api/train'}), 503
+        
+        # Ambil teks gejala dari setiap item, item yang tidak valid langsung ditandai
+        results = [None] * len(items)
+        valid_indices = []
+        valid_texts = []
+        for i, item in enumerate(items):
+            text = item.get('text') if isinstance(item, dict) else item
+            if isinstance(text, str):
+                valid_indices.append(i)
+                valid_texts.append(text)
+            else:
+                results[i] = {'error': 'Data input tidak valid'}
+        
+        # Preprocessing dan prediksi seluruh teks valid dalam satu batch. Jika batch gagal,
+        # setiap teks diprediksi satu per satu agar hanya item yang bermasalah yang gagal
+        try:
+            predictions = disease_classifier.predict_batch(valid_texts)
+        except Exception as e:
+            print(f"Error pada prediksi batch, memprediksi per item: {e}")
+            predictions = [None] * len(valid_texts)
+        
+        for i, text, result in zip(valid_indices, valid_texts, predictions):
+            try:
+                if result is None:
+                    result = disease_classifier.predict(text)
+                prediction, confidence, top_diseases = result
+                results[i] = format_prediction(prediction, confidence, top_diseases, getattr(result, 'reason', None))
+            except Exception as e:
+                print(f"Error pada item {i} endpoint predict batch: {e}")
+                results[i] = {
+                    'error': 'Terjadi kesalahan saat memproses item ini',
+                    'message': str(e)
+                }
+        
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'processing_time': f"{(time.time() - start_time):.2f} detik"
+        })
+    
+    except Exception as e:
+        print(f"Error pada endpoint predict batch: {e}")
+        traceback.print_exc()
+        return jsonify({
+            'error': 'Terjadi kesalahan internal saat memproses permintaan',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """Endpoint untuk chatbot sederhana"""
@@ -163,10 +313,13 @@ def chat():
 @app.route('/api/train', methods=['POST'])
 def train_model():
     """Endpoint untuk melatih ulang model (hanya untuk development)"""
+    global model_ready
     try:
         start_time = time.time()
         accuracy = disease_classifier.train()
         disease_classifier.save_model(model_path)
+        stem_cache.save(DEFAULT_STEM_CACHE_PATH)
+        model_ready = True
         
         training_time = time.time() - start_time
         
@@ -0,0 +1,73 @@
+"""
+Benchmark clean_text untuk input panjang: normalizer satu pemindaian saat ini
+dibandingkan dengan implementasi awal (beberapa re.sub berurutan).
+
+Jalankan dari folder backend:
+    python benchmarks/bench_clean_text.py [--repeat N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import unicodedata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.preprocessor import clean_text
+
+# Potongan teks yang diulang untuk membentuk input panjang, beserta panjang input
+# terbesar yang masih dibandingkan dengan implementasi awal:
+# - gejala: semua jenis pola normalizer (angka, tanggal, URL, tag HTML, simbol dan emoji)
+# - '<' tanpa '>': kasus terburuk pencocokan tag HTML; implementasi awal kuadratik,
+#   sedangkan clean_text saat ini harus tetap linear
+SAMPLES = {
+    'gejala': (('Saya demam 39 derajat sejak 12/05/2024, batuk & pilek!!! '
+                'Sudah cek https://example.com/gejala?id=5 dan <b>sakit kepala</b> 😷 '), 1250000),
+    "'<' tanpa '>'": ('< a ', 12500),
+}
+
+def baseline_clean_text(text):
+    """Implementasi awal clean_text sebagai pembanding"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    date_pattern = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
+    number_pattern = r'\b\d+\b'
+    text = re.sub(date_pattern, ' DATE ', text)
+    text = re.sub(number_pattern, ' NUM ', text)
+    text = text.lower()
+    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    text = re.sub(r'<.*?>', '', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+def best_time(func, text, repeat):
+    """Waktu tercepat dari beberapa kali pemanggilan (detik)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Jumlah pengulangan per ukuran input')
+    args = parser.parse_args()
+
+    for name, (sample, baseline_limit) in SAMPLES.items():
+        print(f"\n{name}")
+        print(f"{'karakter':>10} {'awal (ms)':>12} {'sekarang (ms)':>14} {'speedup':>8}")
+        for length in (125, 1250, 12500, 125000, 1250000):
+            text = sample * (length // len(sample))
+            current = best_time(clean_text, text, args.repeat)
+            if len(text) > baseline_limit:
+                print(f"{len(text):>10} {'-':>12} {current * 1000:>14.3f} {'-':>8}")
+                continue
+            if clean_text(text) != baseline_clean_text(text):
+                raise SystemExit(f"Hasil clean_text berbeda untuk input {len(text)} karakter")
+            baseline = best_time(baseline_clean_text, text, args.repeat)
+            print(f"{len(text):>10} {baseline * 1000:>12.3f} {current * 1000:>14.3f} {baseline / current:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
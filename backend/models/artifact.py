@@ -0,0 +1,231 @@
+"""
+Format artefak model terkompilasi yang dapat dimuat dengan memory-map.
+
+Satu artefak adalah direktori berisi file penunjuk CURRENT dan satu atau dua
+direktori versi (v-<waktu>-<pid>). CURRENT berisi nama versi yang aktif dan
+diganti secara atomik saat model baru disimpan, sehingga path artefak selalu
+mengarah ke versi yang lengkap. Setiap direktori versi berisi manifest.json
+dan buffer .npy mentah:
+
+- manifest.json          : versi format, parameter featurizer, alpha classifier,
+                           label kelas, diseases_info dan model_confidence
+- terms.npy              : term vocabulary terurut (indeks fitur = posisi term);
+                           tidak ada untuk featurizer hashing (mode inkremental)
+- idf.npy                : bobot idf per fitur
+- feature_log_prob.npy   : log-probabilitas fitur per kelas (kelas x fitur)
+
+Array dimuat dengan np.load(..., mmap_mode='r') sehingga beberapa worker
+berbagi satu salinan fisik di page cache. Artefak format lama (manifest.json
+langsung di direktori artefak, tanpa CURRENT) tetap dapat dimuat.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import numpy as np
+import joblib
+
+from models.featurizer import TfidfFeaturizer, HashingFeaturizer
+from models.compiled_model import CompiledModel
+
+ARTIFACT_FORMAT = 'tanyasehat-compiled-model'
+ARTIFACT_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+ARRAY_FILES = {
+    'terms': 'terms.npy',
+    'idf': 'idf.npy',
+    'feature_log_prob': 'feature_log_prob.npy'
+}
+
+POINTER_FILENAME = 'CURRENT'
+VERSION_PREFIX = 'v-'
+
+def _current_version(artifact_dir):
+    """Nama direktori versi yang ditunjuk file CURRENT, atau None (format lama / belum ada)"""
+    try:
+        with open(os.path.join(artifact_dir, POINTER_FILENAME), 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def resolve_artifact_dir(artifact_dir):
+    """Direktori versi aktif sebuah artefak; artefak format lama mengembalikan path itu sendiri"""
+    version = _current_version(artifact_dir)
+    return os.path.join(artifact_dir, version) if version else artifact_dir
+
+def is_artifact(path):
+    """Mengecek apakah path adalah direktori artefak model"""
+    return os.path.isfile(os.path.join(resolve_artifact_dir(path), MANIFEST_FILENAME))
+
+def save_artifact(compiled_model, artifact_dir, diseases_info=None, model_confidence=None):
+    """
+    Menyimpan model terkompilasi sebagai versi baru dalam direktori artefak.
+    Versi ditulis lengkap terlebih dahulu, lalu file CURRENT diganti secara
+    atomik (os.replace) untuk menunjuk versi tersebut. Tidak ada saat di mana
+    artifact_dir tidak mengarah ke artefak yang lengkap; versi sebelumnya
+    disimpan agar worker yang sedang memuatnya tetap dapat membaca filenya.
+    
+    Parameters
+    ----------
+    compiled_model : CompiledModel
+        Model yang akan disimpan
+    artifact_dir : str
+        Path direktori artefak
+    diseases_info : dict or None
+        Informasi penyakit dan contoh gejalanya
+    model_confidence : dict or None
+        Confidence model per penyakit
+    
+    Returns
+    -------
+    str
+        Path direktori artefak
+    """
+    featurizer = compiled_model.featurizer
+    
+    if isinstance(featurizer, HashingFeaturizer):
+        # Indeks fitur dihitung dari hash n-gram, tidak ada term yang perlu disimpan
+        files = {name: filename for name, filename in ARRAY_FILES.items() if name != 'terms'}
+        arrays = {
+            'idf': np.ascontiguousarray(featurizer.idf),
+            'feature_log_prob': np.ascontiguousarray(compiled_model.feature_log_prob)
+        }
+        n_features = featurizer.n_features
+    else:
+        # Urutkan vocabulary; kolom idf dan log-probabilitas ikut diurutkan
+        terms, columns = featurizer.sorted_terms()
+        files = ARRAY_FILES
+        arrays = {
+            'terms': terms,
+            'idf': np.ascontiguousarray(featurizer.idf[columns]),
+            'feature_log_prob': np.ascontiguousarray(compiled_model.feature_log_prob[:, columns])
+        }
+        n_features = len(terms)
+    
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'featurizer': 'hashing' if isinstance(featurizer, HashingFeaturizer) else 'vocabulary',
+        'ngram_range': [featurizer.min_n, featurizer.max_n],
+        'sublinear_tf': bool(featurizer.sublinear_tf),
+        'alpha': None if compiled_model.alpha is None else float(compiled_model.alpha),
+        'n_features': int(n_features),
+        'labels': [str(label) for label in compiled_model.labels],
+        'files': files,
+        'diseases_info': diseases_info or {},
+        'model_confidence': {disease: float(value) for disease, value in (model_confidence or {}).items()}
+    }
+    
+    artifact_dir = os.path.abspath(artifact_dir)
+    os.makedirs(artifact_dir, exist_ok=True)
+    previous = _current_version(artifact_dir)
+    version = f"{VERSION_PREFIX}{time.time_ns()}-{os.getpid()}"
+    version_dir = os.path.join(artifact_dir, version)
+    os.makedirs(version_dir)
+    
+    for name, filename in files.items():
+        np.save(os.path.join(version_dir, filename), arrays[name], allow_pickle=False)
+    with open(os.path.join(version_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    
+    # Terbitkan versi baru dengan mengganti penunjuk secara atomik
+    tmp_pointer = os.path.join(artifact_dir, f"{POINTER_FILENAME}.tmp-{os.getpid()}")
+    with open(tmp_pointer, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(tmp_pointer, os.path.join(artifact_dir, POINTER_FILENAME))
+    
+    # Hapus versi yang lebih lama dari versi sebelumnya; file yang masih di-mmap tetap valid
+    # sampai ditutup. File format lama di akar direktori dianggap sebagai versi sebelumnya
+    for entry in os.listdir(artifact_dir):
+        if entry.startswith(VERSION_PREFIX) and entry not in (version, previous):
+            shutil.rmtree(os.path.join(artifact_dir, entry), ignore_errors=True)
+    if previous is not None:
+        for filename in [MANIFEST_FILENAME, *ARRAY_FILES.values()]:
+            legacy_path = os.path.join(artifact_dir, filename)
+            try:
+                os.remove(legacy_path)
+            except OSError:
+                pass
+    
+    return artifact_dir
+
+def load_artifact(artifact_dir, variations=(), mmap_mode='r'):
+    """
+    Memuat model terkompilasi dari direktori artefak
+    
+    Parameters
+    ----------
+    artifact_dir : str
+        Path direktori artefak
+    variations : iterable of tuple
+        Pasangan (kata, variasi) untuk augmentasi input saat prediksi
+    mmap_mode : str or None
+        Mode memory-map untuk np.load, None untuk memuat ke memori
+    
+    Returns
+    -------
+    tuple
+        (CompiledModel, manifest)
+    
+    Raises
+    ------
+    ValueError
+        Jika format atau versi artefak tidak dikenali
+    """
+    artifact_dir = resolve_artifact_dir(artifact_dir)
+    with open(os.path.join(artifact_dir, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    if manifest.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"Format artefak tidak dikenali: {manifest.get('format')}")
+    if manifest.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f"Versi artefak {manifest.get('version')} tidak didukung (versi {ARTIFACT_VERSION})")
+    
+    arrays = {
+        name: np.load(os.path.join(artifact_dir, filename), mmap_mode=mmap_mode, allow_pickle=False)
+        for name, filename in manifest['files'].items()
+    }
+    idf, feature_log_prob = arrays['idf'], arrays['feature_log_prob']
+    ngram_range = tuple(manifest['ngram_range'])
+    
+    # Artefak tanpa kunci 'featurizer' dibuat sebelum mode inkremental ada dan selalu memakai vocabulary
+    if manifest.get('featurizer', 'vocabulary') == 'hashing':
+        featurizer = HashingFeaturizer(manifest['n_features'], idf, ngram_range, sublinear_tf=manifest['sublinear_tf'])
+    else:
+        featurizer = TfidfFeaturizer(arrays['terms'], idf, ngram_range, sublinear_tf=manifest['sublinear_tf'])
+    # Artefak lama tidak menyimpan alpha
+    compiled_model = CompiledModel(featurizer, feature_log_prob, manifest['labels'], variations, alpha=manifest.get('alpha'))
+    return compiled_model, manifest
+
+def convert_joblib_model(joblib_path, artifact_dir):
+    """
+    Mengonversi file model lama (disease_classifier.joblib) menjadi artefak
+    
+    Parameters
+    ----------
+    joblib_path : str
+        Path file model joblib
+    artifact_dir : str
+        Path direktori artefak tujuan
+    
+    Returns
+    -------
+    str
+        Path direktori artefak
+    """
+    model_data = joblib.load(joblib_path)
+    compiled_model = CompiledModel.from_pipeline(model_data['pipeline'], model_data['label_encoder'].classes_, ())
+    return save_artifact(
+        compiled_model,
+        artifact_dir,
+        diseases_info=model_data.get('diseases_info'),
+        model_confidence=model_data.get('model_confidence')
+    )
+
+if __name__ == '__main__':
+    # Penggunaan: python -m models.artifact models/disease_classifier.joblib models/disease_classifier
+    if len(sys.argv) != 3:
+        print("Penggunaan: python -m models.artifact <file_model.joblib> <direktori_artefak>")
+        sys.exit(1)
+    print(f"Artefak model disimpan di {convert_joblib_model(sys.argv[1], sys.argv[2])}")
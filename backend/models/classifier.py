@@ -2,18 +2,147 @@
 Model Klasifikasi Penyakit menggunakan TF-IDF dan Naive Bayes
 """
 import os
+import time
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB, ComplementNB
 from sklearn.pipeline import Pipeline
-from sklearn.model_selection import train_test_split, GridSearchCV, cross_val_score
+from sklearn.model_selection import train_test_split, cross_val_score, cross_val_predict, KFold
+from sklearn.base import clone
 from sklearn.metrics import accuracy_score, classification_report
 from sklearn.ensemble import VotingClassifier
 from sklearn.preprocessing import LabelEncoder
 import joblib
+from scipy.sparse import save_npz, load_npz
 
-from utils.preprocessor import preprocess_text
+from utils.preprocessor import preprocess_document, preprocess_texts, PreprocessedDocument, PREPROCESSOR_VERSION
+from models.compiled_model import CompiledModel
+from models.artifact import is_artifact, save_artifact, load_artifact
+from models.search import CachedGridSearchCV
+from models.incremental import IncrementalModel
+from utils.corpus_cache import CorpusCache
+from utils.training_store import PARQUET_AVAILABLE, read_parquet, import_csv
+
+# Variasi kata gejala untuk augmentasi input saat prediksi (test-time augmentation).
+# Disimpan sebagai tuple pasangan (kata, variasi) agar tidak dibangun ulang setiap prediksi
+GEJALA_VARIATIONS = tuple((kata, tuple(variasi)) for kata, variasi in {
+    'sakit': ['nyeri', 'ngilu', 'perih', 'tidak nyaman'],
+    'kepala': ['tengkorak', 'pala', 'kepala bagian'],
+    'perut': ['lambung', 'abdomen', 'bagian perut', 'perut bagian'],
+    'demam': ['panas', 'temperatur tinggi', 'badan panas', 'suhu tubuh'],
+    'batuk': ['batuk-batuk', 'batuk kering', 'batuk tidak berhenti'],
+    'pusing': ['berkunang', 'vertigo', 'kepala berputar', 'pandangan berputar']
+}.items())
+
+# Label dan kode alasan untuk input yang tidak memuat satu pun token vocabulary
+# (salam, teks acak, topik lain), dikembalikan tanpa vektorisasi dan penilaian
+UNKNOWN_DISEASE = "Tidak diketahui"
+REASON_NO_KNOWN_FEATURES = 'no_known_features'
+
+class Prediction(tuple):
+    """
+    Hasil prediksi berupa tuple (nama_penyakit, confidence, top_diseases) yang
+    dapat di-unpack seperti sebelumnya, dengan atribut reason berisi kode alasan
+    jika prediksi ditentukan tanpa model (None untuk prediksi biasa)
+    """
+    
+    def __new__(cls, disease, confidence, top_diseases, reason=None):
+        prediction = super().__new__(cls, (disease, confidence, top_diseases))
+        prediction.reason = reason
+        return prediction
+
+def augment_text(processed_text):
+    """
+    Membuat variasi teks gejala dengan mengganti kata-kata tertentu dengan sinonimnya
+    
+    Parameters
+    ----------
+    processed_text : str
+        Teks gejala yang sudah dipreprocessing
+    
+    Returns
+    -------
+    list of str
+        Teks asli diikuti semua variasinya
+    """
+    augmented_inputs = [processed_text]
+    for kata, variasi in GEJALA_VARIATIONS:
+        if kata in processed_text:
+            augmented_inputs.extend(processed_text.replace(kata, var) for var in variasi)
+    return augmented_inputs
+
+def class_balance_weights(y):
+    """
+    Menghitung bobot sampel agar setiap kelas berkontribusi setara dengan kelas
+    terbesar, sama seperti menduplikasi baris kelas minoritas hingga jumlahnya
+    sama dengan kelas mayoritas
+    
+    Parameters
+    ----------
+    y : array-like
+        Label kelas setiap sampel
+    
+    Returns
+    -------
+    numpy.ndarray
+        Bobot sampel (max_count / jumlah sampel kelasnya)
+    """
+    _, inverse, counts = np.unique(np.asarray(y), return_inverse=True, return_counts=True)
+    return (counts.max() / counts)[inverse.ravel()]
+
+def iter_pair_indices(n, max_pairs=None, seed=None):
+    """
+    Menghasilkan pasangan indeks (i, j) dengan i < j dari n baris secara bertahap.
+    Jika jumlah pasangan melebihi max_pairs, diambil sampel max_pairs pasangan
+    secara deterministik berdasarkan seed, tanpa membentuk semua pasangan di memori.
+    
+    Parameters
+    ----------
+    n : int
+        Jumlah baris
+    max_pairs : int or None
+        Batas jumlah pasangan, None berarti semua pasangan
+    seed : int or str or None
+        Seed untuk sampling pasangan
+    
+    Yields
+    ------
+    tuple of int
+        Pasangan indeks (i, j), urut leksikografis
+    """
+    total = n * (n - 1) // 2
+    if max_pairs is None or total <= max_pairs:
+        for i in range(n):
+            for j in range(i + 1, n):
+                yield i, j
+        return
+    
+    # Sampel nomor urut pasangan, lalu ubah kembali menjadi (i, j) sambil berjalan maju
+    ranks = sorted(random.Random(seed).sample(range(total), max_pairs))
+    i, row_start, row_len = 0, 0, n - 1
+    for rank in ranks:
+        while rank >= row_start + row_len:
+            row_start += row_len
+            row_len -= 1
+            i += 1
+        yield i, i + 1 + rank - row_start
+
+class BalancedComplementNB(ComplementNB):
+    """
+    ComplementNB yang menyeimbangkan kelas dengan bobot sampel saat fit.
+    Karena bobot dihitung dari label pada setiap fit, GridSearchCV dan
+    cross-validation otomatis menyeimbangkan data training setiap fold.
+    """
+    
+    def fit(self, X, y, sample_weight=None):
+        weights = class_balance_weights(y)
+        if sample_weight is not None:
+            weights = weights * np.asarray(sample_weight, dtype=np.float64)
+        return super().fit(X, y, sample_weight=weights)
 
 class DiseaseClassifier:
     """
@@ -33,11 +162,12 @@ class DiseaseClassifier:
                 use_idf=True,        # Menggunakan inverse document frequency
                 smooth_idf=True      # Smoothing IDF weights
             )),
-            ('clf', ComplementNB(alpha=0.3))  # ComplementNB lebih baik untuk kelas tidak seimbang
+            ('clf', BalancedComplementNB(alpha=0.3))  # ComplementNB dengan bobot penyeimbang kelas
         ])
         
-        # Path ke file data training
+        # Path ke file data training (CSV sumber) dan salinan kolumnarnya (dipakai jika pyarrow terpasang)
         self.data_path = os.path.join('data', 'training_data.csv')
+        self.parquet_path = os.path.join('data', 'training_data.parquet')
         
         # Dictionary untuk menyimpan semua penyakit dan gejala-gejalanya
         self.diseases_info = {}
@@ -47,12 +177,55 @@ class DiseaseClassifier:
         
         # Label encoder untuk menyimpan pemetaan kelas
         self.label_encoder = LabelEncoder()
+        
+        # Jumlah proses untuk preprocessing data training (-1 = semua core CPU)
+        self.n_jobs = -1
+        
+        # Direktori cache teks terproses dan matriks fitur untuk train() (None = tanpa cache)
+        self.corpus_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus_cache')
+        
+        # Strategi pencarian hyperparameter: 'grid' (grid search dengan cache TF-IDF) atau 'halving' (successive halving)
+        self.search_strategy = 'grid'
+        
+        # Batas kombinasi gejala per penyakit untuk augmentasi data, dan seed sampling-nya
+        self.max_pairs_per_class = 5000
+        self.augmentation_seed = 42
+        
+        # Model ringkas untuk serving yang dikompilasi dari pipeline terlatih (lihat _get_compiled_model)
+        self._compiled_model = None
+        
+        # Mode update inkremental (lihat start_incremental): jumlah fitur hashing,
+        # model inkremental aktif, dan contoh baru yang belum masuk ke data training
+        self.incremental_n_features = 2 ** 16
+        self._incremental_model = None
+        self.pending_examples = []
+        
+        # Pelatihan streaming (train_streaming): baris per potongan CSV, setiap baris ke-N
+        # dijadikan data validasi, dan jumlah contoh gejala per penyakit yang disimpan
+        self.streaming_chunksize = 10000
+        self.streaming_validation_every = 5
+        self.streaming_examples_per_disease = 20
+        # Direktori untuk matriks frekuensi sementara train_streaming (None = direktori temp sistem)
+        self.streaming_spill_dir = None
     
     def load_data(self):
         """
-        Memuat data training dari CSV.
+        Memuat data training. Jika pyarrow terpasang, data dibaca dari file Parquet
+        (beserta kolom teks terproses) yang diimpor ulang dari CSV bila CSV lebih baru.
         Jika file tidak ada, akan dibuat data contoh terlebih dahulu.
         """
+        if PARQUET_AVAILABLE:
+            if not os.path.exists(self.data_path) and not os.path.exists(self.parquet_path):
+                self._create_sample_data()
+            if not os.path.exists(self.parquet_path) or (
+                os.path.exists(self.data_path)
+                and os.path.getmtime(self.data_path) > os.path.getmtime(self.parquet_path)
+            ):
+                import_csv(self.data_path, self.parquet_path, n_jobs=self.n_jobs)
+            data = read_parquet(self.parquet_path)
+            print(f"Data training berhasil dimuat dari {self.parquet_path}")
+            return data
+        
         try:
             # Coba load file CSV jika sudah ada
             data = pd.read_csv(self.data_path)
@@ -347,7 +520,7 @@ class DiseaseClassifier:
         print(f"Data contoh berhasil dibuat dan disimpan ke {self.data_path}")
         
         return df
-    def preprocess_training_data(self, data):
+    def preprocess_training_data(self, data, corpus_cache=None):
         """
         Melakukan preprocessing pada data training.
         
@@ -355,69 +528,128 @@ class DiseaseClassifier:
         ----------
         data : pandas.DataFrame
             DataFrame yang berisi kolom 'symptoms' dan 'disease'
+        corpus_cache : CorpusCache or None
+            Cache teks terproses; hanya baris baru atau yang berubah yang diproses
         
         Returns
         -------
         pandas.DataFrame
             DataFrame yang telah dipreproses
         """
-        # Buat kolom baru untuk teks yang sudah dipreproses
-        data['processed_symptoms'] = data['symptoms'].apply(preprocess_text)
-        
-        # Augmentasi data: kombinasikan gejala dari penyakit yang sama untuk meningkatkan jumlah data
-        augmented_data = []
+        # Buat kolom baru untuk teks yang sudah dipreproses (paralel di semua core),
+        # kecuali kolom dari file Parquet dibuat dengan versi preprocessor yang sama
+        if 'processed_symptoms' in data and data.attrs.get('preprocessor_version') == PREPROCESSOR_VERSION:
+            print("Memakai kolom processed_symptoms dari data training")
+        elif corpus_cache is not None:
+            data['processed_symptoms'] = corpus_cache.preprocess(data['symptoms'], n_jobs=self.n_jobs)
+        else:
+            data['processed_symptoms'] = preprocess_texts(data['symptoms'], n_jobs=self.n_jobs)
         
+        # Simpan informasi untuk penggunaan chatbot
         for disease in data['disease'].unique():
-            disease_data = data[data['disease'] == disease]
-            symptoms_list = disease_data['symptoms'].tolist()
-            disease_symptoms = disease_data['symptoms'].tolist()
-            
-            # Simpan informasi untuk penggunaan chatbot
-            self.diseases_info[disease] = disease_symptoms
-            
-            # Augmentasi: buat kombinasi gejala untuk penyakit yang sama
-            if len(symptoms_list) >= 2:
-                for i in range(len(symptoms_list)):
-                    for j in range(i+1, len(symptoms_list)):
-                        # Kombinasikan gejala dan hilangkan duplikasi kata
-                        combined = f"{symptoms_list[i]} dan {symptoms_list[j]}"
-                        augmented_data.append({
-                            'symptoms': combined,
-                            'disease': disease,
-                            'processed_symptoms': preprocess_text(combined)
-                        })
+            self.diseases_info[disease] = data.loc[data['disease'] == disease, 'symptoms'].tolist()
+        
+        # Augmentasi data: kombinasikan gejala dari penyakit yang sama untuk meningkatkan jumlah data
+        augmented_df = pd.DataFrame(
+            self._iter_augmented_rows(data),
+            columns=['symptoms', 'disease', 'processed_symptoms']
+        )
         
         # Gabungkan data asli dengan data yang diaugmentasi
-        if augmented_data:
-            augmented_df = pd.DataFrame(augmented_data)
+        if not augmented_df.empty:
             data = pd.concat([data, augmented_df], ignore_index=True)
         
-        # Balance dataset dengan duplikasi kelas minoritas
+        # Kelas tidak lagi diseimbangkan dengan menduplikasi baris; BalancedComplementNB
+        # memberi bobot sampel max_count / jumlah_kelas sehingga data tetap berukuran asli
         class_counts = data['disease'].value_counts()
-        max_count = class_counts.max()
-        
-        balanced_data = []
-        for disease, count in class_counts.items():
-            if count < max_count:
-                # Duplikasi data untuk kelas minoritas
-                disease_samples = data[data['disease'] == disease]
-                multiplier = int(max_count / count)
-                remainder = max_count % count
-                
-                # Duplikasi data berdasarkan multiplier
-                for _ in range(multiplier - 1):  # -1 karena yang asli sudah ada
-                    balanced_data.append(disease_samples)
-                
-                # Tambahkan sisa data jika ada
-                if remainder > 0:
-                    balanced_data.append(disease_samples.sample(remainder, replace=True))
-        
-        # Gabungkan data yang sudah diseimbangkan
-        if balanced_data:
-            balanced_df = pd.concat(balanced_data, ignore_index=True)
-            data = pd.concat([data, balanced_df], ignore_index=True)
+        equivalent_rows = class_counts.max() * len(class_counts)
+        print(f"Data training: {len(data)} baris (setara {equivalent_rows} baris jika diseimbangkan "
+              f"dengan duplikasi, {1 - len(data) / equivalent_rows:.0%} lebih kecil)")
         
         return data
+    
+    def _create_search(self, pipeline, param_grid, corpus_cache=None):
+        """
+        Membuat objek pencarian hyperparameter sesuai search_strategy
+        
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline yang akan dioptimasi
+        param_grid : dict
+            Grid parameter yang dicoba
+        corpus_cache : CorpusCache or None
+            Cache matriks fitur fold untuk strategi 'grid'
+        
+        Returns
+        -------
+        CachedGridSearchCV or HalvingGridSearchCV
+            Objek pencarian yang belum di-fit
+        """
+        if self.search_strategy == 'grid':
+            # Hasil sama dengan GridSearchCV(cv=5, scoring='accuracy'), tetapi TF-IDF hanya
+            # dilatih sekali per fold untuk setiap kombinasi parameter TF-IDF
+            return CachedGridSearchCV(
+                pipeline,
+                param_grid,
+                cv=5,  # 5-fold cross-validation
+                n_jobs=-1,  # Gunakan semua core CPU
+                verbose=1,
+                matrix_cache=corpus_cache
+            )
+        
+        if self.search_strategy == 'halving':
+            # Successive halving: semua kandidat dicoba dengan sebagian data, hanya
+            # kandidat terbaik yang dilanjutkan dengan data lebih banyak
+            from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+            from sklearn.model_selection import HalvingGridSearchCV
+            return HalvingGridSearchCV(
+                pipeline,
+                param_grid,
+                cv=5,
+                scoring='accuracy',
+                factor=3,
+                random_state=42,
+                n_jobs=-1,
+                verbose=1
+            )
+        
+        raise ValueError(f"search_strategy tidak dikenal: {self.search_strategy} (gunakan 'grid' atau 'halving')")
+    
+    def _iter_augmented_rows(self, data):
+        """
+        Menghasilkan baris augmentasi berupa kombinasi dua gejala dari penyakit yang sama.
+        Jumlah kombinasi per penyakit dibatasi max_pairs_per_class, dan teks terproses
+        disusun dari token baris yang sudah dipreprocessing ("dan" adalah stopword)
+        sehingga kombinasi tidak perlu dipreprocessing ulang.
+        
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            DataFrame dengan kolom 'symptoms', 'disease' dan 'processed_symptoms'
+        
+        Yields
+        ------
+        tuple
+            (symptoms, disease, processed_symptoms)
+        """
+        for disease in data['disease'].unique():
+            disease_data = data[data['disease'] == disease]
+            symptoms_list = disease_data['symptoms'].tolist()
+            processed_list = disease_data['processed_symptoms'].tolist()
+            
+            pairs = iter_pair_indices(
+                len(symptoms_list),
+                self.max_pairs_per_class,
+                seed=f"{self.augmentation_seed}:{disease}"
+            )
+            for i, j in pairs:
+                yield (
+                    f"{symptoms_list[i]} dan {symptoms_list[j]}",
+                    disease,
+                    ' '.join(filter(None, (processed_list[i], processed_list[j])))
+                )
+    
     def train(self):
         """
         Melatih model klasifikasi penyakit dengan optimasi parameter
@@ -425,8 +657,9 @@ class DiseaseClassifier:
         # Muat data
         data = self.load_data()
         
-        # Preprocess data
-        data = self.preprocess_training_data(data)
+        # Preprocess data (teks yang sudah pernah diproses diambil dari cache)
+        corpus_cache = CorpusCache(self.corpus_cache_dir) if self.corpus_cache_dir else None
+        data = self.preprocess_training_data(data, corpus_cache)
         
         # Encode label untuk kompatibilitas dengan cross-validation
         y = self.label_encoder.fit_transform(data['disease'])
@@ -440,31 +673,30 @@ class DiseaseClassifier:
             stratify=y  # Pastikan distribusi kelas seimbang
         )
         
-        # Hyperparameter tuning dengan GridSearchCV
+        # Hyperparameter tuning
         param_grid = {
             'tfidf__max_features': [5000, 10000],
             'tfidf__ngram_range': [(1, 2), (1, 3)],
             'clf__alpha': [0.1, 0.3, 0.5, 0.7, 1.0]
         }
         
-        grid_search = GridSearchCV(
-            self.pipeline,
-            param_grid,
-            cv=5,  # 5-fold cross-validation
-            scoring='accuracy',
-            n_jobs=-1,  # Gunakan semua core CPU
-            verbose=1
-        )
+        search = self._create_search(self.pipeline, param_grid, corpus_cache)
         
         print("Melakukan optimasi parameter model...")
-        grid_search.fit(X_train, y_train)
+        search_start = time.perf_counter()
+        search.fit(X_train, y_train)
+        print(f"Optimasi parameter selesai dalam {time.perf_counter() - search_start:.2f} detik "
+              f"({len(X_train)} baris training, strategi {self.search_strategy})")
+        
+        if corpus_cache is not None:
+            corpus_cache.save()
         
-        # Gunakan parameter terbaik dari grid search
-        best_params = grid_search.best_params_
+        # Gunakan parameter terbaik dari pencarian
+        best_params = search.best_params_
         print(f"Parameter terbaik: {best_params}")
         
         # Update pipeline dengan parameter terbaik
-        self.pipeline = grid_search.best_estimator_
+        self.pipeline = search.best_estimator_
         
         # Evaluasi model
         y_pred = self.pipeline.predict(X_test)
@@ -488,47 +720,301 @@ class DiseaseClassifier:
         # Latih kembali pada seluruh dataset
         self.pipeline.fit(X, y)
         
-        # Hitung confidence untuk setiap kelas dengan k-fold cross-validation
-        from sklearn.model_selection import KFold
+        # Hitung confidence untuk setiap kelas dengan k-fold cross-validation.
+        # Probabilitas out-of-fold dihitung paralel pada salinan pipeline (clone),
+        # sehingga self.pipeline tetap model yang dilatih dengan seluruh data
         kf = KFold(n_splits=5, shuffle=True, random_state=42)
+        oof_probas = cross_val_predict(
+            clone(self.pipeline), X, y,
+            cv=kf,
+            method='predict_proba',
+            n_jobs=-1
+        )
         
-        # Dictionary untuk menyimpan probabilitas per kelas
-        class_probas = {disease: [] for disease in self.label_encoder.classes_}
+        # Rata-rata probabilitas kelas yang benar per kelas (vektorisasi dengan bincount)
+        n_classes = len(self.label_encoder.classes_)
+        true_probas = oof_probas[np.arange(len(y)), y]
+        class_counts = np.bincount(y, minlength=n_classes)
+        class_sums = np.bincount(y, weights=true_probas, minlength=n_classes)
         
-        for train_idx, val_idx in kf.split(X):
-            X_cv_train, X_cv_val = X.iloc[train_idx], X.iloc[val_idx]
-            y_cv_train, y_cv_val = y[train_idx], y[val_idx]
-            
-            # Latih model pada fold ini
-            self.pipeline.fit(X_cv_train, y_cv_train)
-            
-            # Prediksi probabilitas untuk validation set
-            fold_probas = self.pipeline.predict_proba(X_cv_val)
-            
-            # Kelompokkan probabilitas berdasarkan kelas yang sebenarnya
-            for i, idx in enumerate(val_idx):
-                true_class = y[idx]
-                true_class_name = self.label_encoder.inverse_transform([true_class])[0]
-                class_probas[true_class_name].append(fold_probas[i][true_class])
-        
-        # Hitung rata-rata confidence untuk setiap kelas
-        for disease, probas in class_probas.items():
-            if probas:  # Jika ada data untuk kelas ini
-                self.model_confidence[disease] = np.mean(probas)
+        for class_idx, disease in enumerate(self.label_encoder.classes_):
+            if class_counts[class_idx]:  # Jika ada data untuk kelas ini
+                self.model_confidence[disease] = class_sums[class_idx] / class_counts[class_idx]
             else:
                 self.model_confidence[disease] = 0.7  # Default jika tidak ada data
         
+        # Pipeline berubah, model serving harus dikompilasi ulang dan mode inkremental berakhir
+        self._compiled_model = None
+        self._incremental_model = None
+        
         print("Model berhasil dilatih!")
         
         return accuracy
+    
+    def _incremental_params(self):
+        """
+        Parameter n-gram, sublinear_tf dan alpha untuk IncrementalModel, diambil dari
+        model yang sedang dipakai (dilatih atau dimuat dari artefak). Pipeline yang
+        belum dilatih hanya berisi nilai bawaan, sehingga dipakai sebagai cadangan
+        jika belum ada model atau artefak tidak menyimpan nilainya.
+        
+        Returns
+        -------
+        dict
+            Argumen ngram_range, sublinear_tf dan alpha untuk IncrementalModel
+        """
+        pipeline_params = self.pipeline.get_params()
+        params = {
+            'ngram_range': pipeline_params['tfidf__ngram_range'],
+            'sublinear_tf': pipeline_params['tfidf__sublinear_tf'],
+            'alpha': pipeline_params['clf__alpha']
+        }
+        compiled_model = self._get_compiled_model() if self.is_trained() else None
+        if compiled_model is not None:
+            featurizer = compiled_model.featurizer
+            params['ngram_range'] = (featurizer.min_n, featurizer.max_n)
+            params['sublinear_tf'] = featurizer.sublinear_tf
+            if compiled_model.alpha is not None:
+                params['alpha'] = compiled_model.alpha
+        return params
+    
+    def start_incremental(self):
+        """
+        Mengaktifkan mode update inkremental: model hashing + ComplementNB dilatih
+        sekali dari data training (dengan n-gram, sublinear_tf dan alpha model
+        yang sedang dipakai, lihat _incremental_params) lalu dipakai untuk
+        serving. Setelah itu contoh baru dapat ditambahkan dengan partial_fit
+        tanpa train() penuh.
+        """
+        start = time.perf_counter()
+        data = self.preprocess_training_data(self.load_data())
+        self.label_encoder.fit(data['disease'])
+        
+        model = IncrementalModel(
+            self.label_encoder.classes_,
+            n_features=self.incremental_n_features,
+            **self._incremental_params()
+        )
+        # Bobot penyeimbang kelas seperti BalancedComplementNB
+        model.fit(
+            data['processed_symptoms'].tolist(),
+            data['disease'].tolist(),
+            sample_weight=class_balance_weights(data['disease'])
+        )
+        
+        self._incremental_model = model
+        self._compiled_model = model.compile(GEJALA_VARIATIONS)
+        self.pending_examples = []
+        print(f"Mode inkremental aktif ({len(data)} baris, {self.incremental_n_features} fitur hashing) "
+              f"dalam {time.perf_counter() - start:.2f} detik")
+    
+    def partial_fit(self, symptoms, diseases, refresh_idf=False):
+        """
+        Menambahkan contoh berlabel baru ke model yang sedang dipakai
+        
+        Parameters
+        ----------
+        symptoms : list of str
+            Teks gejala mentah
+        diseases : list of str
+            Nama penyakit untuk setiap teks (penyakit baru memerlukan rebuild)
+        refresh_idf : bool
+            Hitung ulang bobot idf dari seluruh dokumen setelah update
+        
+        Returns
+        -------
+        float
+            Waktu update dalam detik
+        
+        Raises
+        ------
+        ValueError
+            Jika jumlah teks dan label berbeda, atau ada penyakit yang belum dikenal
+        """
+        symptoms = list(symptoms)
+        diseases = list(diseases)
+        if len(symptoms) != len(diseases):
+            raise ValueError("Jumlah teks gejala dan label penyakit harus sama")
+        
+        if self._incremental_model is None:
+            self.start_incremental()
+        
+        start = time.perf_counter()
+        model = self._incremental_model
+        # Bobot penyeimbang kelas seperti saat model dilatih dengan start_incremental/train_streaming
+        model.partial_fit(preprocess_texts(symptoms), diseases, sample_weight=model.class_balance_weights(diseases))
+        if refresh_idf:
+            model.refresh_idf()
+        
+        # Ganti model serving sekaligus; prediksi yang sedang berjalan tetap memakai model lama
+        self._compiled_model = model.compile(GEJALA_VARIATIONS)
+        
+        for symptom, disease in zip(symptoms, diseases):
+            self.diseases_info.setdefault(disease, []).append(symptom)
+        self.pending_examples.extend(zip(symptoms, diseases))
+        
+        elapsed = time.perf_counter() - start
+        print(f"Update inkremental: {len(symptoms)} contoh dalam {elapsed * 1000:.1f} ms")
+        return elapsed
+    
+    def rebuild(self):
+        """
+        Rebuild penuh: contoh dari update inkremental ditambahkan ke file data
+        training, lalu seluruh pipeline (augmentasi, pencarian parameter,
+        evaluasi) dilatih ulang dengan train()
+        
+        Returns
+        -------
+        float
+            Akurasi model hasil train()
+        """
+        if self.pending_examples:
+            if not os.path.exists(self.data_path):
+                # CSV adalah sumber data training: buat dulu (dengan header) dari data yang ada,
+                # yaitu isi file Parquet atau data contoh, agar tidak hanya berisi contoh baru
+                data = self.load_data()
+                if not os.path.exists(self.data_path):
+                    data[['symptoms', 'disease']].to_csv(self.data_path, index=False)
+            pending = pd.DataFrame(self.pending_examples, columns=['symptoms', 'disease'])
+            pending.to_csv(self.data_path, mode='a', header=False, index=False)
+            print(f"{len(pending)} contoh baru ditambahkan ke {self.data_path}")
+            self.pending_examples = []
+        
+        return self.train()
+    
+    def _iter_chunks(self, columns):
+        """Membaca file data training per potongan streaming_chunksize baris"""
+        return pd.read_csv(self.data_path, usecols=columns, chunksize=self.streaming_chunksize)
+    
+    def train_streaming(self):
+        """
+        Melatih model dari file data training yang lebih besar dari memori.
+        CSV dibaca per potongan sehingga memori puncak hanya bergantung pada
+        ukuran potongan dan jumlah fitur hashing, bukan ukuran korpus:
+        
+        1. Hitung jumlah baris per penyakit (hanya kolom 'disease')
+        2. Preprocessing (satu process pool untuk seluruh korpus), hitung
+           frekuensi dokumen untuk idf, dan simpan matriks frekuensi setiap
+           potongan ke direktori sementara di disk
+        3. Tambahkan statistik Naive Bayes baris training dengan partial_fit
+        4. Evaluasi baris validasi dengan model hasil tahap 3, lalu tambahkan juga ke model
+        
+        Tahap 3 dan 4 membaca matriks frekuensi hasil tahap 2, sehingga setiap
+        baris hanya dipreprocessing dan dianalisis sekali.
+        
+        Augmentasi kombinasi gejala dan pencarian parameter tidak dilakukan;
+        n-gram, sublinear_tf dan alpha diambil dari model yang sedang dipakai
+        (lihat _incremental_params). Model yang dihasilkan adalah model
+        inkremental, sehingga partial_fit dapat langsung dipakai setelahnya.
+        
+        Returns
+        -------
+        float
+            Akurasi pada baris validasi
+        """
+        start = time.perf_counter()
+        
+        # Tahap 1: label dan bobot penyeimbang kelas dari jumlah baris seluruh korpus
+        class_counts = pd.Series(dtype=np.int64)
+        for chunk in self._iter_chunks(['disease']):
+            class_counts = class_counts.add(chunk['disease'].value_counts(), fill_value=0)
+        class_counts = class_counts.sort_index()
+        class_weights = class_counts.max() / class_counts
+        self.label_encoder.classes_ = class_counts.index.to_numpy()
+        
+        model = IncrementalModel(
+            self.label_encoder.classes_,
+            n_features=self.incremental_n_features,
+            **self._incremental_params()
+        )
+        
+        with tempfile.TemporaryDirectory(prefix='tanyasehat-streaming-', dir=self.streaming_spill_dir) as spill_dir:
+            # Tahap 2: frekuensi dokumen seluruh korpus, contoh gejala untuk chatbot, dan
+            # matriks frekuensi per potongan (n-gram hashing tidak bergantung pada idf)
+            self.diseases_info = {}
+            spilled = []
+            n_jobs = (os.cpu_count() or 1) if self.n_jobs is not None and self.n_jobs < 0 else (self.n_jobs or 1)
+            executor = ProcessPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+            try:
+                row_start = 0
+                for chunk in self._iter_chunks(['symptoms', 'disease']):
+                    symptoms = chunk['symptoms'].fillna('').tolist()
+                    diseases = chunk['disease'].tolist()
+                    
+                    # Hanya path dan posisi baris yang disimpan di memori, isi potongan di disk
+                    counts = model.count(preprocess_texts(symptoms, executor=executor))
+                    chunk_path = os.path.join(spill_dir, f"chunk-{len(spilled):06d}")
+                    save_npz(f"{chunk_path}.npz", counts, compressed=False)
+                    np.save(f"{chunk_path}.npy", self.label_encoder.transform(diseases).astype(np.int32))
+                    spilled.append((chunk_path, row_start))
+                    row_start += len(chunk)
+                    
+                    for symptom, disease in zip(symptoms, diseases):
+                        examples = self.diseases_info.setdefault(disease, [])
+                        if len(examples) < self.streaming_examples_per_disease:
+                            examples.append(symptom)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            model.refresh_idf()
+            
+            def iter_spilled(validation):
+                """Potongan (matriks frekuensi, penyakit) untuk baris training atau validasi"""
+                for chunk_path, row_start in spilled:
+                    y = np.load(f"{chunk_path}.npy")
+                    rows = (np.arange(row_start, row_start + len(y)) % self.streaming_validation_every == 0) == validation
+                    if rows.any():
+                        yield load_npz(f"{chunk_path}.npz").tocsr()[rows], self.label_encoder.classes_[y[rows]]
+            
+            # Tahap 3: statistik Naive Bayes dari baris training
+            for counts, diseases in iter_spilled(validation=False):
+                model.partial_fit_counts(counts, diseases, sample_weight=class_weights[diseases].to_numpy())
+            
+            # Tahap 4: evaluasi baris validasi dengan salinan model training, lalu ikut dilatihkan
+            eval_model = model.compile(())
+            n_classes = len(self.label_encoder.classes_)
+            correct = 0
+            total = 0
+            class_totals = np.zeros(n_classes)
+            class_sums = np.zeros(n_classes)
+            for counts, diseases in iter_spilled(validation=True):
+                y = self.label_encoder.transform(diseases)
+                probas = eval_model.predict_proba_counts(counts)
+                correct += int((probas.argmax(axis=1) == y).sum())
+                total += len(y)
+                class_totals += np.bincount(y, minlength=n_classes)
+                class_sums += np.bincount(y, weights=probas[np.arange(len(y)), y], minlength=n_classes)
+                
+                model.partial_fit_counts(counts, diseases, sample_weight=class_weights[diseases].to_numpy())
+        
+        accuracy = correct / total if total else 0.0
+        self.model_confidence = {
+            disease: class_sums[i] / class_totals[i] if class_totals[i] else 0.7
+            for i, disease in enumerate(self.label_encoder.classes_)
+        }
+        
+        self._incremental_model = model
+        self._compiled_model = model.compile(GEJALA_VARIATIONS)
+        self.pending_examples = []
+        
+        print(f"Model streaming dilatih dari {model.n_documents} baris dalam {time.perf_counter() - start:.2f} detik")
+        print(f"Akurasi validasi ({total} baris): {accuracy:.2f}")
+        
+        return accuracy
+    
+    def is_trained(self):
+        """Mengecek apakah model sudah dilatih atau dimuat dari artefak"""
+        return bool(self._compiled_model) or hasattr(self.pipeline, 'classes_')
+    
     def predict(self, text):
         """
         Memprediksi penyakit berdasarkan teks gejala dengan pendekatan ensemble
         
         Parameters
         ----------
-        text : str
-            Teks gejala yang akan diprediksi penyakitnya
+        text : str or PreprocessedDocument
+            Teks gejala mentah, atau dokumen hasil preprocess_document agar
+            teks tidak diproses ulang
         
         Returns
         -------
@@ -536,53 +1022,118 @@ class DiseaseClassifier:
             (nama_penyakit, confidence, top_diseases)
         """
         # Pastikan model sudah dilatih
-        if not hasattr(self.pipeline, 'classes_'):
+        if not self.is_trained():
             self.train()
         
-        # Preprocessed text
-        processed_text = preprocess_text(text)
-        
-        # Lakukan augmentasi data input dengan sinonim/variasi kata
-        augmented_inputs = [processed_text]
+        # Preprocessing hanya dilakukan jika input masih berupa teks mentah
+        if not isinstance(text, PreprocessedDocument):
+            text = preprocess_document(text)
+        processed_text = text.text
         
-        # Buat beberapa variasi input dengan mengganti kata-kata tertentu
-        gejala_variations = {
-            'sakit': ['nyeri', 'ngilu', 'perih', 'tidak nyaman'],
-            'kepala': ['tengkorak', 'pala', 'kepala bagian'],
-            'perut': ['lambung', 'abdomen', 'bagian perut', 'perut bagian'],
-            'demam': ['panas', 'temperatur tinggi', 'badan panas', 'suhu tubuh'],
-            'batuk': ['batuk-batuk', 'batuk kering', 'batuk tidak berhenti'],
-            'pusing': ['berkunang', 'vertigo', 'kepala berputar', 'pandangan berputar']
-        }
+        # Jalur cepat: tanpa token yang dikenal semua skor hanya prior kelas, tidak perlu dinilai
+        compiled_model = self._get_compiled_model()
+        if compiled_model is not None and not compiled_model.has_known_features(processed_text):
+            return Prediction(UNKNOWN_DISEASE, 0.0, [], reason=REASON_NO_KNOWN_FEATURES)
         
-        # Cari dan ganti kata-kata pada teks dengan sinonimnya
-        for kata, variasi in gejala_variations.items():
-            if kata in processed_text:
-                for var in variasi:
-                    new_text = processed_text.replace(kata, var)
-                    augmented_inputs.append(new_text)
-        
-        # Prediksi untuk semua variasi input
-        probas_list = []
-        for aug_text in augmented_inputs:
-            # Transform label enkoder yang sudah ditraing
-            predicted_encoded = self.pipeline.predict([aug_text])[0]
-            probas = self.pipeline.predict_proba([aug_text])[0]
-            probas_list.append(probas)
+        # Prediksi teks beserta variasi sinonimnya (augmentasi data input)
+        if compiled_model is not None:
+            # Skor variasi dihitung dari vektor dasar ditambah delta fitur yang berubah
+            probas_list = compiled_model.predict_proba_variants(processed_text)
+        else:
+            # Prediksi semua variasi input sekaligus: satu transformasi TF-IDF dan satu predict_proba
+            probas_list = self.pipeline.predict_proba(augment_text(processed_text))
         
         # Gabungkan hasil prediksi dari semua variasi input (ensemble)
-        avg_probas = np.mean(probas_list, axis=0)
+        return self._decide(np.mean(probas_list, axis=0))
+    
+    def predict_batch(self, texts):
+        """
+        Memprediksi penyakit untuk banyak teks gejala sekaligus. Semua teks
+        dipreprocessing bersama, lalu seluruh variasi input dari semua teks
+        ditumpuk menjadi satu matriks dan dinilai dengan satu predict_proba.
         
-        # Dapatkan kelas dengan probabilitas tertinggi
-        max_prob_idx = np.argmax(avg_probas)
+        Parameters
+        ----------
+        texts : list of str or PreprocessedDocument
+            Teks gejala mentah atau dokumen hasil preprocess_document
         
-        # Decode kembali ke nama penyakit
-        predicted_disease = self.label_encoder.inverse_transform([max_prob_idx])[0]
-        max_proba = avg_probas[max_prob_idx]
+        Returns
+        -------
+        list of tuple
+            (nama_penyakit, confidence, top_diseases) untuk setiap teks, dengan urutan yang sama
+        """
+        # Pastikan model sudah dilatih
+        if not self.is_trained():
+            self.train()
         
+        texts = list(texts)
+        if not texts:
+            return []
+        
+        # Preprocessing bersama untuk teks mentah (teks yang sama hanya diproses sekali)
+        raw_positions = [i for i, text in enumerate(texts) if not isinstance(text, PreprocessedDocument)]
+        processed_texts = [text.text if isinstance(text, PreprocessedDocument) else None for text in texts]
+        for i, processed in zip(raw_positions, preprocess_texts([texts[i] for i in raw_positions])):
+            processed_texts[i] = processed
+        
+        # Teks tanpa token yang dikenal langsung dijawab lewat jalur cepat seperti predict
+        compiled_model = self._get_compiled_model()
+        results = [None] * len(texts)
+        scored_positions = []
+        for i, processed_text in enumerate(processed_texts):
+            if compiled_model is not None and not compiled_model.has_known_features(processed_text):
+                results[i] = Prediction(UNKNOWN_DISEASE, 0.0, [], reason=REASON_NO_KNOWN_FEATURES)
+            else:
+                scored_positions.append(i)
+        if not scored_positions:
+            return results
+        
+        # Tumpuk semua variasi input, catat batas baris milik setiap teks
+        augmented_inputs = []
+        offsets = [0]
+        for i in scored_positions:
+            augmented_inputs.extend(augment_text(processed_texts[i]))
+            offsets.append(len(augmented_inputs))
+        
+        # Satu transformasi TF-IDF dan satu predict_proba untuk seluruh batch
+        if compiled_model is not None:
+            probas = compiled_model.predict_proba(augmented_inputs)
+        else:
+            probas = self.pipeline.predict_proba(augmented_inputs)
+        
+        # Rata-rata probabilitas variasi per teks (ensemble)
+        for i, start, end in zip(scored_positions, offsets[:-1], offsets[1:]):
+            results[i] = self._decide(probas[start:end].mean(axis=0))
+        return results
+    
+    def _decide(self, avg_probas):
+        """
+        Menentukan prediksi akhir dari rata-rata probabilitas semua variasi input
+        
+        Parameters
+        ----------
+        avg_probas : numpy.ndarray
+            Rata-rata probabilitas per kelas
+        
+        Returns
+        -------
+        tuple
+            (nama_penyakit, confidence, top_diseases)
+        """
         # Dapatkan top 3 penyakit dengan probabilitas tertinggi
-        top_indices = avg_probas.argsort()[-3:][::-1]
-        top_diseases = [(self.label_encoder.inverse_transform([i])[0], avg_probas[i]) for i in top_indices]
+        compiled_model = self._get_compiled_model()
+        if compiled_model is not None:
+            labels = compiled_model.labels
+            top_indices = compiled_model.top_k(avg_probas, 3)
+        else:
+            labels = self.label_encoder.classes_
+            top_indices = avg_probas.argsort()[-3:][::-1]
+        top_diseases = [(labels[i], avg_probas[i]) for i in top_indices]
+        
+        # Kelas dengan probabilitas tertinggi (indeks pertama jika ada nilai yang sama), langsung dari array label
+        max_prob_idx = np.argmax(avg_probas)
+        predicted_disease = labels[max_prob_idx]
+        max_proba = avg_probas[max_prob_idx]
         
         # Penanganan kasus khusus:
         # Jika confidence terlalu rendah, kita ragu dengan prediksi
@@ -595,60 +1146,92 @@ class DiseaseClassifier:
             
             # Jika probabilitas terlalu rendah (< 0.45), kita anggap sebagai "Tidak diketahui"
             if max_proba < 0.45:
-                return "Tidak diketahui", max_proba, top_diseases
+                return UNKNOWN_DISEASE, max_proba, top_diseases
           # Jika confidence cukup tinggi, kembalikan prediksi utama
         return predicted_disease, max_proba, top_diseases
-    def save_model(self, model_filename='disease_classifier.joblib'):
+    
+    def _get_compiled_model(self):
+        """
+        Mengompilasi (sekali) pipeline yang sudah dilatih menjadi CompiledModel
+        
+        Returns
+        -------
+        CompiledModel or None
+            Model ringkas, atau None jika konfigurasi pipeline tidak didukung
+            sehingga prediksi memakai pipeline secara langsung
+        """
+        if self._compiled_model is None:
+            try:
+                self._compiled_model = CompiledModel.from_pipeline(
+                    self.pipeline, self.label_encoder.classes_, GEJALA_VARIATIONS
+                )
+            except (ValueError, KeyError, AttributeError, IndexError) as e:
+                print(f"Model tidak dapat dikompilasi, memakai pipeline langsung: {e}")
+                self._compiled_model = False
+        return self._compiled_model or None
+    
+    def _resolve_model_path(self, model_filename):
+        """Path lengkap model: path yang diberikan, atau nama file di folder models"""
+        if os.path.dirname(model_filename):
+            return model_filename  # Gunakan path yang diberikan
+        models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
+        return os.path.join(models_dir, model_filename)
+    
+    def save_model(self, model_filename='disease_classifier'):
         """
-        Menyimpan model ke file dalam folder models
+        Menyimpan model sebagai artefak terkompilasi (direktori berisi manifest.json
+        dan buffer .npy) dalam folder models
         
         Parameters
         ----------
         model_filename : str
-            Nama file model (akan disimpan dalam folder models)
+            Nama direktori artefak (akan disimpan dalam folder models) atau path lengkap
         """
-        # Buat path model di folder models
-        models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
-        model_path = os.path.join(models_dir, model_filename)
+        model_path = self._resolve_model_path(model_filename)
         
         # Buat direktori models jika belum ada
-        os.makedirs(models_dir, exist_ok=True)
-        
-        # Simpan model dan label encoder
-        model_data = {
-            'pipeline': self.pipeline,
-            'label_encoder': self.label_encoder,
-            'diseases_info': self.diseases_info,
-            'model_confidence': self.model_confidence
-        }
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+        
+        compiled_model = self._get_compiled_model()
+        if compiled_model is None:
+            raise ValueError("Model tidak dapat dikompilasi untuk disimpan sebagai artefak")
         
-        # Simpan model
-        joblib.dump(model_data, model_path)
+        # Simpan model beserta informasi penyakit dan confidence
+        save_artifact(
+            compiled_model,
+            model_path,
+            diseases_info=self.diseases_info,
+            model_confidence=self.model_confidence
+        )
         print(f"Model berhasil disimpan ke {model_path}")
         
         return model_path  # Return path agar bisa digunakan untuk load model
     
-    def load_model(self, model_filename='disease_classifier.joblib'):
+    def load_model(self, model_filename='disease_classifier'):
         """
-        Memuat model dari file dalam folder models
+        Memuat model dari folder models. Artefak terkompilasi dimuat dengan
+        memory-map; file .joblib format lama tetap didukung.
         
         Parameters
         ----------
         model_filename : str
-            Nama file model (akan dicari dalam folder models)
+            Nama artefak atau file model (akan dicari dalam folder models) atau path lengkap
         """
-        # Cek apakah model_filename adalah path lengkap atau hanya nama file
-        if os.path.dirname(model_filename):
-            model_path = model_filename  # Gunakan path yang diberikan
-        else:
-            # Konstruksi path ke file model di folder models
-            models_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
-            model_path = os.path.join(models_dir, model_filename)
+        model_path = self._resolve_model_path(model_filename)
         
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"File model tidak ditemukan di {model_path}")
-            
-        # Load model data yang sudah disimpan
+        
+        if is_artifact(model_path):
+            # Array model di-mmap sehingga semua worker berbagi satu salinan fisik
+            self._compiled_model, manifest = load_artifact(model_path, GEJALA_VARIATIONS)
+            self.label_encoder.classes_ = self._compiled_model.labels
+            self.diseases_info = manifest['diseases_info']
+            self.model_confidence = manifest['model_confidence']
+            print(f"Model berhasil dimuat dari {model_path}")
+            return
+        
+        # Load model data format lama (pickle joblib)
         model_data = joblib.load(model_path)
         
         # Extract komponen model
@@ -662,6 +1245,8 @@ class DiseaseClassifier:
         if 'model_confidence' in model_data:
             self.model_confidence = model_data['model_confidence']
             
+        self._compiled_model = None
+        
         print(f"Model berhasil dimuat dari {model_path}")
         
         # Untuk kompatibilitas dengan model lama, muat data jika diseases_info kosong
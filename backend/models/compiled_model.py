@@ -0,0 +1,256 @@
+"""
+Model inferensi ringkas (NumPy) hasil kompilasi pipeline TF-IDF + ComplementNB
+"""
+import numpy as np
+from scipy.special import logsumexp
+from sklearn.naive_bayes import ComplementNB
+
+from models.featurizer import TfidfFeaturizer
+
+class CompiledModel:
+    """
+    Bentuk ringkas model terlatih untuk serving: lookup vocabulary, vektor idf,
+    matriks log-probabilitas fitur per kelas dan array label biasa. Inferensi
+    cukup satu perkalian matriks sparse tanpa validasi input dan objek sklearn.
+
+    Variasi sinonim dinilai tanpa memvektorisasi ulang setiap variasi:
+    log-likelihood ComplementNB linear terhadap vektor fitur, sehingga skor
+    variasi diperoleh dari skor dokumen dasar ditambah selisih (delta) pada
+    fitur-fitur yang berubah saja.
+    """
+
+    def __init__(self, featurizer, feature_log_prob, labels, variations, alpha=None):
+        self.featurizer = featurizer
+        # Smoothing classifier asal, disimpan di artefak agar mode inkremental memakai nilai yang sama
+        self.alpha = alpha
+        self.feature_log_prob = np.asarray(feature_log_prob, dtype=np.float64)
+        self.labels = np.asarray(labels)
+        # Token hasil analisis setiap variasi dihitung sekali saat model dibangun
+        self.variations = tuple(
+            (kata, tuple((var, featurizer.analyze(var)) for var in variasi))
+            for kata, variasi in variations
+        )
+        # Token vocabulary untuk mendeteksi input tanpa fitur (None jika tidak dapat ditentukan)
+        self.known_tokens = featurizer.known_tokens()
+
+    @classmethod
+    def from_pipeline(cls, pipeline, labels, variations):
+        """
+        Mengompilasi pipeline TF-IDF + ComplementNB yang sudah dilatih
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline dengan langkah 'tfidf' dan 'clf'
+        labels : array-like
+            Nama penyakit untuk setiap kelas (urutan LabelEncoder.classes_)
+        variations : iterable of tuple
+            Pasangan (kata, variasi) seperti GEJALA_VARIATIONS
+
+        Returns
+        -------
+        CompiledModel
+            Model hasil kompilasi
+
+        Raises
+        ------
+        ValueError
+            Jika pipeline tidak dapat dikompilasi
+        """
+        clf = pipeline.named_steps['clf']
+        # Hanya ComplementNB dengan lebih dari satu kelas yang log-likelihood-nya murni linear
+        if not isinstance(clf, ComplementNB) or len(clf.classes_) < 2:
+            raise ValueError("Classifier tidak didukung oleh CompiledModel")
+
+        featurizer = TfidfFeaturizer.from_vectorizer(pipeline.named_steps['tfidf'])
+        # Kelas pada classifier adalah indeks hasil LabelEncoder
+        labels = np.asarray(labels)[clf.classes_]
+        return cls(featurizer, clf.feature_log_prob_, labels, variations, alpha=clf.alpha)
+
+    def has_known_features(self, processed_text):
+        """
+        Mengecek apakah teks (atau salah satu variasi sinonimnya) mungkin memiliki
+        fitur. Jika False, semua vektor fitur dipastikan nol sehingga vektorisasi
+        dan penilaian dapat dilewati.
+
+        Parameters
+        ----------
+        processed_text : str
+            Teks gejala yang sudah dipreprocessing
+
+        Returns
+        -------
+        bool
+            False hanya jika tidak ada token yang dikenal dan tidak ada kata yang
+            memicu variasi sinonim
+        """
+        if self.known_tokens is None:
+            return True
+        if any(kata in processed_text for kata, _ in self.variations):
+            return True
+        return not self.known_tokens.isdisjoint(self.featurizer.analyze(processed_text))
+
+    def _probas_from_jll(self, jll):
+        """Probabilitas kelas dari joint log-likelihood, sama seperti ComplementNB.predict_proba"""
+        return np.exp(jll - logsumexp(jll, axis=1)[:, np.newaxis])
+
+    def predict_proba(self, texts):
+        """
+        Menghitung probabilitas kelas untuk kumpulan teks
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+
+        Returns
+        -------
+        numpy.ndarray
+            Matriks probabilitas (jumlah_teks x jumlah_kelas)
+        """
+        X = self.featurizer.transform(texts)
+        return self._probas_from_jll(np.asarray(X @ self.feature_log_prob.T))
+
+    def predict_proba_counts(self, counts):
+        """
+        Menghitung probabilitas kelas dari matriks frekuensi yang sudah dihitung,
+        tanpa menganalisis ulang teks
+
+        Parameters
+        ----------
+        counts : scipy.sparse.csr_matrix
+            Hasil featurizer.count_matrix
+
+        Returns
+        -------
+        numpy.ndarray
+            Matriks probabilitas (jumlah_baris x jumlah_kelas)
+        """
+        X = self.featurizer.weight_matrix(counts)
+        return self._probas_from_jll(np.asarray(X @ self.feature_log_prob.T))
+
+    def top_k(self, probas, k=3):
+        """
+        Mengambil k kelas dengan probabilitas tertinggi
+
+        Parameters
+        ----------
+        probas : numpy.ndarray
+            Probabilitas per kelas untuk satu teks
+        k : int
+            Jumlah kelas yang diambil
+
+        Returns
+        -------
+        numpy.ndarray
+            Indeks kelas, urut dari probabilitas tertinggi
+        """
+        k = min(k, len(probas))
+        top = np.argpartition(probas, len(probas) - k)[len(probas) - k:]
+        # Urutkan menurun; nilai yang sama diurutkan dari indeks terbesar seperti argsort()[::-1]
+        return top[np.lexsort((top, probas[top]))[::-1]]
+
+    def _touching_starts(self, n_tokens, marked):
+        """Posisi awal n-gram (per n) yang mencakup salah satu posisi yang ditandai"""
+        starts = {}
+        for n in range(self.featurizer.min_n, self.featurizer.max_n + 1):
+            positions = set()
+            for p in marked:
+                positions.update(range(max(0, p - n + 1), min(p, n_tokens - n) + 1))
+            starts[n] = positions
+        return starts
+
+    def predict_proba_variants(self, processed_text):
+        """
+        Menghitung probabilitas kelas untuk teks dan semua variasi sinonimnya
+
+        Parameters
+        ----------
+        processed_text : str
+            Teks gejala yang sudah dipreprocessing
+
+        Returns
+        -------
+        numpy.ndarray
+            Matriks probabilitas (jumlah_variasi x jumlah_kelas) dengan urutan
+            yang sama seperti augment_text
+        """
+        featurizer = self.featurizer
+        words = processed_text.split()
+
+        # Token analyzer per kata, beserta rentang posisinya di dokumen
+        segments = [featurizer.analyze(word) for word in words]
+        tokens = [token for segment in segments for token in segment]
+        spans = []
+        position = 0
+        for segment in segments:
+            spans.append((position, position + len(segment)))
+            position += len(segment)
+
+        # Vektor dasar (belum dinormalisasi) dan skor log-likelihood dasar
+        base_counts = featurizer.ngram_counts(tokens)
+        features = np.fromiter(base_counts.keys(), dtype=np.intp, count=len(base_counts))
+        weights = np.array([featurizer.weight(f, c) for f, c in base_counts.items()])
+        base_scores = self.feature_log_prob[:, features] @ weights
+        base_norm_sq = float(weights @ weights)
+
+        scores = [base_scores]
+        norms_sq = [base_norm_sq]
+        base_nnz = len(base_counts)
+
+        for kata, variasi in self.variations:
+            if kata not in processed_text:
+                continue
+
+            # Kata dasar yang berubah dan n-gram lama yang menyentuhnya
+            changed = [j for j, word in enumerate(words) if kata in word]
+            old_marked = [p for j in changed for p in range(*spans[j])]
+            old_counts = featurizer.ngram_counts(tokens, self._touching_starts(len(tokens), old_marked))
+
+            for var, var_tokens in variasi:
+                # Susun token variasi: hanya kata yang berubah yang dianalisis ulang
+                new_tokens = []
+                new_marked = []
+                last = 0
+                for j in changed:
+                    start, end = spans[j]
+                    new_tokens.extend(tokens[last:start])
+                    replaced = var_tokens if words[j] == kata else featurizer.analyze(words[j].replace(kata, var))
+                    new_marked.extend(range(len(new_tokens), len(new_tokens) + len(replaced)))
+                    new_tokens.extend(replaced)
+                    last = end
+                new_tokens.extend(tokens[last:])
+
+                new_counts = featurizer.ngram_counts(new_tokens, self._touching_starts(len(new_tokens), new_marked))
+
+                # Delta bobot hanya pada fitur yang frekuensinya berubah
+                delta_features = []
+                delta_weights = []
+                norm_sq = base_norm_sq
+                nnz = base_nnz
+                for feature in old_counts.keys() | new_counts.keys():
+                    diff = new_counts.get(feature, 0) - old_counts.get(feature, 0)
+                    if diff == 0:
+                        continue
+                    count = base_counts.get(feature, 0)
+                    old_weight = featurizer.weight(feature, count)
+                    new_weight = featurizer.weight(feature, count + diff)
+                    delta_features.append(feature)
+                    delta_weights.append(new_weight - old_weight)
+                    norm_sq += new_weight * new_weight - old_weight * old_weight
+                    nnz += (count + diff > 0) - (count > 0)
+
+                if nnz == 0:
+                    # Variasi tanpa fitur apa pun menjadi vektor nol
+                    scores.append(np.zeros_like(base_scores))
+                    norm_sq = 0.0
+                elif delta_features:
+                    scores.append(base_scores + self.feature_log_prob[:, delta_features] @ np.array(delta_weights))
+                else:
+                    scores.append(base_scores)
+                norms_sq.append(norm_sq)
+
+        # Normalisasi l2 (dokumen kosong tetap bernilai nol)
+        norms = np.sqrt(np.maximum(norms_sq, 0.0))
+        norms[norms == 0.0] = 1.0
+        return self._probas_from_jll(np.vstack(scores) / norms[:, np.newaxis])
@@ -0,0 +1,290 @@
+"""
+Featurizer TF-IDF ringkas untuk inferensi tanpa sklearn
+"""
+import re
+import math
+from collections import Counter
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.utils import murmurhash3_32
+
+# Token pattern bawaan TfidfVectorizer yang didukung featurizer ini
+DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+class TfidfFeaturizer:
+    """
+    Salinan ringkas dari TfidfVectorizer yang sudah dilatih (analyzer 'word',
+    token pattern bawaan, normalisasi l2). Menyimpan vocabulary, bobot idf dan
+    rentang n-gram sehingga vektor satu dokumen dapat dihitung dan diubah
+    sebagian tanpa menjalankan ulang vectorizer pada seluruh teks.
+
+    Vocabulary dapat berupa dict term -> indeks fitur, atau array term yang
+    sudah terurut (indeks fitur = posisi term) yang dicari dengan
+    np.searchsorted sehingga bisa dimuat langsung dari file memory-mapped.
+    """
+
+    def __init__(self, vocabulary, idf, ngram_range, sublinear_tf=True):
+        if isinstance(vocabulary, dict):
+            self.vocabulary = vocabulary
+            self.terms = None
+        else:
+            self.vocabulary = None
+            self.terms = vocabulary
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.min_n, self.max_n = ngram_range
+        self.sublinear_tf = sublinear_tf
+        self._token_pattern = re.compile(DEFAULT_TOKEN_PATTERN)
+
+    @classmethod
+    def from_vectorizer(cls, vectorizer):
+        """
+        Membuat featurizer dari TfidfVectorizer yang sudah dilatih
+
+        Parameters
+        ----------
+        vectorizer : TfidfVectorizer
+            Vectorizer yang sudah di-fit
+
+        Returns
+        -------
+        TfidfFeaturizer
+            Featurizer dengan vocabulary dan idf yang sama
+
+        Raises
+        ------
+        ValueError
+            Jika konfigurasi vectorizer tidak didukung
+        """
+        supported = (
+            vectorizer.analyzer == 'word'
+            and vectorizer.token_pattern == DEFAULT_TOKEN_PATTERN
+            and vectorizer.tokenizer is None
+            and vectorizer.preprocessor is None
+            and vectorizer.stop_words is None
+            and vectorizer.lowercase
+            and not vectorizer.binary
+            and vectorizer.use_idf
+            and vectorizer.norm == 'l2'
+        )
+        if not supported:
+            raise ValueError("Konfigurasi TfidfVectorizer tidak didukung oleh TfidfFeaturizer")
+
+        return cls(
+            vectorizer.vocabulary_,
+            vectorizer.idf_,
+            vectorizer.ngram_range,
+            sublinear_tf=vectorizer.sublinear_tf
+        )
+
+    def analyze(self, text):
+        """
+        Memecah teks menjadi token dengan aturan yang sama seperti vectorizer
+
+        Parameters
+        ----------
+        text : str
+            Teks input
+
+        Returns
+        -------
+        list of str
+            Daftar token
+        """
+        return self._token_pattern.findall(text.lower())
+
+    def ngram_counts(self, tokens, starts=None):
+        """
+        Menghitung frekuensi n-gram yang ada di vocabulary
+
+        Parameters
+        ----------
+        tokens : list of str
+            Daftar token dokumen
+        starts : dict or None
+            Jika diberikan, hanya n-gram dengan posisi awal di starts[n] yang dihitung
+
+        Returns
+        -------
+        Counter
+            Frekuensi per indeks fitur
+        """
+        ngrams = []
+        for n in range(self.min_n, self.max_n + 1):
+            positions = range(len(tokens) - n + 1) if starts is None else starts.get(n, ())
+            ngrams.extend(' '.join(tokens[i:i + n]) for i in positions)
+        return Counter(feature for feature in self.lookup(ngrams) if feature >= 0)
+
+    def lookup(self, ngrams):
+        """
+        Mencari indeks fitur untuk sekumpulan n-gram
+
+        Parameters
+        ----------
+        ngrams : list of str
+            N-gram yang dicari
+
+        Returns
+        -------
+        list of int
+            Indeks fitur, atau -1 jika n-gram tidak ada di vocabulary
+        """
+        if self.terms is None:
+            vocabulary = self.vocabulary
+            return [vocabulary.get(ngram, -1) for ngram in ngrams]
+
+        if not ngrams:
+            return []
+        if len(self.terms) == 0:
+            return [-1] * len(ngrams)
+        ngrams = np.asarray(ngrams)
+        positions = np.searchsorted(self.terms, ngrams)
+        positions[positions == len(self.terms)] = 0
+        found = self.terms[positions] == ngrams
+        return np.where(found, positions, -1).tolist()
+
+    def sorted_terms(self):
+        """
+        Mengembalikan term vocabulary yang terurut beserta indeks fitur asalnya
+
+        Returns
+        -------
+        tuple
+            (array term terurut, array indeks fitur untuk setiap term)
+        """
+        if self.terms is not None:
+            return np.asarray(self.terms), np.arange(len(self.terms))
+        terms = sorted(self.vocabulary)
+        return np.array(terms), np.array([self.vocabulary[term] for term in terms], dtype=np.intp)
+
+    def known_tokens(self):
+        """
+        Token yang muncul di salah satu term vocabulary. Dokumen yang tidak memuat
+        satu pun token ini dipastikan tidak memiliki fitur.
+
+        Returns
+        -------
+        frozenset of str
+            Himpunan token
+        """
+        terms = self.vocabulary.keys() if self.terms is None else self.terms.tolist()
+        return frozenset(token for term in terms for token in term.split(' '))
+
+    def weight(self, feature, count):
+        """Bobot TF-IDF (sebelum normalisasi) satu fitur dengan frekuensi tertentu"""
+        if count <= 0:
+            return 0.0
+        tf = 1.0 + math.log(count) if self.sublinear_tf else float(count)
+        return tf * self.idf[feature]
+
+    def count_matrix(self, texts):
+        """
+        Menghitung matriks frekuensi n-gram (belum dibobot) untuk kumpulan teks
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matriks frekuensi (jumlah_teks x jumlah_fitur), satu entri per fitur per baris
+        """
+        indptr = [0]
+        indices = []
+        counts = []
+        for text in texts:
+            text_counts = self.ngram_counts(self.analyze(text))
+            indices.extend(text_counts.keys())
+            counts.extend(text_counts.values())
+            indptr.append(len(indices))
+
+        return csr_matrix(
+            (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.intp), np.asarray(indptr)),
+            shape=(len(indptr) - 1, len(self.idf))
+        )
+
+    def weight_matrix(self, counts):
+        """
+        Mengubah matriks frekuensi menjadi matriks TF-IDF yang sudah dinormalisasi l2
+
+        Parameters
+        ----------
+        counts : scipy.sparse.csr_matrix
+            Hasil count_matrix
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matriks fitur dengan pola sparse yang sama
+        """
+        data = counts.data.copy()
+        if self.sublinear_tf:
+            np.log(data, out=data)
+            data += 1.0
+        data *= self.idf[counts.indices]
+
+        # Normalisasi l2 per baris; baris kosong tetap bernilai nol
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=counts.shape[0]))
+        norms[norms == 0.0] = 1.0
+        data /= norms[rows]
+
+        return csr_matrix((data, counts.indices, counts.indptr), shape=counts.shape)
+
+    def transform(self, texts):
+        """
+        Mengubah kumpulan teks menjadi matriks TF-IDF yang sudah dinormalisasi l2,
+        sama seperti TfidfVectorizer.transform
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matriks fitur (jumlah_teks x jumlah_fitur)
+        """
+        return self.weight_matrix(self.count_matrix(texts))
+
+class HashingFeaturizer(TfidfFeaturizer):
+    """
+    Featurizer TF-IDF tanpa vocabulary: indeks fitur sebuah n-gram adalah
+    murmurhash3_32 (seperti HashingVectorizer) modulo n_features. Karena tidak
+    ada state yang dipelajari selain idf, teks baru dengan n-gram baru dapat
+    langsung diubah menjadi fitur untuk update inkremental.
+    """
+
+    def __init__(self, n_features, idf, ngram_range, sublinear_tf=True):
+        super().__init__({}, idf, ngram_range, sublinear_tf=sublinear_tf)
+        self.vocabulary = None
+        self.n_features = int(n_features)
+        if len(self.idf) != self.n_features:
+            raise ValueError("Panjang idf harus sama dengan n_features")
+
+    def lookup(self, ngrams):
+        """
+        Indeks fitur hasil hashing untuk sekumpulan n-gram
+
+        Parameters
+        ----------
+        ngrams : list of str
+            N-gram yang dicari
+
+        Returns
+        -------
+        list of int
+            Indeks fitur (selalu ditemukan)
+        """
+        n_features = self.n_features
+        return [murmurhash3_32(ngram, positive=True) % n_features for ngram in ngrams]
+
+    def known_tokens(self):
+        """Setiap n-gram memiliki indeks fitur, sehingga token yang dikenal tidak dapat ditentukan"""
+        return None
+
+    def sorted_terms(self):
+        """Featurizer hashing tidak menyimpan term"""
+        raise ValueError("HashingFeaturizer tidak memiliki vocabulary")
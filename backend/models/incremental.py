@@ -0,0 +1,229 @@
+"""
+Model inkremental: HashingFeaturizer + ComplementNB.partial_fit
+"""
+import numpy as np
+from sklearn.naive_bayes import ComplementNB
+
+from models.featurizer import HashingFeaturizer
+from models.compiled_model import CompiledModel
+
+class IncrementalModel:
+    """
+    Model TF-IDF + ComplementNB yang dapat diperbarui dengan contoh baru tanpa
+    melatih ulang seluruh pipeline. Fitur dihitung dengan HashingFeaturizer
+    sehingga n-gram baru tidak memerlukan vocabulary baru, dan statistik Naive
+    Bayes ditambahkan dengan ComplementNB.partial_fit.
+
+    Bobot idf dibekukan di antara refresh_idf(): frekuensi dokumen terus
+    dicatat pada setiap update, dan refresh_idf() menghitung ulang idf lalu
+    menskalakan ulang hitungan fitur per kelas. Penskalaan ini tepat untuk
+    fitur tanpa normalisasi dan merupakan pendekatan untuk fitur ternormalisasi
+    l2; rebuild penuh (DiseaseClassifier.train) tetap diperlukan secara berkala.
+    """
+
+    def __init__(self, labels, n_features=2 ** 16, ngram_range=(1, 3), sublinear_tf=True, alpha=0.3):
+        self.labels = np.asarray(labels)
+        self._label_index = {label: i for i, label in enumerate(self.labels)}
+        self.n_features = int(n_features)
+        self.featurizer = HashingFeaturizer(self.n_features, np.ones(self.n_features), ngram_range, sublinear_tf)
+        self.clf = ComplementNB(alpha=alpha)
+        # Frekuensi dokumen per fitur dan jumlah dokumen untuk menghitung idf
+        self.doc_freq = np.zeros(self.n_features, dtype=np.int64)
+        self.n_documents = 0
+        # Jumlah contoh yang sudah dilatihkan per kelas untuk bobot penyeimbang kelas
+        self.class_counts = np.zeros(len(self.labels), dtype=np.int64)
+
+    def _encode(self, labels):
+        """Indeks kelas untuk label penyakit; label baru memerlukan rebuild penuh"""
+        unknown = sorted(set(labels) - self._label_index.keys())
+        if unknown:
+            raise ValueError(f"Penyakit baru {unknown} tidak dapat ditambahkan secara inkremental, lakukan rebuild penuh")
+        return np.array([self._label_index[label] for label in labels], dtype=np.intp)
+
+    def count(self, texts):
+        """
+        Menghitung matriks frekuensi n-gram sekaligus mencatat frekuensi dokumennya
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matriks frekuensi untuk partial_fit_counts
+        """
+        counts = self.featurizer.count_matrix(texts)
+        # Setiap fitur muncul paling banyak sekali per baris pada count_matrix
+        self.doc_freq += np.bincount(counts.indices, minlength=self.n_features)
+        self.n_documents += counts.shape[0]
+        return counts
+
+    def _compute_idf(self):
+        """idf dengan smoothing, sama seperti TfidfVectorizer(smooth_idf=True)"""
+        return np.log((1.0 + self.n_documents) / (1.0 + self.doc_freq)) + 1.0
+
+    def _with_idf(self, idf):
+        """Featurizer baru dengan idf tertentu (model terkompilasi lama tetap memakai featurizer lamanya)"""
+        featurizer = self.featurizer
+        return HashingFeaturizer(self.n_features, idf, (featurizer.min_n, featurizer.max_n), featurizer.sublinear_tf)
+
+    def fit(self, texts, labels, sample_weight=None):
+        """
+        Melatih model dari awal
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+        labels : list of str
+            Nama penyakit untuk setiap teks
+        sample_weight : array-like or None
+            Bobot sampel, misalnya class_balance_weights
+
+        Returns
+        -------
+        IncrementalModel
+            Objek ini sendiri
+        """
+        self.doc_freq[:] = 0
+        self.n_documents = 0
+        self.class_counts[:] = 0
+        self.clf = ComplementNB(alpha=self.clf.alpha)
+        counts = self.count(texts)
+        self.refresh_idf()
+        return self.partial_fit_counts(counts, labels, sample_weight)
+
+    def partial_fit(self, texts, labels, sample_weight=None):
+        """
+        Menambahkan contoh baru ke model dengan idf saat ini
+
+        Parameters
+        ----------
+        texts : list of str
+            Teks yang sudah dipreprocessing
+        labels : list of str
+            Nama penyakit untuk setiap teks (harus sudah dikenal model)
+        sample_weight : array-like or None
+            Bobot sampel
+
+        Returns
+        -------
+        IncrementalModel
+            Objek ini sendiri
+
+        Raises
+        ------
+        ValueError
+            Jika ada penyakit yang belum dikenal model
+        """
+        return self.partial_fit_counts(self.count(texts), labels, sample_weight)
+
+    def partial_fit_counts(self, counts, labels, sample_weight=None):
+        """
+        Menambahkan contoh yang frekuensinya sudah dihitung dengan count(), memakai
+        idf saat ini. Frekuensi dokumen tidak dicatat ulang, sehingga pelatihan dua
+        tahap dapat menghitung idf dari seluruh korpus terlebih dahulu.
+
+        Parameters
+        ----------
+        counts : scipy.sparse.csr_matrix
+            Hasil count()
+        labels : list of str
+            Nama penyakit untuk setiap baris (harus sudah dikenal model)
+        sample_weight : array-like or None
+            Bobot sampel
+
+        Returns
+        -------
+        IncrementalModel
+            Objek ini sendiri
+
+        Raises
+        ------
+        ValueError
+            Jika ada penyakit yang belum dikenal model
+        """
+        y = self._encode(labels)
+        self.clf.partial_fit(
+            self.featurizer.weight_matrix(counts), y,
+            classes=np.arange(len(self.labels)),
+            sample_weight=sample_weight
+        )
+        self.class_counts += np.bincount(y, minlength=len(self.labels))
+        return self
+
+    def class_balance_weights(self, labels):
+        """
+        Bobot sampel penyeimbang kelas untuk contoh baru, dengan rumus yang sama
+        seperti classifier.class_balance_weights (jumlah contoh kelas terbesar
+        dibagi jumlah contoh kelasnya) atas semua contoh yang sudah dilatihkan
+        ditambah contoh baru ini
+
+        Parameters
+        ----------
+        labels : list of str
+            Nama penyakit untuk setiap contoh baru (harus sudah dikenal model)
+
+        Returns
+        -------
+        numpy.ndarray
+            Bobot sampel untuk partial_fit
+
+        Raises
+        ------
+        ValueError
+            Jika ada penyakit yang belum dikenal model
+        """
+        y = self._encode(labels)
+        counts = self.class_counts + np.bincount(y, minlength=len(self.labels))
+        return counts.max() / counts[y]
+
+    def refresh_idf(self):
+        """
+        Menghitung ulang idf dari frekuensi dokumen terkini dan menskalakan
+        hitungan fitur per kelas ke idf baru (jika model sudah berisi contoh)
+
+        Returns
+        -------
+        IncrementalModel
+            Objek ini sendiri
+        """
+        old_idf = self.featurizer.idf
+        new_idf = self._compute_idf()
+        self.featurizer = self._with_idf(new_idf)
+        clf = self.clf
+        if not hasattr(clf, 'feature_count_'):
+            return self
+
+        clf.feature_count_ = clf.feature_count_ * (new_idf / old_idf)
+        clf.feature_all_ = clf.feature_count_.sum(axis=0)
+
+        # Log-probabilitas fitur dihitung ulang dengan rumus yang sama seperti ComplementNB
+        comp_count = clf.feature_all_ + clf.alpha - clf.feature_count_
+        logged = np.log(comp_count / comp_count.sum(axis=1, keepdims=True))
+        clf.feature_log_prob_ = logged / logged.sum(axis=1, keepdims=True) if clf.norm else -logged
+        return self
+
+    def compile(self, variations):
+        """
+        Membuat CompiledModel untuk serving dari state model saat ini
+
+        Parameters
+        ----------
+        variations : iterable of tuple
+            Pasangan (kata, variasi) seperti GEJALA_VARIATIONS
+
+        Returns
+        -------
+        CompiledModel
+            Model serving yang tidak berubah oleh update berikutnya
+        """
+        return CompiledModel(
+            self.featurizer,
+            self.clf.feature_log_prob_.copy(),
+            self.labels[self.clf.classes_],
+            variations,
+            alpha=self.clf.alpha
+        )
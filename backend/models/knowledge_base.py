@@ -0,0 +1,789 @@
+"""
+Basis pengetahuan medis bersama untuk Chatbot dan OutputTranslator
+"""
+import os
+import json
+import time
+import threading
+from types import MappingProxyType
+
+DEFAULT_DISEASES_PATH = os.path.join('data', 'diseases.json')
+DEFAULT_FAQ_PATH = os.path.join('data', 'faq.json')
+
+# Informasi pencegahan per penyakit
+PENCEGAHAN_PENYAKIT = MappingProxyType({
+    "Flu": "Mencuci tangan secara rutin, menghindari kontak dekat dengan orang yang sedang sakit, menjaga daya tahan tubuh dengan istirahat cukup dan makan makanan bergizi.",
+    "Demam Berdarah": "Memberantas sarang nyamuk dengan menguras tempat penampungan air, menutup rapat tempat penampungan air, mendaur ulang barang bekas, dan memantau jentik nyamuk.",
+    "Tipes": "Menjaga kebersihan makanan dan minuman, mencuci tangan sebelum makan, memasak makanan dengan matang, dan menggunakan air bersih.",
+    "TBC": "Mendapatkan vaksinasi BCG, menjaga ventilasi rumah, menghindari kontak dekat dengan penderita TBC aktif, dan menjaga daya tahan tubuh.",
+    "Maag": "Makan secara teratur, menghindari makanan pedas dan asam, mengelola stres, dan menghindari merokok dan minuman beralkohol.",
+    "Asma": "Menghindari faktor pemicu seperti debu, polen, asap rokok, dan udara dingin, serta menjaga kebersihan rumah.",
+    "Migrain": "Menghindari faktor pemicu seperti stres, kurang tidur, dan makanan tertentu, serta menjaga pola hidup teratur.",
+    "Diare": "Mencuci tangan dengan sabun, menggunakan air bersih, memasak makanan hingga matang, dan menjaga kebersihan makanan.",
+    "Hipertensi": "Mengurangi konsumsi garam, menjaga berat badan ideal, olahraga teratur, dan menghindari stres.",
+    "Diabetes": "Menjaga pola makan sehat, olahraga teratur, menghindari makanan tinggi gula, dan menjaga berat badan ideal.",
+    "Eksim": "Menjaga kelembapan kulit, menghindari pencetus alergi, dan menggunakan pelembab secara teratur.",
+    "Infeksi Saluran Kemih": "Minum air putih yang cukup, jangan menahan kencing, dan jaga kebersihan area genital.",
+    "Radang Sendi": "Menjaga berat badan ideal, olahraga teratur, dan hindari cedera sendi.",
+    "Alergi Makanan": "Menghindari makanan pemicu alergi, membaca label makanan dengan seksama, dan membawa obat alergi jika memiliki riwayat alergi berat.",
+    "Sinusitis": "Menjaga kebersihan, menghindari alergen, banyak minum air putih, dan hindari perubahan suhu ekstrem.",
+    "Campak": "Vaksinasi campak, menjaga kebersihan, dan menghindari kontak dengan penderita campak.",
+    "Cacar Air": "Vaksinasi cacar air, menjaga kebersihan, dan hindari kontak dengan penderita cacar air.",
+    "Hepatitis A": "Cuci tangan sebelum makan, konsumsi air bersih, dan hindari makanan/minuman yang tidak higienis.",
+    "Anemia": "Konsumsi makanan kaya zat besi, vitamin B12, dan asam folat, serta rutin cek darah.",
+    "Vertigo": "Hindari perubahan posisi kepala mendadak, cukup istirahat, dan kelola stres.",
+    "Bronkitis": "Hindari asap rokok dan polusi, cuci tangan, dan vaksinasi flu.",
+    "Pneumonia": "Vaksinasi pneumonia, jaga kebersihan tangan, dan hindari kontak dengan penderita infeksi saluran napas.",
+    "Demam Scarlet": "Jaga kebersihan, cuci tangan, dan hindari kontak dengan penderita infeksi tenggorokan.",
+    "COVID-19": "Vaksinasi COVID-19, gunakan masker, cuci tangan, dan jaga jarak."
+})
+
+# Informasi durasi penyembuhan per penyakit
+DURASI_PENYAKIT = MappingProxyType({
+    "Flu": "Flu biasanya sembuh dalam waktu 7-10 hari tanpa pengobatan khusus, namun gejala seperti batuk mungkin bertahan lebih lama.",
+    "Demam Berdarah": "Proses penyembuhan demam berdarah biasanya memerlukan waktu 2-7 hari untuk fase kritis, dan total 2-4 minggu untuk pemulihan penuh.",
+    "Tipes": "Tipes membutuhkan waktu penyembuhan sekitar 2-4 minggu dengan pengobatan antibiotik yang tepat. Tanpa pengobatan bisa lebih lama dan berisiko komplikasi.",
+    "TBC": "Pengobatan TBC memerlukan waktu minimal 6 bulan hingga 12 bulan dengan konsumsi obat secara teratur dan lengkap.",
+    "Maag": "Maag akut dapat membaik dalam 1-2 minggu dengan pengobatan, sedangkan maag kronis memerlukan pengobatan jangka panjang dan pengelolaan gaya hidup.",
+    "Asma": "Asma adalah kondisi kronis yang dapat dikontrol dengan pengobatan yang tepat. Serangan asma bisa mereda dalam beberapa menit hingga jam dengan penanganan yang sesuai.",
+    "Migrain": "Serangan migrain biasanya berlangsung 4-72 jam. Dengan pengobatan yang tepat bisa lebih cepat mereda.",
+    "Diare": "Diare akut biasanya sembuh dalam 2-3 hari. Jika berlangsung lebih dari seminggu, perlu evaluasi medis lebih lanjut.",
+    "Hipertensi": "Hipertensi adalah kondisi kronis yang memerlukan pengelolaan seumur hidup melalui pengobatan dan perubahan gaya hidup.",
+    "Diabetes": "Diabetes adalah kondisi kronis yang memerlukan pengelolaan seumur hidup. Dengan penanganan yang tepat, kadar gula darah bisa terkontrol dengan baik.",
+    "Eksim": "Eksim dapat berlangsung beberapa minggu hingga bulan, tergantung pemicu dan pengelolaan. Eksim kronis bisa kambuh berulang.",
+    "Infeksi Saluran Kemih": "ISK ringan biasanya sembuh dalam 3-7 hari dengan pengobatan. Jika berat atau berulang, bisa lebih lama.",
+    "Radang Sendi": "Radang sendi bersifat kronis dan memerlukan pengelolaan jangka panjang. Nyeri bisa membaik dalam beberapa hari hingga minggu dengan terapi.",
+    "Alergi Makanan": "Reaksi alergi makanan bisa berlangsung dari beberapa menit hingga beberapa jam, dan umumnya mereda dalam 1-2 hari setelah berhenti mengonsumsi pemicu.",
+    "Sinusitis": "Sinusitis akut biasanya sembuh dalam 2-4 minggu, sementara sinusitis kronis dapat berlangsung lebih dari 12 minggu dan membutuhkan perawatan jangka panjang.",
+    "Campak": "Campak biasanya sembuh dalam 7-10 hari. Ruam akan hilang bertahap setelah demam turun.",
+    "Cacar Air": "Cacar air umumnya sembuh dalam 1-2 minggu. Bekas ruam bisa bertahan lebih lama.",
+    "Hepatitis A": "Hepatitis A biasanya sembuh total dalam 2-6 minggu tanpa komplikasi kronis.",
+    "Anemia": "Durasi pemulihan anemia tergantung penyebab dan terapi, biasanya beberapa minggu hingga bulan.",
+    "Vertigo": "Vertigo akut bisa berlangsung beberapa menit hingga jam, namun pada kasus kronis bisa berulang dalam waktu lama.",
+    "Bronkitis": "Bronkitis akut biasanya sembuh dalam 1-3 minggu. Bronkitis kronis bisa berlangsung lama dan sering kambuh.",
+    "Pneumonia": "Pneumonia ringan bisa sembuh dalam 1-3 minggu, namun pada lansia atau berat bisa lebih lama.",
+    "Demam Scarlet": "Demam scarlet biasanya membaik dalam 1 minggu dengan antibiotik.",
+    "COVID-19": "COVID-19 ringan biasanya sembuh dalam 1-2 minggu, kasus berat bisa lebih lama tergantung komplikasi."
+})
+
+class DiseaseInfo:
+    """
+    Informasi satu penyakit dari diseases.json: ID kanonik (nama penyakit),
+    deskripsi dan daftar rekomendasi
+    """
+    
+    __slots__ = ('disease_id', 'description', 'recommendations')
+    
+    def __init__(self, disease_id, description, recommendations):
+        self.disease_id = disease_id
+        self.description = description
+        self.recommendations = tuple(recommendations)
+    
+    def __repr__(self):
+        return f"DiseaseInfo(disease_id={self.disease_id!r})"
+
+class KnowledgeBase:
+    """
+    Basis pengetahuan medis yang dimuat sekali dan dipakai bersama: deskripsi,
+    rekomendasi, pencegahan, durasi penyembuhan, gejala tambahan dan FAQ umum.
+    
+    Semua lookup memakai ID kanonik penyakit, yaitu nama penyakit seperti pada
+    kunci diseases.json (misalnya "Demam Berdarah"). Isi objek tidak diubah
+    setelah dibuat (mapping read-only dan tuple), sehingga satu objek aman
+    dipakai bersama oleh banyak komponen dan thread.
+    """
+    
+    def __init__(self, diseases, faq, prevention=PENCEGAHAN_PENYAKIT, duration=DURASI_PENYAKIT):
+        """
+        Membangun basis pengetahuan
+        
+        Parameters
+        ----------
+        diseases : dict
+            Isi diseases.json: ID penyakit -> {'description', 'recommendations'}
+        faq : dict
+            Isi faq.json dengan bagian 'umum' dan 'gejala_tambahan'
+        prevention : mapping
+            ID penyakit -> informasi pencegahan
+        duration : mapping
+            ID penyakit -> informasi durasi penyembuhan
+        """
+        self.diseases = MappingProxyType({
+            disease_id: DiseaseInfo(disease_id, info.get('description', ''), info.get('recommendations', ()))
+            for disease_id, info in diseases.items()
+        })
+        self.prevention = MappingProxyType(dict(prevention))
+        self.duration = MappingProxyType(dict(duration))
+        self.extra_symptoms = MappingProxyType({
+            disease_id: tuple(symptoms) for disease_id, symptoms in faq.get('gejala_tambahan', {}).items()
+        })
+        self.general_faq = MappingProxyType(dict(faq.get('umum', {})))
+    
+    @classmethod
+    def load(cls, diseases_path=DEFAULT_DISEASES_PATH, faq_path=DEFAULT_FAQ_PATH):
+        """
+        Memuat basis pengetahuan dari file JSON; file yang belum ada dibuat dari data contoh
+        
+        Parameters
+        ----------
+        diseases_path : str
+            Path file data penyakit
+        faq_path : str
+            Path file data FAQ
+        
+        Returns
+        -------
+        KnowledgeBase
+            Basis pengetahuan hasil pemuatan
+        """
+        return cls(load_diseases_data(diseases_path), load_faq_data(faq_path))
+    
+    def disease(self, disease_id):
+        """
+        Informasi penyakit berdasarkan ID kanonik
+        
+        Parameters
+        ----------
+        disease_id : str
+            ID kanonik (nama) penyakit
+        
+        Returns
+        -------
+        DiseaseInfo or None
+            Informasi penyakit, atau None jika tidak dikenal
+        """
+        return self.diseases.get(disease_id)
+
+class KnowledgeSnapshot:
+    """
+    Pasangan basis pengetahuan dan struktur turunannya (misalnya indeks
+    pencarian chatbot) yang dibangun dari data yang sama. Satu request cukup
+    memakai satu snapshot agar data dan indeks selalu konsisten.
+    """
+    
+    __slots__ = ('knowledge_base', 'derived', 'version')
+    
+    def __init__(self, knowledge_base, derived, version):
+        self.knowledge_base = knowledge_base
+        self.derived = MappingProxyType(dict(derived))
+        self.version = version
+    
+    def __getitem__(self, key):
+        return self.derived[key]
+
+class KnowledgeBaseWatcher:
+    """
+    Sumber basis pengetahuan yang memuat ulang diseases.json dan faq.json saat
+    file berubah, tanpa restart proses.
+    
+    Perubahan dideteksi dengan membandingkan (inode, mtime, ukuran) file,
+    paling sering sekali per poll_interval detik saat current() dipanggil.
+    Jika berubah, basis pengetahuan baru beserta semua struktur turunan dari
+    builder terdaftar dibangun di thread latar belakang lalu snapshot diganti
+    sekaligus. current() tidak pernah menunggu pemuatan ulang: selama
+    pembangunan, request tetap memakai snapshot lama. File yang gagal dibaca
+    (misalnya JSON setengah tersimpan) diabaikan sampai file berubah lagi.
+    """
+    
+    def __init__(self, diseases_path=DEFAULT_DISEASES_PATH, faq_path=DEFAULT_FAQ_PATH, poll_interval=2.0, knowledge_base=None):
+        """
+        Inisialisasi watcher dan memuat basis pengetahuan awal
+        
+        Parameters
+        ----------
+        diseases_path : str
+            Path file data penyakit
+        faq_path : str
+            Path file data FAQ
+        poll_interval : float or None
+            Jeda minimum antar pemeriksaan file (detik); None menonaktifkan pemuatan ulang
+        knowledge_base : KnowledgeBase or None
+            Basis pengetahuan awal; None berarti dimuat dari file (dengan data contoh jika belum ada)
+        """
+        self.paths = (diseases_path, faq_path)
+        self.poll_interval = poll_interval
+        self._builders = {}
+        self._lock = threading.Lock()
+        self._reloading = threading.Lock()
+        self._next_poll = 0.0
+        self.reloads = 0
+        self.last_error = None
+        
+        if knowledge_base is None:
+            knowledge_base = KnowledgeBase.load(diseases_path, faq_path)
+        # Diambil setelah pemuatan: file data contoh yang baru dibuat tidak memicu pemuatan ulang
+        self._signature = self._file_signature()
+        self._snapshot = KnowledgeSnapshot(knowledge_base, {}, 0)
+        self.loaded_at = time.time()
+    
+    @classmethod
+    def static(cls, knowledge_base):
+        """
+        Watcher untuk basis pengetahuan yang tidak pernah dimuat ulang
+        
+        Parameters
+        ----------
+        knowledge_base : KnowledgeBase
+            Basis pengetahuan yang dipakai
+        
+        Returns
+        -------
+        KnowledgeBaseWatcher
+            Watcher tanpa pemeriksaan file
+        """
+        return cls(poll_interval=None, knowledge_base=knowledge_base)
+    
+    def _file_signature(self):
+        """(inode, mtime, ukuran) setiap file sumber, None untuk file yang tidak ada"""
+        signature = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def register(self, builder):
+        """
+        Mendaftarkan builder struktur turunan; builder langsung dijalankan untuk
+        snapshot saat ini dan dijalankan ulang setiap basis pengetahuan dimuat ulang
+        
+        Parameters
+        ----------
+        builder : callable
+            Fungsi KnowledgeBase -> struktur turunan
+        
+        Returns
+        -------
+        int
+            Kunci untuk mengambil hasil builder dari snapshot (snapshot[kunci])
+        """
+        with self._lock:
+            key = len(self._builders)
+            self._builders[key] = builder
+            snapshot = self._snapshot
+            derived = dict(snapshot.derived)
+            derived[key] = builder(snapshot.knowledge_base)
+            self._snapshot = KnowledgeSnapshot(snapshot.knowledge_base, derived, snapshot.version)
+        return key
+    
+    def current(self):
+        """
+        Snapshot terkini; sekaligus memeriksa perubahan file jika sudah waktunya
+        
+        Returns
+        -------
+        KnowledgeSnapshot
+            Snapshot yang dipakai untuk seluruh request
+        """
+        if self.poll_interval is not None:
+            now = time.monotonic()
+            if now >= self._next_poll:
+                self._next_poll = now + self.poll_interval
+                self.check()
+        return self._snapshot
+    
+    def check(self):
+        """
+        Memeriksa perubahan file sumber dan memulai pemuatan ulang di latar belakang
+        
+        Returns
+        -------
+        threading.Thread or None
+            Thread pemuatan ulang, atau None jika tidak ada perubahan atau
+            pemuatan ulang lain sedang berjalan
+        """
+        signature = self._file_signature()
+        if signature == self._signature or not self._reloading.acquire(blocking=False):
+            return None
+        thread = threading.Thread(target=self._reload, args=(signature,), name='knowledge-base-reload', daemon=True)
+        thread.start()
+        return thread
+    
+    def _reload(self, signature):
+        """Membangun snapshot baru dari file lalu menggantikan snapshot lama"""
+        try:
+            diseases_path, faq_path = self.paths
+            knowledge_base = KnowledgeBase(_read_json(diseases_path), _read_json(faq_path))
+            with self._lock:
+                builders = dict(self._builders)
+            derived = {key: builder(knowledge_base) for key, builder in builders.items()}
+            
+            with self._lock:
+                # Builder yang terdaftar selama pembangunan juga dijalankan
+                for key, builder in self._builders.items():
+                    if key not in derived:
+                        derived[key] = builder(knowledge_base)
+                self._snapshot = KnowledgeSnapshot(knowledge_base, derived, self._snapshot.version + 1)
+            self.reloads += 1
+            self.loaded_at = time.time()
+            self.last_error = None
+            print(f"Basis pengetahuan dimuat ulang dari {diseases_path} dan {faq_path} (versi {self._snapshot.version})")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Snapshot lama tetap dipakai sampai file berubah lagi
+            self.last_error = str(e)
+            print(f"Gagal memuat ulang basis pengetahuan, data lama tetap dipakai: {e}")
+        finally:
+            self._signature = signature
+            self._reloading.release()
+    
+    def stats(self):
+        """
+        Mengembalikan status basis pengetahuan
+        
+        Returns
+        -------
+        dict
+            Dictionary berisi versi snapshot, jumlah pemuatan ulang, waktu
+            pemuatan terakhir dan error pemuatan ulang terakhir
+        """
+        return {
+            'version': self._snapshot.version,
+            'reloads': self.reloads,
+            'loaded_at': self.loaded_at,
+            'last_error': self.last_error,
+            'watching': self.poll_interval is not None
+        }
+
+def as_watcher(knowledge_base):
+    """
+    Menyeragamkan sumber basis pengetahuan untuk Chatbot dan OutputTranslator
+    
+    Parameters
+    ----------
+    knowledge_base : KnowledgeBaseWatcher, KnowledgeBase or None
+        Watcher dipakai apa adanya, KnowledgeBase dibungkus tanpa pemuatan
+        ulang, None berarti dimuat dari file default
+    
+    Returns
+    -------
+    KnowledgeBaseWatcher
+        Sumber basis pengetahuan
+    """
+    if isinstance(knowledge_base, KnowledgeBaseWatcher):
+        return knowledge_base
+    if knowledge_base is None:
+        knowledge_base = KnowledgeBase.load()
+    return KnowledgeBaseWatcher.static(knowledge_base)
+
+def _read_json(path):
+    """Membaca file JSON tanpa fallback data contoh (untuk pemuatan ulang)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _load_json(path, create_sample, label):
+    """Memuat file JSON, atau membuat dan menyimpan data contoh jika file belum ada"""
+    try:
+        # Coba load file JSON jika sudah ada
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        print(f"Data {label} berhasil dimuat dari {path}")
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Jika file belum ada, buat contoh data
+        print(f"File {path} tidak ditemukan. Membuat data contoh...")
+        data = create_sample()
+        
+        # Buat direktori jika belum ada
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Simpan ke JSON
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        
+        print(f"Data contoh berhasil dibuat dan disimpan ke {path}")
+    
+    return data
+
+def load_diseases_data(path=DEFAULT_DISEASES_PATH):
+    """
+    Memuat data penyakit dari JSON.
+    Jika file tidak ada, akan dibuat data contoh.
+    
+    Parameters
+    ----------
+    path : str
+        Path file data penyakit
+    
+    Returns
+    -------
+    dict
+        Dictionary berisi informasi penyakit
+    """
+    return _load_json(path, _create_sample_diseases, 'penyakit')
+
+def load_faq_data(path=DEFAULT_FAQ_PATH):
+    """
+    Memuat data FAQ dari JSON.
+    Jika file tidak ada, akan dibuat data contoh.
+    
+    Parameters
+    ----------
+    path : str
+        Path file data FAQ
+    
+    Returns
+    -------
+    dict
+        Dictionary berisi FAQ
+    """
+    return _load_json(path, _create_sample_faq, 'FAQ')
+
+def _create_sample_diseases():
+    """Contoh data penyakit: penyakit, deskripsi, rekomendasi"""
+    return {
+        "Flu": {
+            "description": "Infeksi virus yang menyerang hidung, tenggorokan, dan paru-paru. Flu mudah menular dan bisa menyebabkan demam, sakit tenggorokan, batuk, pilek, dan nyeri otot.",
+            "recommendations": [
+                "Istirahat yang cukup untuk memulihkan kondisi tubuh",
+                "Minum air putih yang banyak untuk mencegah dehidrasi",
+                "Konsumsi obat penurun demam seperti paracetamol jika diperlukan",
+                "Hindari makanan atau minuman yang terlalu dingin",
+                "Jika gejala memburuk atau berlangsung lebih dari seminggu, segera konsultasikan ke dokter"
+            ]
+        },
+        "Demam Berdarah": {
+            "description": "Penyakit yang disebabkan oleh virus dengue yang ditularkan melalui gigitan nyamuk Aedes aegypti. Demam berdarah bisa menyebabkan demam tinggi, nyeri otot dan sendi, serta bisa mengakibatkan penurunan trombosit.",
+            "recommendations": [
+                "Segera periksakan diri ke dokter atau rumah sakit untuk mendapatkan perawatan",
+                "Minum banyak cairan untuk mencegah dehidrasi",
+                "Hindari obat-obatan yang mengandung aspirin atau ibuprofen yang dapat meningkatkan risiko perdarahan",
+                "Istirahat total dan pantau tanda-tanda penurunan trombosit seperti mimisan atau bintik merah di kulit",
+                "Konsumsi makanan bergizi dan mudah dicerna"
+            ]
+        },
+        "Tipes": {
+            "description": "Infeksi bakteri Salmonella typhi yang menyerang saluran pencernaan dan dapat menyebar ke seluruh tubuh. Tipes dapat menyebabkan demam tinggi, sakit kepala, sakit perut, dan sembelit atau diare.",
+            "recommendations": [
+                "Segera periksakan diri ke dokter untuk mendapatkan diagnosis dan pengobatan yang tepat",
+                "Istirahat total selama masa pemulihan",
+                "Konsumsi makanan lunak dan mudah dicerna",
+                "Minum banyak cairan untuk mencegah dehidrasi",
+                "Hindari makanan pedas, berlemak, dan bersantan",
+                "Patuhi jadwal minum antibiotik sesuai resep dokter hingga tuntas"
+            ]
+        },
+        "TBC": {
+            "description": "Infeksi bakteri Mycobacterium tuberculosis yang biasanya menyerang paru-paru. TBC dapat menyebabkan batuk berdahak dan berdarah, nyeri dada, demam, keringat malam, dan penurunan berat badan.",
+            "recommendations": [
+                "Segera periksakan diri ke dokter atau puskesmas untuk diagnosis dan penanganan",
+                "Jalani pengobatan lengkap sesuai petunjuk dokter, biasanya selama 6-9 bulan",
+                "Patuhi jadwal minum obat secara teratur dan lengkap",
+                "Tutup mulut saat batuk untuk mencegah penularan",
+                "Konsumsi makanan bergizi untuk meningkatkan daya tahan tubuh",
+                "Ventilasi rumah yang baik dan paparan sinar matahari yang cukup"
+            ]
+        },
+        "Maag": {
+            "description": "Gangguan pada lambung yang disebabkan oleh asam lambung yang berlebihan atau iritasi pada dinding lambung. Maag dapat menyebabkan nyeri ulu hati, mual, kembung, dan gangguan pencernaan.",
+            "recommendations": [
+                "Hindari makanan pedas, asam, berlemak, dan minuman berkafein atau beralkohol",
+                "Makan dalam porsi kecil tapi sering",
+                "Jangan telat makan atau terlalu lama kosong perut",
+                "Hindari stres berlebihan yang dapat memicu kekambuhan",
+                "Konsumsi obat antasida sesuai anjuran dokter",
+                "Jika gejala berlanjut, periksakan diri ke dokter untuk penanganan lebih lanjut"
+            ]
+        },
+        "Asma": {
+            "description": "Penyakit kronis pada saluran pernapasan yang ditandai dengan peradangan dan penyempitan saluran napas. Asma dapat menyebabkan sesak napas, mengi, batuk, dan rasa berat di dada.",
+            "recommendations": [
+                "Hindari faktor pencetus asma seperti debu, polusi, asap rokok, dan udara dingin",
+                "Gunakan inhaler sesuai petunjuk dokter",
+                "Selalu bawa inhaler kemanapun pergi",
+                "Jika serangan asma parah dan tidak membaik dengan inhaler, segera ke rumah sakit",
+                "Konsultasikan dengan dokter untuk membuat rencana penanganan asma jangka panjang",
+                "Lakukan olahraga ringan secara teratur untuk meningkatkan fungsi paru-paru"
+            ]
+        },
+        "Migrain": {
+            "description": "Gangguan saraf yang ditandai dengan sakit kepala berdenyut di satu sisi kepala. Migrain sering disertai dengan mual, muntah, dan sensitivitas terhadap cahaya dan suara.",
+            "recommendations": [
+                "Istirahat di ruangan yang tenang dan gelap saat serangan terjadi",
+                "Kompres dingin pada bagian kepala yang sakit",
+                "Hindari faktor pemicu seperti kurang tidur, stres, atau makanan tertentu",
+                "Konsumsi obat pereda nyeri sesuai anjuran dokter",
+                "Jika migrain terjadi secara rutin, konsultasikan dengan dokter untuk pengobatan pencegahan",
+                "Kelola stres dengan teknik relaksasi seperti meditasi atau yoga"
+            ]
+        },
+        "Diare": {
+            "description": "Kondisi saat feses menjadi encer dan frekuensi buang air besar meningkat. Diare biasanya disebabkan oleh infeksi virus, bakteri, atau parasit, serta bisa juga karena keracunan makanan atau intoleransi makanan.",
+            "recommendations": [
+                "Minum banyak cairan untuk mencegah dehidrasi, seperti air putih, oralit, atau sup",
+                "Konsumsi makanan lunak seperti bubur, pisang, roti, dan hindari makanan pedas, berlemak, atau berserat tinggi",
+                "Hindari produk susu, kafein, dan makanan pedas sementara waktu",
+                "Cuci tangan secara teratur untuk mencegah penularan",
+                "Jika diare berlangsung lebih dari 2 hari atau disertai demam tinggi dan darah dalam tinja, segera periksakan ke dokter"
+            ]
+        },
+        "Hipertensi": {
+            "description": "Kondisi tekanan darah yang terus-menerus tinggi pada dinding arteri. Hipertensi meningkatkan risiko penyakit jantung, stroke, dan masalah kesehatan lainnya.",
+            "recommendations": [
+                "Batasi konsumsi garam (sodium) dalam makanan",
+                "Konsumsi makanan kaya buah, sayuran, dan produk susu rendah lemak",
+                "Lakukan aktivitas fisik secara teratur, minimal 30 menit per hari",
+                "Batasi konsumsi alkohol dan berhenti merokok",
+                "Pantau tekanan darah secara teratur",
+                "Konsumsi obat darah tinggi sesuai resep dokter secara teratur",
+                "Kelola stres dengan teknik relaksasi"
+            ]
+        },
+        "Diabetes": {
+            "description": "Kondisi yang ditandai dengan kadar gula darah tinggi karena tubuh tidak dapat memproduksi atau menggunakan insulin dengan baik. Diabetes dapat menyebabkan berbagai komplikasi jika tidak ditangani dengan baik.",
+            "recommendations": [
+                "Pantau kadar gula darah secara teratur",
+                "Ikuti diet seimbang dengan batasan gula dan karbohidrat sesuai anjuran",
+                "Lakukan aktivitas fisik secara rutin",
+                "Konsumsi obat atau insulin sesuai resep dokter",
+                "Periksa kaki setiap hari untuk mencegah luka yang sulit sembuh",
+                "Kontrol berat badan dalam rentang sehat",
+                "Periksakan diri ke dokter secara rutin untuk mencegah komplikasi"
+            ]
+        },
+        "Eksim": {
+            "description": "Kondisi peradangan pada kulit yang ditandai dengan kulit kering, gatal, kemerahan, dan kadang-kadang lepuh. Eksim dapat dipicu oleh faktor genetik, alergi, atau lingkungan.",
+            "recommendations": [
+                "Hindari bahan-bahan yang dapat memicu alergi seperti sabun keras dan deterjen",
+                "Gunakan pelembab secara teratur untuk mengatasi kulit kering",
+                "Hindari menggaruk area yang gatal untuk mencegah infeksi",
+                "Gunakan pakaian berbahan lembut seperti katun",
+                "Mandi dengan air hangat (tidak panas) dan segera gunakan pelembab setelah mandi",
+                "Konsultasikan dengan dokter kulit untuk pengobatan yang tepat jika kondisi memburuk"
+            ]
+        },
+        "Infeksi Saluran Kemih": {
+            "description": "Infeksi yang terjadi di saluran kemih termasuk kandung kemih, uretra, ureter, dan ginjal. ISK lebih sering terjadi pada wanita dan ditandai dengan rasa terbakar saat buang air kecil dan keinginan buang air kecil yang sering.",
+            "recommendations": [
+                "Minum banyak air putih untuk membantu membilas bakteri dari saluran kemih",
+                "Buang air kecil segera saat terasa ingin, jangan ditahan",
+                "Jaga kebersihan area genital",
+                "Konsumsi obat antibiotik sesuai resep dokter hingga habis meskipun gejala sudah hilang",
+                "Hindari minuman yang dapat mengiritasi kandung kemih seperti alkohol, kafein, dan minuman bersoda",
+                "Konsultasikan dengan dokter jika gejala tidak membaik setelah beberapa hari pengobatan"
+            ]
+        },
+        "Radang Sendi": {
+            "description": "Peradangan pada satu atau lebih sendi yang menyebabkan nyeri dan kekakuan. Terdapat berbagai jenis radang sendi, dengan osteoartritis dan rheumatoid arthritis sebagai jenis yang paling umum.",
+            "recommendations": [
+                "Lakukan latihan ringan dan peregangan untuk menjaga fleksibilitas sendi",
+                "Jaga berat badan ideal untuk mengurangi tekanan pada sendi",
+                "Gunakan kompres panas atau dingin untuk meredakan nyeri",
+                "Konsumsi obat anti-inflamasi sesuai anjuran dokter",
+                "Istirahatkan sendi yang sakit, tetapi hindari imobilisasi yang terlalu lama",
+                "Gunakan alat bantu seperti tongkat atau penyangga jika diperlukan",
+                "Konsultasikan dengan dokter untuk program terapi yang sesuai"
+            ]
+        },
+        "Alergi Makanan": {
+            "description": "Respons imun abnormal terhadap protein dalam makanan tertentu. Alergi makanan dapat menyebabkan gejala ringan seperti gatal-gatal hingga yang lebih serius seperti anafilaksis.",
+            "recommendations": [
+                "Hindari makanan yang menyebabkan alergi",
+                "Baca label makanan dengan cermat untuk mengidentifikasi alergen tersembunyi",
+                "Informasikan kondisi alergi Anda kepada restoran saat makan di luar",
+                "Bawalah selalu obat alergi atau EpiPen jika Anda memiliki riwayat reaksi parah",
+                "Kenakan gelang informasi medis jika alergi Anda parah",
+                "Konsultasikan dengan ahli alergi untuk tes dan manajemen alergi yang tepat"
+            ]
+        },
+        "Sinusitis": {
+            "description": "Peradangan pada rongga sinus yang biasanya disebabkan oleh infeksi virus, bakteri, atau jamur. Sinusitis ditandai dengan hidung tersumbat, sakit kepala, nyeri wajah, dan lendir kental.",
+            "recommendations": [
+                "Gunakan semprotan hidung saline untuk membantu mengencerkan dan mengalirkan lendir",
+                "Hirup uap hangat untuk membantu mengurangi sumbatan",
+                "Hindari iritan seperti asap rokok dan polusi",
+                "Kompres hangat pada wajah untuk meredakan nyeri",
+                "Minum banyak cairan untuk mengencerkan lendir",
+                "Jika gejala berlangsung lebih dari 10 hari atau sangat parah, konsultasikan dengan dokter"
+            ]
+        },
+        "Campak": {
+            "description": "Penyakit menular akibat infeksi virus yang ditandai dengan demam tinggi, batuk, pilek, mata merah, dan ruam merah di kulit.",
+            "recommendations": [
+                "Istirahat total dan minum banyak cairan",
+                "Kompres hangat untuk menurunkan demam",
+                "Hindari kontak dengan orang lain untuk mencegah penularan",
+                "Gunakan obat penurun panas jika diperlukan",
+                "Segera ke dokter jika muncul sesak napas atau kejang"
+            ]
+        },
+        "Cacar Air": {
+            "description": "Infeksi virus varicella-zoster yang menyebabkan ruam berisi cairan dan sangat gatal di seluruh tubuh.",
+            "recommendations": [
+                "Jaga kebersihan kulit dan hindari menggaruk ruam",
+                "Gunakan losion calamine untuk mengurangi gatal",
+                "Istirahat cukup dan minum banyak cairan",
+                "Gunakan obat penurun demam jika diperlukan",
+                "Segera ke dokter jika ruam terinfeksi atau demam tinggi"
+            ]
+        },
+        "Hepatitis A": {
+            "description": "Infeksi hati akibat virus hepatitis A yang ditandai dengan mual, muntah, demam, kulit dan mata menguning, serta urine gelap.",
+            "recommendations": [
+                "Istirahat total dan konsumsi makanan bergizi",
+                "Minum banyak cairan untuk mencegah dehidrasi",
+                "Hindari makanan berlemak dan alkohol",
+                "Cuci tangan sebelum makan dan setelah dari toilet",
+                "Segera ke dokter jika gejala memburuk"
+            ]
+        },
+        "Anemia": {
+            "description": "Kondisi kekurangan sel darah merah atau hemoglobin yang menyebabkan lemas, pucat, dan mudah lelah.",
+            "recommendations": [
+                "Konsumsi makanan kaya zat besi seperti daging merah, hati, dan sayuran hijau",
+                "Minum suplemen zat besi jika diresepkan dokter",
+                "Istirahat cukup dan hindari aktivitas berat",
+                "Segera ke dokter jika sering pingsan atau sesak napas berat"
+            ]
+        },
+        "Vertigo": {
+            "description": "Gangguan keseimbangan yang menyebabkan sensasi berputar, mual, muntah, dan sulit berdiri.",
+            "recommendations": [
+                "Duduk atau berbaring segera saat vertigo menyerang",
+                "Hindari gerakan kepala mendadak",
+                "Minum obat anti-mual jika diresepkan dokter",
+                "Konsultasikan ke dokter jika vertigo sering kambuh"
+            ]
+        },
+        "Bronkitis": {
+            "description": "Peradangan pada saluran bronkus paru-paru yang menyebabkan batuk berdahak, sesak napas, dan demam ringan.",
+            "recommendations": [
+                "Istirahat cukup dan minum air hangat",
+                "Hindari asap rokok dan polusi",
+                "Gunakan obat batuk sesuai anjuran dokter",
+                "Segera ke dokter jika batuk berdarah atau sesak berat"
+            ]
+        },
+        "Pneumonia": {
+            "description": "Infeksi paru-paru yang menyebabkan demam tinggi, batuk berdahak, sesak napas, dan nyeri dada.",
+            "recommendations": [
+                "Segera periksakan diri ke dokter untuk pengobatan antibiotik",
+                "Istirahat total dan minum banyak cairan",
+                "Gunakan obat penurun demam jika diperlukan",
+                "Pantau pernapasan dan segera ke IGD jika sesak berat"
+            ]
+        },
+        "Demam Scarlet": {
+            "description": "Infeksi bakteri Streptococcus yang menyebabkan demam, ruam merah, sakit tenggorokan, dan lidah merah.",
+            "recommendations": [
+                "Segera ke dokter untuk mendapatkan antibiotik",
+                "Istirahat cukup dan minum banyak cairan",
+                "Konsumsi makanan lunak jika tenggorokan sakit",
+                "Pantau ruam dan suhu tubuh"
+            ]
+        },
+        "COVID-19": {
+            "description": "Penyakit infeksi saluran pernapasan akibat virus corona, gejala utama: demam, batuk, sesak napas, hilang penciuman.",
+            "recommendations": [
+                "Lakukan isolasi mandiri minimal 5 hari",
+                "Gunakan masker dan jaga jarak dengan orang lain",
+                "Minum banyak cairan dan istirahat cukup",
+                "Segera ke dokter jika sesak napas berat atau saturasi oksigen turun",
+                "Pantau suhu tubuh dan gejala lain secara berkala"
+            ]
+        },
+        "Tidak diketahui": {
+            "description": "Berdasarkan gejala yang diberikan, tidak dapat dipastikan diagnosis yang tepat. Ini bisa disebabkan oleh berbagai faktor seperti gejala yang tidak spesifik, atau kondisi yang jarang terjadi.",
+            "recommendations": [
+                "Konsultasikan dengan dokter untuk pemeriksaan lebih lanjut dan diagnosis yang tepat",
+                "Catat semua gejala yang dialami secara detail, termasuk kapan mulai terjadi dan apa yang memperburuk atau meringankan gejala",
+                "Hindari mendiagnosis sendiri dan mengobati diri tanpa petunjuk medis",
+                "Prioritaskan istirahat dan jaga kesehatan secara umum sambil menunggu konsultasi medis",
+                "Jika gejala semakin parah, segera cari bantuan medis darurat"
+            ]
+        }
+    }
+
+def _create_sample_faq():
+    """Contoh data FAQ: FAQ umum dan gejala tambahan per penyakit"""
+    return {
+        "umum": {
+            "demam tinggi lebih dari 3 hari": "Jika demam tinggi berlangsung lebih dari 3 hari, segera periksakan diri ke dokter untuk evaluasi lebih lanjut. Demam berkepanjangan bisa menjadi tanda infeksi serius seperti tipes, demam berdarah, atau infeksi lainnya. Sambil menunggu pemeriksaan dokter, Anda dapat mengompres dengan air hangat dan minum obat penurun panas sesuai dosis.",
+            "sakit kepala terus menerus": "Sakit kepala terus-menerus yang tidak kunjung mereda bisa disebabkan oleh berbagai hal, seperti migrain, ketegangan otot, sinusitis, atau masalah yang lebih serius. Penting untuk periksakan diri ke dokter jika sakit kepala berlangsung lebih dari 2-3 hari, sangat parah, atau disertai dengan gejala seperti demam, kaku leher, atau muntah.",
+            "batuk tidak sembuh sembuh": "Batuk yang tidak kunjung sembuh selama lebih dari 2-3 minggu memerlukan perhatian medis. Hal ini bisa menjadi tanda infeksi paru-paru, asma, refluks asam, alergi, atau kondisi lain yang memerlukan penanganan khusus. Jika batuk disertai dengan dahak berdarah, sesak napas, atau demam, segera periksakan diri ke dokter.",
+            "mual dan muntah berhari hari": "Mual dan muntah yang berlangsung berhari-hari dapat menyebabkan dehidrasi dan gangguan elektrolit. Kondisi ini bisa disebabkan oleh infeksi virus, keracunan makanan, migren, gangguan pencernaan, atau masalah kesehatan lainnya. Jika muntah berlangsung lebih dari 2 hari atau disertai nyeri perut hebat, segera periksakan diri ke dokter. Pastikan tetap terhidrasi dengan minum cairan secara perlahan.",
+            "diare lebih dari 3 hari": "Diare yang berlangsung lebih dari 3 hari berisiko menyebabkan dehidrasi dan memerlukan penanganan medis. Kondisi ini bisa disebabkan oleh infeksi bakteri/virus, parasit, intoleransi makanan, atau gangguan pencernaan lainnya. Penting untuk minum banyak cairan (oralit), menghindari makanan yang sulit dicerna, dan periksakan diri ke dokter, terutama jika disertai dengan demam tinggi, darah dalam tinja, atau nyeri perut hebat."
+        },
+        "gejala_tambahan": {
+            "Flu": [
+                "batuk pilek",
+                "hidung tersumbat",
+                "bersin-bersin",
+                "sakit tenggorokan",
+                "demam",
+                "nyeri otot"
+            ],
+            "Demam Berdarah": [
+                "demam tinggi mendadak",
+                "nyeri di belakang mata",
+                "nyeri sendi dan otot",
+                "ruam merah",
+                "mimisan",
+                "nyeri kepala berat"
+            ],
+            "Tipes": [
+                "demam tinggi bertahap",
+                "nafsu makan menurun",
+                "sakit perut",
+                "sembelit atau diare",
+                "lidah berselaput putih",
+                "lemas"
+            ],
+            "TBC": [
+                "batuk lebih dari 2 minggu",
+                "batuk darah",
+                "nyeri dada",
+                "keringat malam",
+                "berat badan turun",
+                "sesak napas"
+            ],
+            "Maag": [
+                "nyeri ulu hati",
+                "perut kembung",
+                "sendawa berlebihan",
+                "mual",
+                "cepat kenyang",
+                "muntah"
+            ],
+            "Asma": [
+                "sesak napas",
+                "napas berbunyi",
+                "batuk-batuk",
+                "dada terasa berat",
+                "kesulitan bernapas",
+                "batuk malam hari"
+            ],
+            "Migrain": [
+                "sakit kepala berdenyut",
+                "mual",
+                "muntah",
+                "sensitif terhadap cahaya",
+                "sensitif terhadap suara",
+                "pusing"
+            ],
+            "Diare": [
+                "BAB cair lebih dari 3 kali sehari",
+                "kram perut",
+                "mual",
+                "muntah",
+                "demam ringan",
+                "dehidrasi"
+            ],
+            "Hipertensi": [
+                "sakit kepala",
+                "jantung berdebar",
+                "pusing",
+                "telinga berdenging",
+                "sesak napas",
+                "wajah kemerahan"
+            ],
+            "Diabetes": [
+                "sering buang air kecil",
+                "selalu haus",
+                "selalu lapar",
+                "berat badan turun",
+                "luka lambat sembuh",
+                "pandangan kabur"
+            ]
+        }
+    }
@@ -0,0 +1,154 @@
+"""
+Pencarian hyperparameter yang memakai ulang matriks TF-IDF antar kandidat
+"""
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import ParameterGrid, StratifiedKFold
+from scipy.sparse import vstack
+
+from utils.corpus_cache import text_digest, content_key, load_matrix, save_matrix
+
+def _take(X, indices):
+    """Mengambil baris X berdasarkan indeks (pandas Series atau list)"""
+    if hasattr(X, 'iloc'):
+        return X.iloc[indices]
+    return [X[i] for i in indices]
+
+def _evaluate_fold(pipeline, vectorizer_params, classifier_params_list, X, y, train_idx, val_idx, matrix_path=None):
+    """
+    Melatih vectorizer sekali untuk satu fold, lalu menilai semua parameter
+    classifier pada matriks fitur yang sama. Jika matrix_path diberikan,
+    matriks fold dimuat dari cache .npz atau disimpan ke sana setelah dihitung.
+
+    Returns
+    -------
+    list of float
+        Akurasi validasi untuk setiap parameter classifier
+    """
+    _, vectorizer = pipeline.steps[0]
+    _, classifier = pipeline.steps[-1]
+
+    cached = load_matrix(matrix_path) if matrix_path else None
+    if cached is not None:
+        X_train, X_val = cached[:len(train_idx)], cached[len(train_idx):]
+    else:
+        vectorizer = clone(vectorizer).set_params(**vectorizer_params)
+        X_train = vectorizer.fit_transform(_take(X, train_idx))
+        X_val = vectorizer.transform(_take(X, val_idx))
+        if matrix_path:
+            save_matrix(matrix_path, vstack([X_train, X_val], format='csr'))
+    y_train, y_val = y[train_idx], y[val_idx]
+
+    scores = []
+    for classifier_params in classifier_params_list:
+        model = clone(classifier).set_params(**classifier_params).fit(X_train, y_train)
+        scores.append(accuracy_score(y_val, model.predict(X_val)))
+    return scores
+
+class CachedGridSearchCV:
+    """
+    Grid search untuk pipeline dua langkah (vectorizer -> classifier) dengan hasil
+    yang sama seperti GridSearchCV(cv=5, scoring='accuracy'): fold, skor rata-rata
+    dan pemilihan kandidat terbaik (kandidat pertama bila skor sama) identik.
+
+    Bedanya, vectorizer hanya dilatih sekali per kombinasi parameter vectorizer
+    dan fold; semua parameter classifier dinilai pada matriks yang sama. Dengan
+    matrix_cache (CorpusCache), matriks fold disimpan sebagai .npz dengan kunci
+    hash parameter vectorizer dan teks fold, sehingga pencarian ulang pada data
+    yang sama tidak melatih vectorizer lagi.
+    """
+
+    def __init__(self, pipeline, param_grid, cv=5, n_jobs=None, verbose=0, matrix_cache=None):
+        self.pipeline = pipeline
+        self.param_grid = param_grid
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.verbose = verbose
+        self.matrix_cache = matrix_cache
+
+    def fit(self, X, y):
+        """
+        Menjalankan pencarian lalu melatih ulang kandidat terbaik pada seluruh data
+
+        Parameters
+        ----------
+        X : array-like of str
+            Teks training
+        y : array-like
+            Label kelas
+
+        Returns
+        -------
+        CachedGridSearchCV
+            Objek ini sendiri
+        """
+        y = np.asarray(y)
+        vectorizer_prefix = self.pipeline.steps[0][0] + '__'
+        classifier_prefix = self.pipeline.steps[-1][0] + '__'
+
+        # Urutan kandidat sama dengan GridSearchCV; kelompokkan berdasarkan parameter vectorizer
+        candidates = list(ParameterGrid(self.param_grid))
+        groups = {}
+        for candidate_idx, params in enumerate(candidates):
+            vectorizer_params = tuple(sorted(
+                (key[len(vectorizer_prefix):], value) for key, value in params.items()
+                if key.startswith(vectorizer_prefix)
+            ))
+            classifier_params = {
+                key[len(classifier_prefix):]: value for key, value in params.items()
+                if key.startswith(classifier_prefix)
+            }
+            if len(vectorizer_params) + len(classifier_params) != len(params):
+                raise ValueError("CachedGridSearchCV hanya mendukung parameter langkah pertama dan terakhir pipeline")
+            groups.setdefault(vectorizer_params, []).append((candidate_idx, classifier_params))
+
+        folds = list(StratifiedKFold(n_splits=self.cv).split(np.zeros(len(y)), y))
+        if self.verbose:
+            print(f"Fitting {len(folds)} folds for each of {len(candidates)} candidates, "
+                  f"vectorizer dilatih {len(groups) * len(folds)} kali")
+
+        tasks = [(vectorizer_params, members, fold_idx, train_idx, val_idx)
+                 for vectorizer_params, members in groups.items()
+                 for fold_idx, (train_idx, val_idx) in enumerate(folds)]
+
+        matrix_paths = [None] * len(tasks)
+        if self.matrix_cache is not None:
+            # Kunci matriks: kelas dan parameter lengkap vectorizer, lalu hash teks baris training dan validasi
+            digests = [text_digest(text) for text in X]
+            vectorizer = self.pipeline.steps[0][1]
+            for i, (vectorizer_params, _, _, train_idx, val_idx) in enumerate(tasks):
+                params = clone(vectorizer).set_params(**dict(vectorizer_params)).get_params()
+                key = content_key(
+                    type(vectorizer).__name__, sorted(params.items()),
+                    [digests[j] for j in train_idx], [digests[j] for j in val_idx]
+                )
+                matrix_paths[i] = self.matrix_cache.matrix_path(key)
+
+        fold_scores = Parallel(n_jobs=self.n_jobs)(
+            delayed(_evaluate_fold)(
+                self.pipeline, dict(vectorizer_params), [params for _, params in members],
+                X, y, train_idx, val_idx, matrix_path
+            )
+            for (vectorizer_params, members, fold_idx, train_idx, val_idx), matrix_path in zip(tasks, matrix_paths)
+        )
+
+        scores = np.zeros((len(candidates), len(folds)))
+        for (vectorizer_params, members, fold_idx, _, _), task_scores in zip(tasks, fold_scores):
+            for (candidate_idx, _), score in zip(members, task_scores):
+                scores[candidate_idx, fold_idx] = score
+
+        # Rata-rata skor dan pemilihan kandidat terbaik seperti GridSearchCV
+        mean_scores = np.average(scores, axis=1)
+        self.best_index_ = int(np.argmax(mean_scores))
+        self.best_score_ = mean_scores[self.best_index_]
+        self.best_params_ = candidates[self.best_index_]
+        self.cv_results_ = {
+            'params': candidates,
+            'mean_test_score': mean_scores,
+            'std_test_score': np.std(scores, axis=1)
+        }
+
+        self.best_estimator_ = clone(self.pipeline).set_params(**self.best_params_).fit(X, y)
+        return self
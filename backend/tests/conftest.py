@@ -0,0 +1,25 @@
+"""
+Konfigurasi pytest: modul backend (utils, models, app) diimpor seperti saat
+aplikasi dijalankan dari folder backend, dan test yang ditandai slow hanya
+dijalankan dengan opsi --runslow
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def pytest_addoption(parser):
+    parser.addoption('--runslow', action='store_true', default=False, help='Jalankan juga test yang ditandai slow')
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: test lama (misalnya korpus jutaan baris), jalankan dengan --runslow')
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--runslow'):
+        return
+    skip_slow = pytest.mark.skip(reason='test lama, jalankan dengan --runslow')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
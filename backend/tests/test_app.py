@@ -0,0 +1,112 @@
+"""
+Test endpoint Flask. Aplikasi diimpor dalam mode offline dari folder sementara
+(data contoh dibuat otomatis), lalu model kecil dilatih sekali untuk semua test.
+"""
+import importlib
+import os
+
+import pytest
+
+import models.classifier
+from models.classifier import DiseaseClassifier
+
+@pytest.fixture(scope='module')
+def flask_app(tmp_path_factory):
+    """Modul app dengan model yang dilatih dari data contoh"""
+    workdir = tmp_path_factory.mktemp('app')
+    old_cwd = os.getcwd()
+    old_env = {key: os.environ.get(key) for key in ('TANYASEHAT_OFFLINE', 'TANYASEHAT_KB_POLL_INTERVAL')}
+    os.chdir(workdir)
+    os.environ['TANYASEHAT_OFFLINE'] = '1'
+    os.environ['TANYASEHAT_KB_POLL_INTERVAL'] = '0'
+    try:
+        app = importlib.import_module('app')
+
+        classifier = DiseaseClassifier()
+        classifier.n_jobs = 1
+        classifier.corpus_cache_dir = None
+        classifier.train()
+        app.disease_classifier = classifier
+        app.model_ready = True
+        yield app
+    finally:
+        os.chdir(old_cwd)
+        for key, value in old_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+@pytest.fixture
+def preprocess_calls(flask_app, monkeypatch):
+    """Mencatat setiap teks yang dipreprocessing oleh app dan classifier"""
+    calls = []
+
+    def counted_document(function):
+        def wrapper(text):
+            calls.append(text)
+            return function(text)
+        return wrapper
+
+    def counted_texts(function):
+        def wrapper(texts, *args, **kwargs):
+            texts = list(texts)
+            calls.extend(texts)
+            return function(texts, *args, **kwargs)
+        return wrapper
+
+    for module in (flask_app, models.classifier):
+        if hasattr(module, 'preprocess_document'):
+            monkeypatch.setattr(module, 'preprocess_document', counted_document(module.preprocess_document))
+        if hasattr(module, 'preprocess_texts'):
+            monkeypatch.setattr(module, 'preprocess_texts', counted_texts(module.preprocess_texts))
+    return calls
+
+def test_predict_preprocesses_once(flask_app, preprocess_calls):
+    """/api/predict mempreprocessing teks input tepat satu kali"""
+    text = 'Saya demam tinggi, sakit kepala dan nyeri sendi sejak 3 hari'
+    response = flask_app.app.test_client().post('/api/predict', json={'text': text})
+
+    assert response.status_code == 200
+    assert 'prediction' in response.get_json()
+    assert preprocess_calls == [text]
+
+def test_predict_batch_preprocesses_once_per_item(flask_app, preprocess_calls):
+    """/api/predict/batch mempreprocessing setiap item valid tepat satu kali"""
+    texts = [
+        'Saya demam tinggi dan nyeri sendi',
+        'Batuk berdahak dan sesak napas',
+        'xyzzy qwerty',
+    ]
+    items = texts + [{'text': 'Diare dan sakit perut'}, {'bukan_text': 1}]
+    response = flask_app.app.test_client().post('/api/predict/batch', json=items)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert len(results) == len(items)
+    assert 'error' in results[-1]
+    assert sorted(preprocess_calls) == sorted(texts + ['Diare dan sakit perut'])
+
+def test_predict_batch_isolates_item_failures(flask_app, monkeypatch):
+    """Satu item yang gagal diprediksi tidak menggagalkan seluruh batch"""
+    classifier = flask_app.disease_classifier
+    predict = classifier.predict
+
+    def failing_batch(texts):
+        raise RuntimeError('batch gagal')
+
+    def failing_predict(text):
+        if text == 'item rusak':
+            raise RuntimeError('item gagal')
+        return predict(text)
+
+    monkeypatch.setattr(classifier, 'predict_batch', failing_batch)
+    monkeypatch.setattr(classifier, 'predict', failing_predict)
+    items = ['Saya demam tinggi dan nyeri sendi', 'item rusak', 'Batuk berdahak dan sesak napas']
+    response = flask_app.app.test_client().post('/api/predict/batch', json=items)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert 'prediction' in results[0]
+    assert results[1]['message'] == 'item gagal'
+    assert 'prediction' in results[2]
@@ -0,0 +1,113 @@
+"""
+Test artefak model terkompilasi
+"""
+import json
+import os
+import threading
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import ComplementNB
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+
+from models.artifact import (
+    ARRAY_FILES, MANIFEST_FILENAME, POINTER_FILENAME, VERSION_PREFIX,
+    is_artifact, load_artifact, save_artifact
+)
+from models.compiled_model import CompiledModel
+
+TEXTS = ['demam tinggi nyeri sendi', 'batuk berdahak sesak napas', 'diare sakit perut mual', 'demam ruam kulit']
+LABELS = ['Demam Berdarah', 'Bronkitis', 'Diare', 'Campak']
+
+@pytest.fixture(scope='module')
+def compiled_model():
+    """Model kecil yang dikompilasi dari pipeline TF-IDF + ComplementNB"""
+    pipeline = Pipeline([('tfidf', TfidfVectorizer()), ('clf', ComplementNB())])
+    label_encoder = LabelEncoder()
+    pipeline.fit(TEXTS, label_encoder.fit_transform(LABELS))
+    return CompiledModel.from_pipeline(pipeline, label_encoder.classes_, ())
+
+def versions(artifact_dir):
+    """Direktori versi di dalam artefak"""
+    return sorted(entry for entry in os.listdir(artifact_dir) if entry.startswith(VERSION_PREFIX))
+
+def test_save_publishes_versions_through_pointer(compiled_model, tmp_path):
+    """Setiap penyimpanan menulis versi baru dan hanya menyimpan satu versi sebelumnya"""
+    artifact_dir = str(tmp_path / 'model')
+    expected = compiled_model.predict_proba(TEXTS)
+
+    published = []
+    for _ in range(3):
+        save_artifact(compiled_model, artifact_dir)
+        with open(os.path.join(artifact_dir, POINTER_FILENAME), encoding='utf-8') as f:
+            published.append(f.read())
+
+    assert len(set(published)) == 3
+    assert versions(artifact_dir) == sorted(published[1:])
+    assert is_artifact(artifact_dir)
+    loaded, _ = load_artifact(artifact_dir)
+    np.testing.assert_allclose(loaded.predict_proba(TEXTS), expected)
+
+def test_save_upgrades_legacy_layout(compiled_model, tmp_path):
+    """Artefak format lama tetap dapat dimuat dan diganti dengan format berversi"""
+    artifact_dir = str(tmp_path / 'model')
+    save_artifact(compiled_model, artifact_dir)
+    version_dir = os.path.join(artifact_dir, versions(artifact_dir)[0])
+
+    # Format lama: isi versi langsung di direktori artefak, tanpa CURRENT
+    legacy_dir = str(tmp_path / 'legacy')
+    os.rename(version_dir, legacy_dir)
+    assert is_artifact(legacy_dir)
+    loaded, manifest = load_artifact(legacy_dir)
+    assert manifest['labels'] == sorted(LABELS)
+
+    save_artifact(compiled_model, legacy_dir)
+    assert is_artifact(legacy_dir)
+    assert os.path.isfile(os.path.join(legacy_dir, MANIFEST_FILENAME))  # Masih dipakai sebagai versi sebelumnya
+    save_artifact(compiled_model, legacy_dir)
+    assert sorted(os.listdir(legacy_dir)) == sorted([POINTER_FILENAME] + versions(legacy_dir))
+    assert not any(os.path.exists(os.path.join(legacy_dir, name)) for name in ARRAY_FILES.values())
+
+def test_artifact_always_resolves_during_save(compiled_model, tmp_path):
+    """
+    Pembaca tidak pernah melihat artifact_dir kosong atau setengah jadi selama
+    model disimpan ulang. Seperti di produksi, penyimpanan berikutnya baru
+    dilakukan setelah pembaca sempat memuat artefak sekali.
+    """
+    artifact_dir = str(tmp_path / 'model')
+    save_artifact(compiled_model, artifact_dir)
+
+    stop = threading.Event()
+    reads = [0]
+    read_done = threading.Condition()
+    failures = []
+
+    def reader():
+        while not stop.is_set():
+            try:
+                with open(os.path.join(artifact_dir, POINTER_FILENAME), encoding='utf-8') as f:
+                    version = f.read()
+                with open(os.path.join(artifact_dir, version, MANIFEST_FILENAME), encoding='utf-8') as f:
+                    json.load(f)
+            except (OSError, ValueError) as e:
+                failures.append(e)
+            with read_done:
+                reads[0] += 1
+                read_done.notify_all()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        for _ in range(30):
+            save_artifact(compiled_model, artifact_dir)
+            # Satu pembacaan yang mungkin dimulai sebelum penyimpanan, lalu satu yang dimulai setelahnya
+            with read_done:
+                target = reads[0] + 2
+                assert read_done.wait_for(lambda: reads[0] >= target, timeout=10)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert failures == []
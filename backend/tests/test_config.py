@@ -0,0 +1,18 @@
+"""
+Test pembacaan konfigurasi dari variabel lingkungan
+"""
+import pytest
+
+from utils.config import read_poll_interval
+
+@pytest.mark.parametrize('value, expected', [
+    (None, 2.0), ('', 2.0), ('0', 0.0), ('0.5', 0.5),
+    ('abc', 2.0), ('-1', 2.0), ('nan', 2.0), ('inf', 2.0),
+])
+def test_read_poll_interval(monkeypatch, value, expected):
+    """TANYASEHAT_KB_POLL_INTERVAL yang tidak valid diganti nilai bawaan"""
+    if value is None:
+        monkeypatch.delenv('TANYASEHAT_KB_POLL_INTERVAL', raising=False)
+    else:
+        monkeypatch.setenv('TANYASEHAT_KB_POLL_INTERVAL', value)
+    assert read_poll_interval() == expected
@@ -0,0 +1,80 @@
+"""
+Test mode update inkremental
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import models.classifier
+from models.classifier import DiseaseClassifier
+from models.incremental import IncrementalModel
+
+@pytest.fixture
+def classifier(tmp_path, monkeypatch):
+    """Classifier yang bekerja di folder sementara dengan data contoh"""
+    monkeypatch.chdir(tmp_path)
+    classifier = DiseaseClassifier()
+    classifier.n_jobs = 1
+    classifier.corpus_cache_dir = None
+    return classifier
+
+def test_class_balance_weights_include_new_examples():
+    """Bobot contoh baru = jumlah contoh kelas terbesar / jumlah contoh kelasnya"""
+    model = IncrementalModel(['A', 'B'], n_features=2 ** 10)
+    model.fit(['demam'] * 4 + ['batuk'], ['A'] * 4 + ['B'])
+    np.testing.assert_array_equal(model.class_counts, [4, 1])
+
+    np.testing.assert_allclose(model.class_balance_weights(['B', 'A']), [5 / 2, 1.0])
+    with pytest.raises(ValueError):
+        model.class_balance_weights(['C'])
+
+def test_partial_fit_uses_class_balance_weights(classifier):
+    """partial_fit menambahkan contoh dengan bobot penyeimbang kelas, bukan bobot 1"""
+    classifier.start_incremental()
+    model = classifier._incremental_model
+    disease = model.labels[np.argmin(model.class_counts)]
+    index = list(model.labels).index(disease)
+    expected_weight = model.class_counts.max() / (model.class_counts[index] + 1)
+    class_count = model.clf.class_count_[index]
+
+    classifier.partial_fit(['kulit dan mata kuning, urin gelap'], [disease])
+
+    assert expected_weight > 1
+    assert model.clf.class_count_[index] == pytest.approx(class_count + expected_weight)
+
+def test_start_incremental_uses_loaded_model_params(classifier, tmp_path):
+    """Setelah load_model, n-gram dan alpha diambil dari artefak, bukan dari pipeline bawaan"""
+    classifier.pipeline.set_params(tfidf__ngram_range=(1, 2), clf__alpha=0.7)
+    classifier.start_incremental()
+    model_path = classifier.save_model(str(tmp_path / 'model'))
+
+    loaded = DiseaseClassifier()
+    loaded.n_jobs = 1
+    assert loaded.pipeline.get_params()['tfidf__ngram_range'] == (1, 3)
+    loaded.load_model(model_path)
+    loaded.start_incremental()
+
+    featurizer = loaded._incremental_model.featurizer
+    assert (featurizer.min_n, featurizer.max_n) == (1, 2)
+    assert loaded._incremental_model.clf.alpha == pytest.approx(0.7)
+
+@pytest.mark.parametrize('parquet', [False, True])
+def test_rebuild_creates_csv_with_header(classifier, monkeypatch, parquet):
+    """rebuild menulis CSV baru lengkap dengan header dan data yang sudah ada, lalu contoh baru"""
+    if parquet and not models.classifier.PARQUET_AVAILABLE:
+        pytest.skip('pyarrow tidak terpasang')
+    monkeypatch.setattr(models.classifier, 'PARQUET_AVAILABLE', parquet)
+    monkeypatch.setattr(classifier, 'train', lambda: 1.0)
+
+    # Tanpa CSV: dengan pyarrow hanya file Parquet yang tersisa, tanpa pyarrow data contoh dibuat ulang
+    existing = classifier.load_data()
+    os.remove(classifier.data_path)
+    classifier.pending_examples = [('kulit dan mata kuning, urin gelap', 'Hepatitis A')]
+    classifier.rebuild()
+
+    data = pd.read_csv(classifier.data_path)
+    assert list(data.columns) == ['symptoms', 'disease']
+    assert len(data) == len(existing) + 1
+    assert data.iloc[-1].tolist() == ['kulit dan mata kuning, urin gelap', 'Hepatitis A']
@@ -0,0 +1,26 @@
+"""
+Test basis pengetahuan dan pemuatan ulang otomatis
+"""
+import json
+
+from models.knowledge_base import KnowledgeBaseWatcher
+
+def test_watcher_does_not_reload_created_sample_files(tmp_path):
+    """File data contoh yang dibuat saat inisialisasi tidak memicu pemuatan ulang pertama"""
+    watcher = KnowledgeBaseWatcher(str(tmp_path / 'diseases.json'), str(tmp_path / 'faq.json'), poll_interval=None)
+
+    assert watcher.check() is None
+    assert watcher.reloads == 0
+
+def test_watcher_reloads_changed_file(tmp_path):
+    """Perubahan file setelah inisialisasi dimuat ulang ke snapshot baru"""
+    diseases_path = tmp_path / 'diseases.json'
+    watcher = KnowledgeBaseWatcher(str(diseases_path), str(tmp_path / 'faq.json'), poll_interval=None)
+
+    diseases = json.loads(diseases_path.read_text(encoding='utf-8'))
+    diseases['Penyakit Uji'] = {'description': 'Deskripsi uji', 'recommendations': ['Istirahat']}
+    diseases_path.write_text(json.dumps(diseases), encoding='utf-8')
+    watcher.check().join()
+
+    assert watcher.reloads == 1
+    assert watcher.current().knowledge_base.disease('Penyakit Uji').description == 'Deskripsi uji'
@@ -0,0 +1,66 @@
+"""
+Test preprocessing teks
+"""
+import time
+
+import pytest
+
+from utils.preprocessor import clean_text
+
+# Keluaran clean_text versi awal (beberapa regex.sub berurutan) sebelum diganti
+# dengan satu normalizer terkompilasi. Tabel ini dibekukan dan tidak boleh
+# diperbarui dari implementasi saat ini; jika berbeda, perilaku preprocessing
+# berubah dan model yang sudah dilatih tidak lagi sesuai.
+BASELINE_CLEAN_TEXT = [
+    ('Saya demam tinggi sejak 3 hari', 'saya demam tinggi sejak num hari'),
+    ('Demam 39 derajat, batuk & pilek!!!', 'demam num derajat batuk pilek'),
+    ('Mulai sakit tgl 12/05/2024 dan 1-2-24', 'mulai sakit tgl date dan date'),
+    ('Tanggal 31-12-99, suhu 38.5 C', 'tanggal date suhu num num c'),
+    ('Tanggal 123/45/6789 bukan tanggal', 'tanggal num num num bukan tanggal'),
+    ('Angka2 nempel: 3hari, hari3, 10x sehari', 'angka2 nempel 3hari hari3 10x sehari'),
+    ('Cek https://example.com/page?id=5 atau www.sehat.id 12', 'cek num atau num'),
+    ('URL diikuti angka http://a.b/c 7 hari', 'url diikuti angka num hari'),
+    ('<b>Sakit kepala</b> dan <a href="http://x.y/1">mual</a>', 'sakit kepala dan mual'),
+    ('Tag <tidak tertutup dan 5 gejala', 'tag tidak tertutup dan num gejala'),
+    ('Pusing 😷🤒 sejak kemarin', 'pusing sejak kemarin'),
+    ('Café naïve résumé — nyeri', 'cafe naive resume nyeri'),
+    ('   spasi    berlebih\t\tdan\nbaris baru  ', 'spasi berlebih dan baris baru'),
+    ('snake_case_token dan under_score', 'snake_case_token dan under_score'),
+    ('Ruam-ruam merah di kulit', 'ruam ruam merah di kulit'),
+    ('', ''),
+    ('123', 'num'),
+    ('12/12/2012', 'date'),
+    ('HTTP://UPPER.CASE/URL dan Nyeri', 'dan nyeri'),
+    ('Batuk (berdahak) [2 minggu] {kadang} berdarah?', 'batuk berdahak num minggu kadang berdarah'),
+    ('Nilai 1,000 dan 2.5 mg/dL', 'nilai num num dan num num mg dl'),
+    ('demam#pilek@batuk$nyeri%mual^', 'demam pilek batuk nyeri mual'),
+    ('ℌ𝔢𝔩𝔩𝔬 ① ② ³', 'hello num num num'),
+    ('a<b>c<d', 'ac d'),
+    ('www.no-number.com/123 angka', 'num angka'),
+    ('a<b<c>d', 'ad'),
+    ('Nyeri < 3 hari dan demam > 38', 'nyeri num'),
+    ('<b\n>batuk</b>', 'b batuk'),
+    ('< a < b < c', 'a b c'),
+]
+
+@pytest.mark.parametrize('text, expected', BASELINE_CLEAN_TEXT)
+def test_clean_text_matches_baseline(text, expected):
+    """clean_text memberi hasil yang sama dengan implementasi awal"""
+    assert clean_text(text) == expected
+
+def test_clean_text_long_input():
+    """Input panjang tetap dinormalkan sama seperti potongan-potongannya"""
+    chunk = 'Demam 39 derajat sejak 12/05/2024, lihat https://example.com/a <b>batuk</b>! '
+    assert clean_text(chunk * 500) == ' '.join([clean_text(chunk)] * 500)
+
+@pytest.mark.parametrize('unit', ['< a ', '<', '<\n', '<<>', '1/2/', 'http://', '-!?'])
+def test_clean_text_adversarial_input_is_linear(unit):
+    """
+    Input 64 KB yang menjadi kasus terburuk pola normalizer (misalnya '<' tanpa
+    '>') tetap diproses dalam waktu linear. Implementasi awal dan normalizer
+    dengan lookahead URL per karakter membutuhkan puluhan detik untuk '< a '.
+    """
+    text = (unit * (65536 // len(unit) + 1))[:65536]
+    start = time.perf_counter()
+    clean_text(text)
+    assert time.perf_counter() - start < 1.0
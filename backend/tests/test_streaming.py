@@ -0,0 +1,112 @@
+"""
+Test pelatihan streaming (train_streaming)
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import models.classifier
+import utils.preprocessor
+from models.classifier import DiseaseClassifier
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORDS = ['demam', 'batuk', 'pilek', 'nyeri', 'sendi', 'mual', 'muntah', 'diare',
+         'ruam', 'kulit', 'pusing', 'sesak', 'napas', 'perut', 'kepala', 'lemas']
+DISEASES = ['Flu', 'Diare', 'Campak', 'Asma', 'Tifus']
+
+# Melatih model streaming di proses terpisah dan mencetak RSS puncak proses tersebut
+PEAK_RSS_SCRIPT = """
+import resource, sys
+sys.path.insert(0, sys.argv[1])
+from models.classifier import DiseaseClassifier
+classifier = DiseaseClassifier()
+classifier.n_jobs = 1
+classifier.data_path = sys.argv[2]
+classifier.train_streaming()
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def write_corpus(path, n_rows, seed=0, block=100000):
+    """Menulis korpus sintetis n_rows baris ke CSV per blok, tanpa menyimpan seluruh korpus di memori"""
+    rng = np.random.default_rng(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('symptoms,disease\n')
+        for block_start in range(0, n_rows, block):
+            n = min(block, n_rows - block_start)
+            words = rng.integers(0, len(WORDS), (n, 4))
+            labels = rng.integers(0, len(DISEASES), n)
+            f.write(''.join(
+                f"{' '.join(WORDS[w] for w in row)},{DISEASES[label]}\n" for row, label in zip(words, labels)
+            ))
+    return str(path)
+
+def peak_rss_mb(data_path):
+    """RSS puncak (MB) proses yang melatih model streaming dari data_path"""
+    output = subprocess.run(
+        [sys.executable, '-c', PEAK_RSS_SCRIPT, BACKEND_DIR, data_path],
+        check=True, capture_output=True, text=True
+    ).stdout
+    # ru_maxrss dalam KB di Linux dan dalam byte di macOS
+    peak = int(output.strip().splitlines()[-1])
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+@pytest.mark.parametrize('n_rows', [200000, pytest.param(2000000, marks=pytest.mark.slow)])
+def test_train_streaming_peak_memory_is_bounded(tmp_path, n_rows):
+    """Memori puncak tidak bertambah dengan ukuran korpus (dibandingkan korpus 20.000 baris)"""
+    pytest.importorskip('resource')
+    small = peak_rss_mb(write_corpus(tmp_path / 'small.csv', 20000))
+    large = peak_rss_mb(write_corpus(tmp_path / 'large.csv', n_rows))
+
+    assert large - small < 10, f"RSS puncak {small:.1f} MB -> {large:.1f} MB untuk {n_rows} baris"
+
+def test_train_streaming_preprocesses_each_row_once_with_one_pool(tmp_path, monkeypatch):
+    """Setiap baris dipreprocessing sekali, memakai satu process pool untuk seluruh korpus"""
+    data_path = write_corpus(tmp_path / 'corpus.csv', 2000)
+    pools = []
+    per_call_pools = []
+    preprocessed = []
+
+    def counting_pool(function, calls):
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return function(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(models.classifier, 'ProcessPoolExecutor', counting_pool(models.classifier.ProcessPoolExecutor, pools))
+    monkeypatch.setattr(utils.preprocessor, 'ProcessPoolExecutor', counting_pool(utils.preprocessor.ProcessPoolExecutor, per_call_pools))
+    preprocess_texts = models.classifier.preprocess_texts
+
+    def counted_preprocess_texts(texts, *args, **kwargs):
+        preprocessed.extend(texts)
+        return preprocess_texts(texts, *args, **kwargs)
+
+    monkeypatch.setattr(models.classifier, 'preprocess_texts', counted_preprocess_texts)
+
+    classifier = DiseaseClassifier()
+    classifier.n_jobs = 2
+    classifier.data_path = data_path
+    classifier.streaming_chunksize = 300
+    classifier.train_streaming()
+
+    assert len(pools) == 1
+    assert per_call_pools == []
+    assert len(preprocessed) == 2000
+
+def test_train_streaming_matches_serial(tmp_path):
+    """Hasil dengan process pool sama dengan preprocessing di proses utama"""
+    data_path = write_corpus(tmp_path / 'corpus.csv', 3000, seed=1)
+    results = []
+    for n_jobs in (1, 2):
+        classifier = DiseaseClassifier()
+        classifier.n_jobs = n_jobs
+        classifier.data_path = data_path
+        classifier.streaming_chunksize = 700
+        accuracy = classifier.train_streaming()
+        results.append((accuracy, classifier._incremental_model.clf.feature_log_prob_))
+
+    assert results[0][0] == results[1][0]
+    np.testing.assert_array_equal(results[0][1], results[1][1])
@@ -0,0 +1,36 @@
+"""
+Pembacaan konfigurasi aplikasi dari variabel lingkungan
+"""
+import os
+import math
+
+DEFAULT_KB_POLL_INTERVAL = 2.0
+
+def read_poll_interval(default=DEFAULT_KB_POLL_INTERVAL):
+    """
+    Membaca jeda pemeriksaan perubahan data/diseases.json dan data/faq.json dari
+    TANYASEHAT_KB_POLL_INTERVAL (detik, 0 menonaktifkan pemuatan ulang). Nilai
+    yang bukan angka atau negatif diganti nilai bawaan dengan peringatan, agar
+    salah konfigurasi tidak menggagalkan startup.
+    
+    Parameters
+    ----------
+    default : float
+        Jeda yang dipakai jika variabel tidak diisi atau tidak valid
+    
+    Returns
+    -------
+    float
+        Jeda pemeriksaan dalam detik
+    """
+    value = os.environ.get('TANYASEHAT_KB_POLL_INTERVAL')
+    if value is None or not value.strip():
+        return default
+    try:
+        interval = float(value)
+    except ValueError:
+        interval = -1.0
+    if not math.isfinite(interval) or interval < 0:
+        print(f"Peringatan: TANYASEHAT_KB_POLL_INTERVAL={value!r} tidak valid, memakai {default:g} detik")
+        return default
+    return interval
@@ -0,0 +1,184 @@
+"""
+Cache on-disk berbasis isi (content-addressed) untuk teks terproses dan matriks fitur
+"""
+import os
+import json
+import hashlib
+from scipy.sparse import load_npz, save_npz
+
+from utils.preprocessor import PREPROCESSOR_VERSION, preprocess_texts
+
+PROCESSED_FILENAME = 'processed_texts.json'
+MATRIX_DIRNAME = 'matrices'
+
+def text_digest(text):
+    """Hash SHA-1 dari teks mentah"""
+    return hashlib.sha1(str(text).encode('utf-8')).hexdigest()
+
+def content_key(*parts):
+    """
+    Kunci cache dari beberapa bagian isi (misalnya parameter dan daftar hash teks)
+    
+    Parameters
+    ----------
+    *parts : object
+        Bagian-bagian yang menentukan isi; list/tuple di-hash per elemen
+    
+    Returns
+    -------
+    str
+        Hash SHA-1 heksadesimal
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        items = part if isinstance(part, (list, tuple)) else (part,)
+        for item in items:
+            digest.update(repr(item).encode('utf-8'))
+            digest.update(b'\0')
+        digest.update(b'\1')
+    return digest.hexdigest()
+
+class CorpusCache:
+    """
+    Cache teks terproses per baris dan matriks fitur sparse (.npz) di disk.
+    
+    Teks terproses dikunci dengan hash teks mentah dalam ruang nama versi
+    preprocessor (PREPROCESSOR_VERSION); jika stopwords, tabel normalisasi atau
+    stemmer berubah seluruh entri lama otomatis tidak dipakai. Matriks disimpan
+    dengan kunci hash isi dari parameter dan teks yang membentuknya.
+    """
+    
+    def __init__(self, cache_dir, version=PREPROCESSOR_VERSION):
+        """
+        Inisialisasi cache
+        
+        Parameters
+        ----------
+        cache_dir : str
+            Direktori cache
+        version : str
+            Versi preprocessor yang menjadi ruang nama teks terproses
+        """
+        self.cache_dir = cache_dir
+        self.version = version
+        self.matrix_dir = os.path.join(cache_dir, MATRIX_DIRNAME)
+        self._entries = None
+        # Kunci yang dipakai sejak cache dibuat; entri lain dibuang saat save()
+        self._used_texts = set()
+        self._used_matrices = set()
+    
+    def _load_entries(self):
+        """Memuat entri teks terproses dari disk (sekali)"""
+        if self._entries is None:
+            self._entries = {}
+            path = os.path.join(self.cache_dir, PROCESSED_FILENAME)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                if stored.get('version') == self.version:
+                    self._entries = stored.get('entries', {})
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+        return self._entries
+    
+    def preprocess(self, texts, n_jobs=None):
+        """
+        Preprocessing dengan cache: hanya teks yang belum pernah diproses (dengan
+        versi preprocessor yang sama) yang dijalankan melalui preprocess_texts
+        
+        Parameters
+        ----------
+        texts : iterable of str
+            Teks mentah
+        n_jobs : int or None
+            Jumlah proses worker untuk teks yang belum ada di cache
+        
+        Returns
+        -------
+        list of str
+            Teks terproses, dengan urutan yang sama seperti input
+        """
+        texts = list(texts)
+        entries = self._load_entries()
+        keys = [text_digest(text) for text in texts]
+        
+        missing = {key: text for key, text in zip(keys, texts) if key not in entries}
+        if missing:
+            processed = preprocess_texts(list(missing.values()), n_jobs=n_jobs)
+            entries.update(zip(missing.keys(), processed))
+        self._used_texts.update(keys)
+        
+        print(f"Cache preprocessing: {len(texts) - len(missing)} baris dipakai ulang, {len(missing)} baris diproses")
+        return [entries[key] for key in keys]
+    
+    def matrix_path(self, key):
+        """
+        Path file .npz untuk kunci matriks, sekaligus menandai kunci sebagai terpakai
+        
+        Parameters
+        ----------
+        key : str
+            Kunci dari content_key
+        
+        Returns
+        -------
+        str
+            Path file matriks
+        """
+        self._used_matrices.add(key)
+        return os.path.join(self.matrix_dir, f"{key}.npz")
+    
+    def save(self):
+        """
+        Menyimpan teks terproses ke disk dan membuang entri serta file matriks
+        yang tidak dipakai sejak cache dibuat
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = self._load_entries()
+        used = {key: entries[key] for key in self._used_texts if key in entries}
+        
+        path = os.path.join(self.cache_dir, PROCESSED_FILENAME)
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.version, 'entries': used}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)  # Atomik: pembaca tidak pernah melihat file setengah jadi
+        
+        if os.path.isdir(self.matrix_dir):
+            for filename in os.listdir(self.matrix_dir):
+                if filename.endswith('.npz') and filename[:-4] not in self._used_matrices:
+                    os.remove(os.path.join(self.matrix_dir, filename))
+
+def load_matrix(path):
+    """
+    Memuat matriks sparse dari cache
+    
+    Parameters
+    ----------
+    path : str
+        Path file .npz
+    
+    Returns
+    -------
+    scipy.sparse.csr_matrix or None
+        Matriks, atau None jika belum ada atau rusak
+    """
+    try:
+        return load_npz(path).tocsr()
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+
+def save_matrix(path, matrix):
+    """
+    Menyimpan matriks sparse ke cache secara atomik
+    
+    Parameters
+    ----------
+    path : str
+        Path file .npz
+    matrix : scipy.sparse matrix
+        Matriks yang disimpan
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}.npz"
+    save_npz(tmp_path, matrix, compressed=False)
+    os.replace(tmp_path, path)
@@ -0,0 +1,298 @@
+"""
+Pencocokan banyak istilah sekaligus (nama penyakit dan sinonimnya)
+"""
+from collections import Counter
+from difflib import SequenceMatcher
+import numpy as np
+
+class TermMatcher:
+    """
+    Indeks istilah -> nilai (misalnya sinonim -> nama penyakit kanonik) untuk
+    mencari istilah di dalam teks dalam satu kali lintasan.
+    
+    Setiap nilai memiliki prioritas sesuai urutan kemunculan pertamanya saat
+    indeks dibangun; semua pencarian mengembalikan nilai berprioritas tertinggi
+    (paling awal), sama seperti loop berurutan atas daftar istilah.
+    
+    - Aho-Corasick: istilah mana yang muncul di dalam teks, O(panjang teks).
+    - Suffix automaton gabungan: istilah mana yang memuat teks sebagai
+      substring, O(panjang teks).
+    """
+    
+    def __init__(self, terms, ignore_case=False):
+        """
+        Membangun indeks
+        
+        Parameters
+        ----------
+        terms : iterable of tuple
+            Pasangan (istilah, nilai) sesuai urutan prioritas
+        ignore_case : bool
+            Jika True, istilah dan teks dicocokkan dalam huruf kecil
+        """
+        self.ignore_case = ignore_case
+        self.values = []
+        value_rank = {}
+        ranked_terms = []
+        for term, value in terms:
+            if value not in value_rank:
+                value_rank[value] = len(self.values)
+                self.values.append(value)
+            ranked_terms.append((term, value_rank[value]))
+        
+        # Indeks balik istilah (apa adanya) -> nilai pertama yang memilikinya
+        self.term_values = {}
+        for term, rank in ranked_terms:
+            self.term_values.setdefault(term, self.values[rank])
+        
+        if ignore_case:
+            ranked_terms = [(term.lower(), rank) for term, rank in ranked_terms]
+        
+        self._build_automaton(ranked_terms)
+        self._build_substring_index(ranked_terms)
+    
+    def _build_automaton(self, ranked_terms):
+        """Membangun automaton Aho-Corasick dengan prioritas terbaik per state"""
+        goto = [{}]
+        best = [len(self.values)]
+        for term, rank in ranked_terms:
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    best.append(len(self.values))
+                state = next_state
+            best[state] = min(best[state], rank)
+        
+        # Failure link dihitung secara BFS; prioritas terbaik sebuah state juga
+        # mencakup istilah yang berakhir di state failure-nya (sufiks yang lebih pendek)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            best[state] = min(best[state], best[0])
+        for state in queue:
+            for char, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                best[next_state] = min(best[next_state], best[fail[next_state]])
+                queue.append(next_state)
+        
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+    
+    def _build_substring_index(self, ranked_terms):
+        """
+        Membangun suffix automaton gabungan dari semua istilah; setiap state
+        menyimpan prioritas terbaik dari istilah yang memuat substring state tersebut
+        """
+        transitions = [{}]
+        length = [0]
+        link = [-1]
+        best = [len(self.values)]
+        
+        def new_state(state_length, state_link, state_transitions):
+            transitions.append(state_transitions)
+            length.append(state_length)
+            link.append(state_link)
+            best.append(len(self.values))
+            return len(transitions) - 1
+        
+        def clone_state(parent, char, target):
+            # State baru dengan panjang len(parent) + 1 menggantikan target untuk sufiks yang lebih pendek
+            clone = new_state(length[parent] + 1, link[target], dict(transitions[target]))
+            while parent != -1 and transitions[parent].get(char) == target:
+                transitions[parent][char] = clone
+                parent = link[parent]
+            link[target] = clone
+            return clone
+        
+        def extend(last, char):
+            target = transitions[last].get(char)
+            if target is not None:
+                # Prefix ini sudah menjadi substring istilah lain
+                if length[last] + 1 == length[target]:
+                    return target
+                return clone_state(last, char, target)
+            
+            current = new_state(length[last] + 1, 0, {})
+            parent = last
+            while parent != -1 and char not in transitions[parent]:
+                transitions[parent][char] = current
+                parent = link[parent]
+            if parent != -1:
+                target = transitions[parent][char]
+                if length[parent] + 1 == length[target]:
+                    link[current] = target
+                else:
+                    link[current] = clone_state(parent, char, target)
+            return current
+        
+        for term, rank in ranked_terms:
+            best[0] = min(best[0], rank)
+            state = 0
+            for char in term:
+                state = extend(state, char)
+                best[state] = min(best[state], rank)
+        
+        # Substring sebuah state juga muncul di semua posisi akhir state turunannya
+        # pada pohon suffix link, jadi prioritas diturunkan dari state terpanjang
+        for state in sorted(range(1, len(transitions)), key=length.__getitem__, reverse=True):
+            best[link[state]] = min(best[link[state]], best[state])
+        
+        self._transitions = transitions
+        self._substring_best = best
+    
+    def _value(self, rank):
+        """Nilai untuk prioritas tertentu, atau None"""
+        return self.values[rank] if rank < len(self.values) else None
+    
+    def _rank_in(self, text):
+        """Prioritas terbaik dari istilah yang muncul di dalam teks"""
+        goto, fail, best = self._goto, self._fail, self._best
+        rank = best[0]
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if best[state] < rank:
+                rank = best[state]
+                if rank == 0:
+                    break
+        return rank
+    
+    def _rank_containing(self, text):
+        """Prioritas terbaik dari istilah yang memuat teks sebagai substring"""
+        transitions = self._transitions
+        state = 0
+        for char in text:
+            state = transitions[state].get(char)
+            if state is None:
+                return len(self.values)
+        return self._substring_best[state]
+    
+    def find_in(self, text):
+        """
+        Mencari istilah yang muncul di dalam teks
+        
+        Parameters
+        ----------
+        text : str
+            Teks yang dicari
+        
+        Returns
+        -------
+        object or None
+            Nilai berprioritas tertinggi dari istilah yang ditemukan
+        """
+        if self.ignore_case:
+            text = text.lower()
+        return self._value(self._rank_in(text))
+    
+    def find(self, text):
+        """
+        Mencari istilah yang muncul di dalam teks atau yang memuat teks
+        
+        Parameters
+        ----------
+        text : str
+            Teks yang dicari
+        
+        Returns
+        -------
+        object or None
+            Nilai berprioritas tertinggi dari kedua arah pencocokan
+        """
+        if self.ignore_case:
+            text = text.lower()
+        return self._value(min(self._rank_in(text), self._rank_containing(text)))
+
+class FuzzyIndex:
+    """
+    Indeks kandidat untuk pencarian kemiripan yang hasilnya sama dengan
+    difflib.get_close_matches(word, candidates, n=1, cutoff).
+    
+    Frekuensi karakter semua kandidat disimpan sekali sebagai matriks. Saat
+    pencarian, batas atas quick_ratio (irisan frekuensi karakter) dihitung untuk
+    semua kandidat sekaligus dengan numpy, lalu SequenceMatcher.ratio yang mahal
+    hanya dihitung mulai dari batas atas tertinggi sampai tidak ada kandidat
+    yang dapat mengalahkan hasil terbaik.
+    """
+    
+    def __init__(self, candidates):
+        """
+        Membangun indeks
+        
+        Parameters
+        ----------
+        candidates : iterable of str
+            Kandidat (urutan dan duplikat tidak memengaruhi hasil)
+        """
+        self.candidates = list(dict.fromkeys(candidates))
+        self.alphabet = {char: i for i, char in enumerate(sorted(set(''.join(self.candidates))))}
+        self.lengths = np.array([len(candidate) for candidate in self.candidates], dtype=np.float64)
+        self.char_counts = np.zeros((len(self.candidates), len(self.alphabet)), dtype=np.int32)
+        for row, candidate in enumerate(self.candidates):
+            for char, count in Counter(candidate).items():
+                self.char_counts[row, self.alphabet[char]] = count
+    
+    def best(self, word, cutoff=0.6):
+        """
+        Mencari kandidat paling mirip dengan word
+        
+        Parameters
+        ----------
+        word : str
+            Teks yang dicari
+        cutoff : float
+            Skor kemiripan minimum dalam rentang [0, 1]
+        
+        Returns
+        -------
+        str or None
+            Kandidat dengan skor tertinggi (jika seri, string terbesar seperti
+            get_close_matches), atau None jika tidak ada yang mencapai cutoff
+        
+        Raises
+        ------
+        ValueError
+            Jika cutoff di luar rentang [0, 1]
+        """
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+        if not self.candidates:
+            return None
+        
+        word_counts = np.zeros(len(self.alphabet), dtype=np.int32)
+        for char, count in Counter(word).items():
+            column = self.alphabet.get(char)
+            if column is not None:
+                word_counts[column] = count
+        
+        # Batas atas skor per kandidat dengan rumus difflib: 2*M/T (1.0 jika T == 0)
+        common = np.minimum(self.char_counts, word_counts).sum(axis=1)
+        total = self.lengths + len(word)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bounds = np.where(total > 0, 2.0 * common / total, 1.0)
+        candidate_rows = np.flatnonzero(bounds >= cutoff)
+        if candidate_rows.size == 0:
+            return None
+        
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        best_score, best_candidate = -1.0, None
+        for row in candidate_rows[np.argsort(-bounds[candidate_rows], kind='stable')]:
+            if bounds[row] < best_score:
+                break
+            candidate = self.candidates[row]
+            matcher.set_seq1(candidate)
+            score = matcher.ratio()
+            if score >= cutoff and (score, candidate) > (best_score, best_candidate or ''):
+                best_score, best_candidate = score, candidate
+        return best_candidate
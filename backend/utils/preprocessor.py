@@ -2,28 +2,209 @@
 Module untuk preprocessing teks dalam bahasa Indonesia
 """
 import re
+import os
+import json
 import string
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import hashlib
+import threading
+from importlib import metadata
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 import unicodedata
 
-# Download NLTK data yang diperlukan
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
 # Setup stemmer bahasa Indonesia dari Sastrawi
 stemmer_factory = StemmerFactory()
 stemmer = stemmer_factory.create_stemmer()
 
+# Lokasi default file cache stemming (disimpan bersama artefak model)
+DEFAULT_STEM_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'stem_cache.json'
+)
+
+class StemCache:
+    """
+    Cache LRU berukuran terbatas untuk hasil stemming Sastrawi.
+    Menyimpan pemetaan token -> kata dasar beserta statistik hit/miss,
+    dan dapat disimpan ke disk lalu dimuat ulang saat startup.
+    """
+    
+    def __init__(self, stemmer, max_size=50000):
+        """
+        Inisialisasi cache stemming
+        
+        Parameters
+        ----------
+        stemmer : object
+            Stemmer Sastrawi (objek dengan method stem)
+        max_size : int
+            Jumlah maksimal token yang disimpan sebelum entri terlama dibuang
+        """
+        # Gunakan stemmer internal Sastrawi (tanpa cache bawaan yang tidak terbatas)
+        self.stemmer = getattr(stemmer, 'delegatedStemmer', stemmer)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Penampung token baru selama perekaman (dipakai worker multiprocessing)
+        self._recorded = None
+    
+    def stem(self, word):
+        """
+        Mengembalikan kata dasar dari token, menggunakan cache jika tersedia
+        
+        Parameters
+        ----------
+        word : str
+            Token yang akan di-stem
+        
+        Returns
+        -------
+        str
+            Kata dasar hasil stemming
+        """
+        with self._lock:
+            stemmed = self._entries.get(word)
+            if stemmed is not None:
+                self._entries.move_to_end(word)
+                self.hits += 1
+                return stemmed
+        
+        # Stemming dilakukan di luar lock agar thread lain tidak menunggu
+        stemmed = self.stemmer.stem(word)
+        
+        with self._lock:
+            self.misses += 1
+            self._entries[word] = stemmed
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            if self._recorded is not None:
+                self._recorded[word] = stemmed
+        
+        return stemmed
+    
+    def update(self, entries):
+        """
+        Menambahkan pasangan token -> kata dasar ke cache tanpa mengubah statistik
+        
+        Parameters
+        ----------
+        entries : dict
+            Pasangan token dan kata dasarnya
+        """
+        with self._lock:
+            for word, stemmed in entries.items():
+                self._entries[word] = stemmed
+                self._entries.move_to_end(word)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def start_recording(self):
+        """Mulai merekam token baru yang di-stem (cache miss)"""
+        with self._lock:
+            self._recorded = {}
+    
+    def stop_recording(self):
+        """
+        Menghentikan perekaman token baru
+        
+        Returns
+        -------
+        dict
+            Token baru beserta kata dasarnya sejak start_recording()
+        """
+        with self._lock:
+            recorded, self._recorded = self._recorded or {}, None
+        return recorded
+    
+    def stats(self):
+        """
+        Mengembalikan statistik penggunaan cache
+        
+        Returns
+        -------
+        dict
+            Dictionary berisi ukuran, kapasitas, hit, miss, dan hit rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+    
+    def clear(self):
+        """Mengosongkan cache dan mereset statistik"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def save(self, path=DEFAULT_STEM_CACHE_PATH):
+        """
+        Menyimpan isi cache ke file JSON (urutan LRU dipertahankan)
+        
+        Parameters
+        ----------
+        path : str
+            Path file tujuan
+        
+        Returns
+        -------
+        str
+            Path file yang disimpan
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        
+        # Tulis ke file sementara milik proses ini lalu ganti, agar worker lain tidak membaca
+        # file setengah jadi dan beberapa worker yang menyimpan bersamaan tidak saling menimpa
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        
+        return path
+    
+    def load(self, path=DEFAULT_STEM_CACHE_PATH):
+        """
+        Memuat isi cache dari file JSON yang dibuat oleh save()
+        
+        Parameters
+        ----------
+        path : str
+            Path file cache
+        
+        Returns
+        -------
+        int
+            Jumlah entri yang dimuat (0 jika file tidak ada atau tidak valid)
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            entries = data['entries']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            return 0
+        
+        with self._lock:
+            for word, stemmed in entries[-self.max_size:]:
+                self._entries[word] = stemmed
+                self._entries.move_to_end(word)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        return min(len(entries), self.max_size)
+
+# Cache stemming yang dipakai bersama oleh seluruh preprocessing
+stem_cache = StemCache(stemmer)
+
 # Normalisasi singkatan dan slang words bahasa Indonesia
 word_normalization = {
     'gak': 'tidak', 'ga': 'tidak', 'ngga': 'tidak', 'nggak': 'tidak', 'g': 'tidak',
@@ -54,114 +235,111 @@ word_normalization = {
     'brp': 'berapa', 'bs': 'bisa', 'bsa': 'bisa',
 }
 
-# Load stopwords bahasa Indonesia
-try:
-    stop_words = set(stopwords.words('indonesian'))
-except:
-    # Fallback jika NLTK tidak memiliki stopwords bahasa Indonesia
-    stop_words = set([
-        'ada', 'adalah', 'adanya', 'adapun', 'agak', 'agaknya', 'agar', 'akan', 'akankah', 
-        'akhir', 'akhiri', 'akhirnya', 'aku', 'akulah', 'amat', 'amatlah', 'anda', 'andalah', 
-        'antar', 'antara', 'antaranya', 'apa', 'apaan', 'apabila', 'apakah', 'apalagi', 'apatah', 
-        'artinya', 'asal', 'asalkan', 'atas', 'atau', 'ataukah', 'ataupun', 'awal', 'awalnya',
-        'bagai', 'bagaikan', 'bagaimana', 'bagaimanakah', 'bagaimanapun', 'bagi', 'bagian', 
-        'bahkan', 'bahwa', 'bahwasanya', 'baik', 'bakal', 'bakalan', 'balik', 'banyak', 'bapak', 
-        'baru', 'bawah', 'beberapa', 'begini', 'beginian', 'beginikah', 'beginilah', 'begitu', 
-        'begitukah', 'begitulah', 'begitupun', 'bekerja', 'belakang', 'belakangan', 'belum', 
-        'belumlah', 'benar', 'benarkah', 'benarlah', 'berada', 'berakhir', 'berakhirlah', 
-        'berakhirnya', 'berapa', 'berapakah', 'berapalah', 'berapapun', 'berarti', 'berawal', 
-        'berbagai', 'berdatangan', 'beri', 'berikan', 'berikut', 'berikutnya', 'berjumlah', 
-        'berkali-kali', 'berkata', 'berkehendak', 'berkeinginan', 'berkenaan', 'berlainan', 
-        'berlalu', 'berlangsung', 'berlebihan', 'bermacam', 'bermacam-macam', 'bermaksud', 
-        'bermula', 'bersama', 'bersama-sama', 'bersiap', 'bersiap-siap', 'bertanya', 
-        'bertanya-tanya', 'berturut', 'berturut-turut', 'bertutur', 'berujar', 'berupa', 
-        'besar', 'betul', 'betulkah', 'biasa', 'biasanya', 'bila', 'bilakah', 'bisa', 
-        'bisakah', 'boleh', 'bolehkah', 'bolehlah', 'buat', 'bukan', 'bukankah', 'bukanlah', 
-        'bukannya', 'bulan', 'bung', 'cara', 'caranya', 'cukup', 'cukupkah', 'cukuplah', 
-        'cuma', 'dahulu', 'dalam', 'dan', 'dapat', 'dari', 'daripada', 'datang', 'dekat', 
-        'demi', 'demikian', 'demikianlah', 'dengan', 'depan', 'di', 'dia', 'diakhiri', 
-        'diakhirinya', 'dialah', 'diantara', 'diantaranya', 'diberi', 'diberikan', 'diberikannya', 
-        'dibuat', 'dibuatnya', 'didapat', 'didatangkan', 'digunakan', 'diibaratkan', 'diibaratkannya', 
-        'diingat', 'diingatkan', 'diinginkan', 'dijawab', 'dijelaskan', 'dijelaskannya', 'dikarenakan', 
-        'dikatakan', 'dikatakannya', 'dikerjakan', 'diketahui', 'diketahuinya', 'dikira', 'dilakukan', 
-        'dilalui', 'dilihat', 'dimaksud', 'dimaksudkan', 'dimaksudkannya', 'dimaksudnya', 'diminta', 
-        'dimintai', 'dimisalkan', 'dimulai', 'dimulailah', 'dimulainya', 'dimungkinkan', 'dini', 
-        'dipastikan', 'diperbuat', 'diperbuatnya', 'dipergunakan', 'diperkirakan', 'diperlihatkan', 
-        'diperlukan', 'diperlukannya', 'dipersoalkan', 'dipertanyakan', 'dipunyai', 'diri', 
-        'dirinya', 'disampaikan', 'disebut', 'disebutkan', 'disebutkannya', 'disini', 'disinilah', 
-        'ditambahkan', 'ditandaskan', 'ditanya', 'ditanyai', 'ditanyakan', 'ditegaskan', 'ditujukan', 
-        'ditunjuk', 'ditunjuki', 'ditunjukkan', 'ditunjukkannya', 'ditunjuknya', 'dituturkan', 
-        'dituturkannya', 'diucapkan', 'diucapkannya', 'diungkapkan', 'dong', 'dua', 'dulu', 
-        'empat', 'enggak', 'enggaknya', 'entah', 'entahlah', 'guna', 'gunakan', 'hal', 'hampir', 
-        'hanya', 'hanyalah', 'hari', 'harus', 'haruslah', 'harusnya', 'hendak', 'hendaklah', 
-        'hendaknya', 'hingga', 'ia', 'ialah', 'ibarat', 'ibaratkan', 'ibaratnya', 'ibu', 'ikut', 
-        'ingat', 'ingat-ingat', 'ingin', 'inginkah', 'inginkan', 'ini', 'inikah', 'inilah', 
-        'itu', 'itukah', 'itulah', 'jadi', 'jadilah', 'jadinya', 'jangan', 'jangankan', 'janganlah', 
-        'jauh', 'jawab', 'jawaban', 'jawabnya', 'jelas', 'jelaskan', 'jelaslah', 'jelasnya', 
-        'jika', 'jikalau', 'juga', 'jumlah', 'jumlahnya', 'justru', 'kala', 'kalau', 'kalaulah', 
-        'kalaupun', 'kalian', 'kami', 'kamilah', 'kamu', 'kamulah', 'kan', 'kapan', 'kapankah', 
-        'kapanpun', 'karena', 'karenanya', 'kasus', 'kata', 'katakan', 'katakanlah', 'katanya', 
-        'ke', 'keadaan', 'kebetulan', 'kecil', 'kedua', 'keduanya', 'keinginan', 'kelamaan', 
-        'kelihatan', 'kelihatannya', 'kelima', 'keluar', 'kembali', 'kemudian', 'kemungkinan', 
-        'kemungkinannya', 'kenapa', 'kepada', 'kepadanya', 'kesamaan', 'keseluruhan', 'keseluruhannya', 
-        'keterlaluan', 'ketika', 'khususnya', 'kini', 'kinilah', 'kira', 'kira-kira', 'kiranya', 
-        'kita', 'kitalah', 'kok', 'kurang', 'lagi', 'lagian', 'lah', 'lain', 'lainnya', 'lalu', 
-        'lama', 'lamanya', 'lanjut', 'lanjutnya', 'lebih', 'lewat', 'lima', 'luar', 'macam', 
-        'maka', 'makanya', 'makin', 'malah', 'malahan', 'mampu', 'mampukah', 'mana', 'manakala', 
-        'manalagi', 'masa', 'masalah', 'masalahnya', 'masih', 'masihkah', 'masing', 'masing-masing', 
-        'mau', 'maupun', 'melainkan', 'melakukan', 'melalui', 'melihat', 'melihatnya', 'memang', 
-        'memastikan', 'memberi', 'memberikan', 'membuat', 'memerlukan', 'memihak', 'meminta', 
-        'memintakan', 'memisalkan', 'memperbuat', 'mempergunakan', 'memperkirakan', 'memperlihatkan', 
-        'mempersiapkan', 'mempersoalkan', 'mempertanyakan', 'mempunyai', 'memulai', 'memungkinkan', 
-        'menaiki', 'menambahkan', 'menandaskan', 'menanti', 'menanti-nanti', 'menantikan', 
-        'menanya', 'menanyai', 'menanyakan', 'mendapat', 'mendapatkan', 'mendatang', 'mendatangi', 
-        'mendatangkan', 'menegaskan', 'mengakhiri', 'mengapa', 'mengatakan', 'mengatakannya', 
-        'mengenai', 'mengerjakan', 'mengetahui', 'menggunakan', 'menghendaki', 'mengibaratkan', 
-        'mengibaratkannya', 'mengingat', 'mengingatkan', 'menginginkan', 'mengira', 'mengucapkan', 
-        'mengucapkannya', 'mengungkapkan', 'menjadi', 'menjawab', 'menjelaskan', 'menuju', 
-        'menunjuk', 'menunjuki', 'menunjukkan', 'menunjuknya', 'menurut', 'menuturkan', 
-        'menyampaikan', 'menyangkut', 'menyatakan', 'menyebutkan', 'menyeluruh', 'menyiapkan', 
-        'merasa', 'mereka', 'merekalah', 'merupakan', 'meski', 'meskipun', 'meyakini', 'meyakinkan', 
-        'minta', 'mirip', 'misal', 'misalkan', 'misalnya', 'mula', 'mulai', 'mulailah', 'mulanya', 
-        'mungkin', 'mungkinkah', 'nah', 'naik', 'namun', 'nanti', 'nantinya', 'nyaris', 'nyatanya', 
-        'oleh', 'olehnya', 'pada', 'padahal', 'padanya', 'pak', 'paling', 'panjang', 'pantas', 
-        'para', 'pasti', 'pastilah', 'penting', 'pentingnya', 'per', 'percuma', 'perlu', 'perlukah', 
-        'perlunya', 'pernah', 'persoalan', 'pertama', 'pertama-tama', 'pertanyaan', 'pertanyakan', 
-        'pihak', 'pihaknya', 'pukul', 'pula', 'pun', 'punya', 'rasa', 'rasanya', 'rata', 'rupanya', 
-        'saat', 'saatnya', 'saja', 'sajalah', 'saling', 'sama', 'sama-sama', 'sambil', 'sampai', 
-        'sampai-sampai', 'sampaikan', 'sana', 'sangat', 'sangatlah', 'satu', 'saya', 'sayalah', 
-        'se', 'sebab', 'sebabnya', 'sebagai', 'sebagaimana', 'sebagainya', 'sebagian', 'sebaik', 
-        'sebaik-baiknya', 'sebaiknya', 'sebaliknya', 'sebanyak', 'sebegini', 'sebegitu', 'sebelum', 
-        'sebelumnya', 'sebenarnya', 'seberapa', 'sebesar', 'sebetulnya', 'sebisanya', 'sebuah', 
-        'sebut', 'sebutlah', 'sebutnya', 'secara', 'secukupnya', 'sedang', 'sedangkan', 'sedemikian', 
-        'sedikit', 'sedikitnya', 'seenaknya', 'segala', 'segalanya', 'segera', 'seharusnya', 
-        'sehingga', 'seingat', 'sejak', 'sejauh', 'sejenak', 'sejumlah', 'sekadar', 'sekadarnya', 
-        'sekali', 'sekali-kali', 'sekalian', 'sekaligus', 'sekalipun', 'sekarang', 'sekarang', 
-        'sekecil', 'seketika', 'sekiranya', 'sekitar', 'sekitarnya', 'sekurang-kurangnya', 
-        'sekurangnya', 'sela', 'selain', 'selaku', 'selalu', 'selama', 'selama-lamanya', 
-        'selamanya', 'selanjutnya', 'seluruh', 'seluruhnya', 'semacam', 'semakin', 'semampu', 
-        'semampunya', 'semasa', 'semasih', 'semata', 'semata-mata', 'semaunya', 'sementara', 
-        'semisal', 'semisalnya', 'sempat', 'semua', 'semuanya', 'semula', 'sendiri', 'sendirian', 
-        'sendirinya', 'seolah', 'seolah-olah', 'seorang', 'sepanjang', 'sepantasnya', 'sepantasnyalah', 
-        'seperlunya', 'seperti', 'sepertinya', 'sepihak', 'sering', 'seringnya', 'serta', 
-        'serupa', 'sesaat', 'sesama', 'sesampai', 'sesegera', 'sesekali', 'seseorang', 
-        'sesuatu', 'sesuatunya', 'sesudah', 'sesudahnya', 'setelah', 'setempat', 'setengah', 
-        'seterusnya', 'setiap', 'setiba', 'setibanya', 'setidak-tidaknya', 'setidaknya', 
-        'setinggi', 'seusai', 'sewaktu', 'siap', 'siapa', 'siapakah', 'siapapun', 'sini', 
-        'sinilah', 'soal', 'soalnya', 'suatu', 'sudah', 'sudahkah', 'sudahlah', 'supaya', 
-        'tadi', 'tadinya', 'tahu', 'tahun', 'tak', 'tambah', 'tambahnya', 'tampak', 'tampaknya', 
-        'tandas', 'tandasnya', 'tanpa', 'tanya', 'tanyakan', 'tanyanya', 'tapi', 'tegas', 
-        'tegasnya', 'telah', 'tempat', 'tengah', 'tentang', 'tentu', 'tentulah', 'tentunya', 
-        'tepat', 'terakhir', 'terasa', 'terbanyak', 'terdahulu', 'terdapat', 'terdiri', 
-        'terhadap', 'terhadapnya', 'teringat', 'teringat-ingat', 'terjadi', 'terjadilah', 
-        'terjadinya', 'terkira', 'terlalu', 'terlebih', 'terlihat', 'termasuk', 'ternyata', 
-        'tersampaikan', 'tersebut', 'tersebutlah', 'tertentu', 'tertuju', 'terus', 'terutama', 
-        'tetap', 'tetapi', 'tiap', 'tiba', 'tiba-tiba', 'tidak', 'tidakkah', 'tidaklah', 
-        'tiga', 'tinggi', 'toh', 'tunjuk', 'turut', 'tutur', 'tuturnya', 'ucap', 'ucapnya', 
-        'ujar', 'ujarnya', 'umum', 'umumnya', 'ungkap', 'ungkapnya', 'untuk', 'usah', 
-        'usai', 'waduh', 'wah', 'wahai', 'waktu', 'waktunya', 'walau', 'walaupun', 'wong', 'yaitu', 
-        'yakin', 'yakni', 'yang', 'sih', 'nih'
-    ])
+# Stopwords bahasa Indonesia (daftar Tala yang juga dipakai NLTK), disertakan
+# langsung agar preprocessing tidak perlu memuat NLTK
+stop_words = set([
+    'ada', 'adalah', 'adanya', 'adapun', 'agak', 'agaknya', 'agar', 'akan', 'akankah', 
+    'akhir', 'akhiri', 'akhirnya', 'aku', 'akulah', 'amat', 'amatlah', 'anda', 'andalah', 
+    'antar', 'antara', 'antaranya', 'apa', 'apaan', 'apabila', 'apakah', 'apalagi', 'apatah', 
+    'artinya', 'asal', 'asalkan', 'atas', 'atau', 'ataukah', 'ataupun', 'awal', 'awalnya',
+    'bagai', 'bagaikan', 'bagaimana', 'bagaimanakah', 'bagaimanapun', 'bagi', 'bagian', 
+    'bahkan', 'bahwa', 'bahwasanya', 'baik', 'bakal', 'bakalan', 'balik', 'banyak', 'bapak', 
+    'baru', 'bawah', 'beberapa', 'begini', 'beginian', 'beginikah', 'beginilah', 'begitu', 
+    'begitukah', 'begitulah', 'begitupun', 'bekerja', 'belakang', 'belakangan', 'belum', 
+    'belumlah', 'benar', 'benarkah', 'benarlah', 'berada', 'berakhir', 'berakhirlah', 
+    'berakhirnya', 'berapa', 'berapakah', 'berapalah', 'berapapun', 'berarti', 'berawal', 
+    'berbagai', 'berdatangan', 'beri', 'berikan', 'berikut', 'berikutnya', 'berjumlah', 
+    'berkali-kali', 'berkata', 'berkehendak', 'berkeinginan', 'berkenaan', 'berlainan', 
+    'berlalu', 'berlangsung', 'berlebihan', 'bermacam', 'bermacam-macam', 'bermaksud', 
+    'bermula', 'bersama', 'bersama-sama', 'bersiap', 'bersiap-siap', 'bertanya', 
+    'bertanya-tanya', 'berturut', 'berturut-turut', 'bertutur', 'berujar', 'berupa', 
+    'besar', 'betul', 'betulkah', 'biasa', 'biasanya', 'bila', 'bilakah', 'bisa', 
+    'bisakah', 'boleh', 'bolehkah', 'bolehlah', 'buat', 'bukan', 'bukankah', 'bukanlah', 
+    'bukannya', 'bulan', 'bung', 'cara', 'caranya', 'cukup', 'cukupkah', 'cukuplah', 
+    'cuma', 'dahulu', 'dalam', 'dan', 'dapat', 'dari', 'daripada', 'datang', 'dekat', 
+    'demi', 'demikian', 'demikianlah', 'dengan', 'depan', 'di', 'dia', 'diakhiri', 
+    'diakhirinya', 'dialah', 'diantara', 'diantaranya', 'diberi', 'diberikan', 'diberikannya', 
+    'dibuat', 'dibuatnya', 'didapat', 'didatangkan', 'digunakan', 'diibaratkan', 'diibaratkannya', 
+    'diingat', 'diingatkan', 'diinginkan', 'dijawab', 'dijelaskan', 'dijelaskannya', 'dikarenakan', 
+    'dikatakan', 'dikatakannya', 'dikerjakan', 'diketahui', 'diketahuinya', 'dikira', 'dilakukan', 
+    'dilalui', 'dilihat', 'dimaksud', 'dimaksudkan', 'dimaksudkannya', 'dimaksudnya', 'diminta', 
+    'dimintai', 'dimisalkan', 'dimulai', 'dimulailah', 'dimulainya', 'dimungkinkan', 'dini', 
+    'dipastikan', 'diperbuat', 'diperbuatnya', 'dipergunakan', 'diperkirakan', 'diperlihatkan', 
+    'diperlukan', 'diperlukannya', 'dipersoalkan', 'dipertanyakan', 'dipunyai', 'diri', 
+    'dirinya', 'disampaikan', 'disebut', 'disebutkan', 'disebutkannya', 'disini', 'disinilah', 
+    'ditambahkan', 'ditandaskan', 'ditanya', 'ditanyai', 'ditanyakan', 'ditegaskan', 'ditujukan', 
+    'ditunjuk', 'ditunjuki', 'ditunjukkan', 'ditunjukkannya', 'ditunjuknya', 'dituturkan', 
+    'dituturkannya', 'diucapkan', 'diucapkannya', 'diungkapkan', 'dong', 'dua', 'dulu', 
+    'empat', 'enggak', 'enggaknya', 'entah', 'entahlah', 'guna', 'gunakan', 'hal', 'hampir', 
+    'hanya', 'hanyalah', 'hari', 'harus', 'haruslah', 'harusnya', 'hendak', 'hendaklah', 
+    'hendaknya', 'hingga', 'ia', 'ialah', 'ibarat', 'ibaratkan', 'ibaratnya', 'ibu', 'ikut', 
+    'ingat', 'ingat-ingat', 'ingin', 'inginkah', 'inginkan', 'ini', 'inikah', 'inilah', 
+    'itu', 'itukah', 'itulah', 'jadi', 'jadilah', 'jadinya', 'jangan', 'jangankan', 'janganlah', 
+    'jauh', 'jawab', 'jawaban', 'jawabnya', 'jelas', 'jelaskan', 'jelaslah', 'jelasnya', 
+    'jika', 'jikalau', 'juga', 'jumlah', 'jumlahnya', 'justru', 'kala', 'kalau', 'kalaulah', 
+    'kalaupun', 'kalian', 'kami', 'kamilah', 'kamu', 'kamulah', 'kan', 'kapan', 'kapankah', 
+    'kapanpun', 'karena', 'karenanya', 'kasus', 'kata', 'katakan', 'katakanlah', 'katanya', 
+    'ke', 'keadaan', 'kebetulan', 'kecil', 'kedua', 'keduanya', 'keinginan', 'kelamaan', 
+    'kelihatan', 'kelihatannya', 'kelima', 'keluar', 'kembali', 'kemudian', 'kemungkinan', 
+    'kemungkinannya', 'kenapa', 'kepada', 'kepadanya', 'kesamaan', 'keseluruhan', 'keseluruhannya', 
+    'keterlaluan', 'ketika', 'khususnya', 'kini', 'kinilah', 'kira', 'kira-kira', 'kiranya', 
+    'kita', 'kitalah', 'kok', 'kurang', 'lagi', 'lagian', 'lah', 'lain', 'lainnya', 'lalu', 
+    'lama', 'lamanya', 'lanjut', 'lanjutnya', 'lebih', 'lewat', 'lima', 'luar', 'macam', 
+    'maka', 'makanya', 'makin', 'malah', 'malahan', 'mampu', 'mampukah', 'mana', 'manakala', 
+    'manalagi', 'masa', 'masalah', 'masalahnya', 'masih', 'masihkah', 'masing', 'masing-masing', 
+    'mau', 'maupun', 'melainkan', 'melakukan', 'melalui', 'melihat', 'melihatnya', 'memang', 
+    'memastikan', 'memberi', 'memberikan', 'membuat', 'memerlukan', 'memihak', 'meminta', 
+    'memintakan', 'memisalkan', 'memperbuat', 'mempergunakan', 'memperkirakan', 'memperlihatkan', 
+    'mempersiapkan', 'mempersoalkan', 'mempertanyakan', 'mempunyai', 'memulai', 'memungkinkan', 
+    'menaiki', 'menambahkan', 'menandaskan', 'menanti', 'menanti-nanti', 'menantikan', 
+    'menanya', 'menanyai', 'menanyakan', 'mendapat', 'mendapatkan', 'mendatang', 'mendatangi', 
+    'mendatangkan', 'menegaskan', 'mengakhiri', 'mengapa', 'mengatakan', 'mengatakannya', 
+    'mengenai', 'mengerjakan', 'mengetahui', 'menggunakan', 'menghendaki', 'mengibaratkan', 
+    'mengibaratkannya', 'mengingat', 'mengingatkan', 'menginginkan', 'mengira', 'mengucapkan', 
+    'mengucapkannya', 'mengungkapkan', 'menjadi', 'menjawab', 'menjelaskan', 'menuju', 
+    'menunjuk', 'menunjuki', 'menunjukkan', 'menunjuknya', 'menurut', 'menuturkan', 
+    'menyampaikan', 'menyangkut', 'menyatakan', 'menyebutkan', 'menyeluruh', 'menyiapkan', 
+    'merasa', 'mereka', 'merekalah', 'merupakan', 'meski', 'meskipun', 'meyakini', 'meyakinkan', 
+    'minta', 'mirip', 'misal', 'misalkan', 'misalnya', 'mula', 'mulai', 'mulailah', 'mulanya', 
+    'mungkin', 'mungkinkah', 'nah', 'naik', 'namun', 'nanti', 'nantinya', 'nyaris', 'nyatanya', 
+    'oleh', 'olehnya', 'pada', 'padahal', 'padanya', 'pak', 'paling', 'panjang', 'pantas', 
+    'para', 'pasti', 'pastilah', 'penting', 'pentingnya', 'per', 'percuma', 'perlu', 'perlukah', 
+    'perlunya', 'pernah', 'persoalan', 'pertama', 'pertama-tama', 'pertanyaan', 'pertanyakan', 
+    'pihak', 'pihaknya', 'pukul', 'pula', 'pun', 'punya', 'rasa', 'rasanya', 'rata', 'rupanya', 
+    'saat', 'saatnya', 'saja', 'sajalah', 'saling', 'sama', 'sama-sama', 'sambil', 'sampai', 
+    'sampai-sampai', 'sampaikan', 'sana', 'sangat', 'sangatlah', 'satu', 'saya', 'sayalah', 
+    'se', 'sebab', 'sebabnya', 'sebagai', 'sebagaimana', 'sebagainya', 'sebagian', 'sebaik', 
+    'sebaik-baiknya', 'sebaiknya', 'sebaliknya', 'sebanyak', 'sebegini', 'sebegitu', 'sebelum', 
+    'sebelumnya', 'sebenarnya', 'seberapa', 'sebesar', 'sebetulnya', 'sebisanya', 'sebuah', 
+    'sebut', 'sebutlah', 'sebutnya', 'secara', 'secukupnya', 'sedang', 'sedangkan', 'sedemikian', 
+    'sedikit', 'sedikitnya', 'seenaknya', 'segala', 'segalanya', 'segera', 'seharusnya', 
+    'sehingga', 'seingat', 'sejak', 'sejauh', 'sejenak', 'sejumlah', 'sekadar', 'sekadarnya', 
+    'sekali', 'sekali-kali', 'sekalian', 'sekaligus', 'sekalipun', 'sekarang', 'sekarang', 
+    'sekecil', 'seketika', 'sekiranya', 'sekitar', 'sekitarnya', 'sekurang-kurangnya', 
+    'sekurangnya', 'sela', 'selain', 'selaku', 'selalu', 'selama', 'selama-lamanya', 
+    'selamanya', 'selanjutnya', 'seluruh', 'seluruhnya', 'semacam', 'semakin', 'semampu', 
+    'semampunya', 'semasa', 'semasih', 'semata', 'semata-mata', 'semaunya', 'sementara', 
+    'semisal', 'semisalnya', 'sempat', 'semua', 'semuanya', 'semula', 'sendiri', 'sendirian', 
+    'sendirinya', 'seolah', 'seolah-olah', 'seorang', 'sepanjang', 'sepantasnya', 'sepantasnyalah', 
+    'seperlunya', 'seperti', 'sepertinya', 'sepihak', 'sering', 'seringnya', 'serta', 
+    'serupa', 'sesaat', 'sesama', 'sesampai', 'sesegera', 'sesekali', 'seseorang', 
+    'sesuatu', 'sesuatunya', 'sesudah', 'sesudahnya', 'setelah', 'setempat', 'setengah', 
+    'seterusnya', 'setiap', 'setiba', 'setibanya', 'setidak-tidaknya', 'setidaknya', 
+    'setinggi', 'seusai', 'sewaktu', 'siap', 'siapa', 'siapakah', 'siapapun', 'sini', 
+    'sinilah', 'soal', 'soalnya', 'suatu', 'sudah', 'sudahkah', 'sudahlah', 'supaya', 
+    'tadi', 'tadinya', 'tahu', 'tahun', 'tak', 'tambah', 'tambahnya', 'tampak', 'tampaknya', 
+    'tandas', 'tandasnya', 'tanpa', 'tanya', 'tanyakan', 'tanyanya', 'tapi', 'tegas', 
+    'tegasnya', 'telah', 'tempat', 'tengah', 'tentang', 'tentu', 'tentulah', 'tentunya', 
+    'tepat', 'terakhir', 'terasa', 'terbanyak', 'terdahulu', 'terdapat', 'terdiri', 
+    'terhadap', 'terhadapnya', 'teringat', 'teringat-ingat', 'terjadi', 'terjadilah', 
+    'terjadinya', 'terkira', 'terlalu', 'terlebih', 'terlihat', 'termasuk', 'ternyata', 
+    'tersampaikan', 'tersebut', 'tersebutlah', 'tertentu', 'tertuju', 'terus', 'terutama', 
+    'tetap', 'tetapi', 'tiap', 'tiba', 'tiba-tiba', 'tidak', 'tidakkah', 'tidaklah', 
+    'tiga', 'tinggi', 'toh', 'tunjuk', 'turut', 'tutur', 'tuturnya', 'ucap', 'ucapnya', 
+    'ujar', 'ujarnya', 'umum', 'umumnya', 'ungkap', 'ungkapnya', 'untuk', 'usah', 
+    'usai', 'waduh', 'wah', 'wahai', 'waktu', 'waktunya', 'walau', 'walaupun', 'wong', 'yaitu', 
+    'yakin', 'yakni', 'yang', 'sih', 'nih'
+])
 
 # Tambahkan stopwords khusus gejala penyakit atau medis yang tidak berguna
 medical_stopwords = set([
@@ -209,9 +387,33 @@ def normalize_words(text):
     
     return ' '.join(normalized)
 
+def _number_replacement(match):
+    """Tanggal menjadi 'date', angka lain menjadi 'num'"""
+    return ' date ' if match.group(1) else ' num '
+
+def _tag_replacement(match):
+    """Tag HTML yang ditutup dihapus; '<' tanpa '>' sebelum akhir baris dibiarkan"""
+    return '' if match.group(1) else match.group()
+
+# Pola-pola normalisasi dikompilasi sekali dan dijalankan berurutan seperti
+# pembersihan awal: tanggal dan angka, URL, tag HTML, lalu simbol. Setiap pola
+# memindai teks secara linear:
+# - Tanggal dan angka diawali \d, dengan batas kata di depannya sebagai lookbehind
+#   (sama dengan \b), agar regex dapat melompat langsung ke digit berikutnya.
+# - Tag HTML ('<' sampai '>' pertama pada baris yang sama) dicocokkan tanpa
+#   backtracking: '<' yang tidak ditutup melewati seluruh sisa barisnya sekaligus,
+#   karena tidak ada '<' lain di sana yang dapat ditutup.
+_NORMALIZER_PASSES = (
+    (re.compile(r'\d(?<!\w\d)(?:(\d?[/-]\d{1,2}[/-]\d{2,4}\b)|\d*\b)'), _number_replacement),  # tanggal/angka
+    (re.compile(r'https?://\S+|www\.\S+'), ''),                                             # URL
+    (re.compile(r'<[^>\n]*(>)?'), _tag_replacement),                                         # tag HTML
+    (re.compile(r'[^\w\s]+'), ' '),                                                         # simbol/emoji
+)
+
 def clean_text(text):
     """
-    Membersihkan teks dari karakter khusus, angka, dan menormalkan unicode
+    Membersihkan teks dari karakter khusus, angka, dan menormalkan unicode.
+    Tanggal dan angka dipertahankan sebagai token 'date' dan 'num'.
     
     Parameters
     ----------
@@ -224,47 +426,94 @@ def clean_text(text):
         Teks yang sudah dibersihkan
     """
     # Normalisasi unicode (mengubah karakter khusus menjadi ascii)
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
-    
-    # Pola untuk mencocokkan tanggal dan angka (kita perlu mempertahankan ini)
-    date_pattern = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
-    number_pattern = r'\b\d+\b'
-    
-    # Simpan tanggal dan angka
-    dates = re.findall(date_pattern, text)
-    numbers = re.findall(number_pattern, text)
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
     
-    # Hapus tanggal dan angka dari teks
-    text = re.sub(date_pattern, ' DATE ', text)
-    text = re.sub(number_pattern, ' NUM ', text)
-    
-    # Ubah ke huruf kecil
+    # Ubah ke huruf kecil, ganti tanggal/angka, hapus URL dan tag HTML, lalu ganti simbol
     text = text.lower()
+    for pattern, replacement in _NORMALIZER_PASSES:
+        text = pattern.sub(replacement, text)
     
-    # Hapus URL
-    text = re.sub(r'https?://\S+|www\.\S+', '', text)
+    # Hapus spasi berlebih
+    return ' '.join(text.split())
+
+def tokenize(text):
+    """
+    Memecah teks yang sudah dibersihkan menjadi token.
+    Setelah clean_text dan normalize_words teks hanya berisi huruf, angka,
+    garis bawah, tanda hubung dan spasi, sehingga pemisahan berdasarkan spasi
+    memberi hasil yang sama dengan nltk.word_tokenize tanpa memuat model punkt.
     
-    # Hapus tag HTML
-    text = re.sub(r'<.*?>', '', text)
+    Parameters
+    ----------
+    text : str
+        Teks yang sudah dibersihkan dan dinormalisasi
     
-    # Hapus emoji dan simbol khusus
-    text = re.sub(r'[^\w\s]', ' ', text)
+    Returns
+    -------
+    list of str
+        Daftar token
+    """
+    return text.split()
+
+# Naikkan jika logika preprocessing di kode berubah (bukan hanya daftar kata),
+# agar cache teks terproses yang lama tidak dipakai lagi
+PREPROCESSOR_REVISION = 1
+
+def _preprocessor_fingerprint():
+    """
+    Sidik jari konfigurasi preprocessing: revisi kode, stopwords, tabel normalisasi,
+    pola pembersihan dan stemmer beserta versinya
     
-    # Hapus spasi berlebih
-    text = re.sub(r'\s+', ' ', text)
+    Returns
+    -------
+    str
+        Hash SHA-1 heksadesimal
+    """
+    try:
+        sastrawi_version = metadata.version('Sastrawi')
+    except metadata.PackageNotFoundError:
+        sastrawi_version = 'unknown'
+    
+    stemmer_class = type(stem_cache.stemmer)
+    config = {
+        'revision': PREPROCESSOR_REVISION,
+        'stop_words': sorted(stop_words),
+        'important_medical_terms': sorted(important_medical_terms),
+        'word_normalization': word_normalization,
+        'normalizer_passes': [
+            (pattern.pattern, replacement if isinstance(replacement, str) else replacement.__name__)
+            for pattern, replacement in _NORMALIZER_PASSES
+        ],
+        'stemmer': f"{stemmer_class.__module__}.{stemmer_class.__name__} {sastrawi_version}"
+    }
+    encoded = json.dumps(config, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+# Versi preprocessor untuk kunci cache teks terproses (lihat utils.corpus_cache)
+PREPROCESSOR_VERSION = _preprocessor_fingerprint()
+
+class PreprocessedDocument:
+    """
+    Hasil preprocessing satu teks: teks asli, token hasil stemming, dan
+    teks gabungannya. Objek ini dapat diteruskan langsung ke model sehingga
+    teks tidak perlu diproses ulang.
+    """
     
-    # Kembalikan tanggal dan angka
-    for i, date in enumerate(dates):
-        text = text.replace('DATE', date, 1)
+    __slots__ = ('raw', 'tokens', 'text')
     
-    for i, number in enumerate(numbers):
-        text = text.replace('NUM', number, 1)
+    def __init__(self, raw, tokens):
+        self.raw = raw
+        self.tokens = tuple(tokens)
+        self.text = ' '.join(self.tokens)
     
-    return text.strip()
+    def __repr__(self):
+        return f"PreprocessedDocument(raw={self.raw!r}, text={self.text!r})"
 
-def preprocess_text(text):
+def preprocess_document(text):
     """
-    Melakukan preprocessing teks berbahasa Indonesia
+    Melakukan preprocessing teks berbahasa Indonesia dan mengembalikan dokumen
+    yang menyimpan teks asli beserta token hasil preprocessing
     
     Parameters
     ----------
@@ -273,24 +522,20 @@ def preprocess_text(text):
     
     Returns
     -------
-    str
-        Teks yang sudah diproses (distem dan dibersihkan)
+    PreprocessedDocument
+        Dokumen hasil preprocessing
     """
     if not text or not isinstance(text, str):
-        return ""
-      # Pembersihan dan normalisasi teks
-    text = clean_text(text)
+        return PreprocessedDocument(text, ())
+    
+    # Pembersihan dan normalisasi teks
+    cleaned = clean_text(text)
     
     # Normalisasi kata-kata informal dan singkatan
-    text = normalize_words(text)
+    cleaned = normalize_words(cleaned)
     
     # Tokenisasi
-    try:
-        # Coba gunakan tokenizer dengan bahasa Indonesia
-        tokens = word_tokenize(text, language='indonesian')
-    except:
-        # Fallback ke bahasa Inggris jika model bahasa Indonesia tidak tersedia
-        tokens = word_tokenize(text)
+    tokens = tokenize(cleaned)
     
     # Hapus stopwords
     tokens = [word for word in tokens if word not in stop_words]
@@ -301,12 +546,101 @@ def preprocess_text(text):
         if word in important_medical_terms:
             stemmed_tokens.append(word)  # Simpan kata medis penting apa adanya
         else:
-            stemmed_tokens.append(stemmer.stem(word))  # Stem kata-kata lain
+            stemmed_tokens.append(stem_cache.stem(word))  # Stem kata-kata lain (melalui cache)
+    
+    return PreprocessedDocument(text, stemmed_tokens)
+
+def preprocess_text(text):
+    """
+    Melakukan preprocessing teks berbahasa Indonesia
+    
+    Parameters
+    ----------
+    text : str
+        Teks input yang akan diproses
+    
+    Returns
+    -------
+    str
+        Teks yang sudah diproses (distem dan dibersihkan)
+    """
+    return preprocess_document(text).text
+
+def _preprocess_chunk(texts):
+    """
+    Memproses satu potongan teks di dalam worker
+    
+    Parameters
+    ----------
+    texts : list of str
+        Potongan teks yang akan diproses
+    
+    Returns
+    -------
+    tuple
+        (teks_terproses, token_baru) agar cache stemming proses utama ikut diperbarui
+    """
+    stem_cache.start_recording()
+    try:
+        processed = [preprocess_text(text) for text in texts]
+    finally:
+        new_stems = stem_cache.stop_recording()
+    return processed, new_stems
+
+def _map_chunks(executor, chunks):
+    """Memproses potongan teks dengan process pool; cache stemming proses utama ikut diperbarui"""
+    processed = []
+    # executor.map mengembalikan hasil sesuai urutan potongan
+    for chunk_result, new_stems in executor.map(_preprocess_chunk, chunks):
+        processed.extend(chunk_result)
+        stem_cache.update(new_stems)
+    return processed
+
+def preprocess_texts(texts, n_jobs=None, chunksize=256, executor=None):
+    """
+    Melakukan preprocessing banyak teks sekaligus.
+    Teks yang sama hanya diproses sekali, lalu teks unik dibagi menjadi
+    potongan dan diproses paralel menggunakan process pool.
+    
+    Parameters
+    ----------
+    texts : iterable of str
+        Kumpulan teks input
+    n_jobs : int or None
+        Jumlah proses worker. None atau 1 berarti diproses di proses ini,
+        -1 berarti menggunakan semua core CPU
+    chunksize : int
+        Jumlah teks unik per potongan yang dikirim ke worker
+    executor : concurrent.futures.ProcessPoolExecutor or None
+        Process pool yang sudah berjalan untuk dipakai ulang di banyak pemanggilan
+        (n_jobs diabaikan), agar worker tidak dibuat ulang setiap pemanggilan
+    
+    Returns
+    -------
+    list of str
+        Teks yang sudah diproses, dengan urutan yang sama seperti input
+    """
+    texts = list(texts)
+    
+    # Deduplikasi dengan mempertahankan urutan kemunculan pertama
+    unique_texts = list(dict.fromkeys(texts))
+    
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    
+    chunks = [unique_texts[i:i + chunksize] for i in range(0, len(unique_texts), chunksize)]
+    n_jobs = min(n_jobs or 1, len(chunks))
     
-    # Gabungkan kembali
-    preprocessed_text = ' '.join(stemmed_tokens)
+    if executor is not None:
+        processed = _map_chunks(executor, chunks)
+    elif n_jobs <= 1:
+        processed = [preprocess_text(text) for text in unique_texts]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            processed = _map_chunks(executor, chunks)
     
-    return preprocessed_text
+    results = dict(zip(unique_texts, processed))
+    return [results[text] for text in texts]
 
 def extract_gejala_patterns(text):
     """
@@ -0,0 +1,135 @@
+"""
+Penyimpanan data training kolumnar (Parquet) beserta kolom teks terproses.
+
+File Parquet berisi kolom 'symptoms', 'disease' (dictionary-encoded, dibaca
+sebagai kategori pandas) dan 'processed_symptoms'. Versi preprocessor yang
+menghasilkan kolom terproses disimpan di metadata skema sehingga kolom itu
+hanya dipakai ulang jika preprocessing tidak berubah. CSV tetap menjadi
+sumber data yang diedit; Parquet dibuat ulang dari CSV dengan import_csv.
+"""
+import os
+import sys
+import pandas as pd
+
+from utils.preprocessor import PREPROCESSOR_VERSION, preprocess_texts
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    # pyarrow bersifat opsional; tanpa pyarrow data training tetap dibaca dari CSV
+    pa = pq = None
+    PARQUET_AVAILABLE = False
+
+VERSION_METADATA_KEY = b'tanyasehat.preprocessor_version'
+
+def _require_pyarrow():
+    """Memastikan pyarrow terpasang"""
+    if not PARQUET_AVAILABLE:
+        raise ImportError("pyarrow diperlukan untuk penyimpanan Parquet (pip install pyarrow)")
+
+def _schema(version):
+    """Skema Parquet data training dengan versi preprocessor di metadata"""
+    return pa.schema(
+        [
+            ('symptoms', pa.string()),
+            ('disease', pa.dictionary(pa.int32(), pa.string())),
+            ('processed_symptoms', pa.string())
+        ],
+        metadata={VERSION_METADATA_KEY: version.encode('utf-8')}
+    )
+
+def read_parquet(path, columns=None):
+    """
+    Membaca data training dari file Parquet
+    
+    Parameters
+    ----------
+    path : str
+        Path file Parquet
+    columns : list of str or None
+        Kolom yang dibaca, None berarti semua kolom
+    
+    Returns
+    -------
+    pandas.DataFrame
+        Data training; kolom 'disease' bertipe category dan
+        attrs['preprocessor_version'] berisi versi kolom terproses
+    """
+    _require_pyarrow()
+    table = pq.read_table(path, columns=columns)
+    metadata = table.schema.metadata or {}
+    data = table.to_pandas()
+    data.attrs['preprocessor_version'] = metadata.get(VERSION_METADATA_KEY, b'').decode('utf-8')
+    return data
+
+def import_csv(csv_path, parquet_path, n_jobs=None, chunksize=100000):
+    """
+    Mengimpor CSV data training menjadi file Parquet. CSV dibaca per potongan
+    dan setiap potongan ditulis sebagai satu row group. Teks yang sudah ada di
+    file Parquet lama (dengan versi preprocessor yang sama) tidak diproses ulang.
+    
+    Parameters
+    ----------
+    csv_path : str
+        Path file CSV dengan kolom 'symptoms' dan 'disease'
+    parquet_path : str
+        Path file Parquet tujuan (ditimpa secara atomik)
+    n_jobs : int or None
+        Jumlah proses worker untuk preprocessing
+    chunksize : int
+        Jumlah baris CSV per potongan
+    
+    Returns
+    -------
+    int
+        Jumlah baris yang diimpor
+    """
+    _require_pyarrow()
+    
+    # Teks terproses dari file lama dipakai ulang jika preprocessing belum berubah
+    known = {}
+    if os.path.exists(parquet_path):
+        try:
+            previous = read_parquet(parquet_path, columns=['symptoms', 'processed_symptoms'])
+            if previous.attrs['preprocessor_version'] == PREPROCESSOR_VERSION:
+                known = dict(zip(previous['symptoms'], previous['processed_symptoms']))
+            del previous
+        except (OSError, KeyError, pa.ArrowException):
+            known = {}
+    
+    schema = _schema(PREPROCESSOR_VERSION)
+    tmp_path = f"{parquet_path}.tmp-{os.getpid()}"
+    n_rows = 0
+    n_processed = 0
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for chunk in pd.read_csv(csv_path, usecols=['symptoms', 'disease'], chunksize=chunksize):
+            symptoms = chunk['symptoms'].fillna('').astype(str).tolist()
+            missing = [text for text in dict.fromkeys(symptoms) if text not in known]
+            if missing:
+                known.update(zip(missing, preprocess_texts(missing, n_jobs=n_jobs)))
+                n_processed += len(missing)
+            
+            table = pa.Table.from_pandas(
+                pd.DataFrame({
+                    'symptoms': symptoms,
+                    'disease': pd.Categorical(chunk['disease'].astype(str)),
+                    'processed_symptoms': [known[text] for text in symptoms]
+                }),
+                schema=schema,
+                preserve_index=False
+            )
+            writer.write_table(table)
+            n_rows += len(chunk)
+    os.replace(tmp_path, parquet_path)
+    
+    print(f"{n_rows} baris diimpor dari {csv_path} ke {parquet_path} ({n_processed} teks unik dipreprocessing)")
+    return n_rows
+
+if __name__ == '__main__':
+    # Penggunaan: python -m utils.training_store data/training_data.csv data/training_data.parquet
+    if len(sys.argv) != 3:
+        print("Penggunaan: python -m utils.training_store <file_data.csv> <file_data.parquet>")
+        sys.exit(1)
+    import_csv(sys.argv[1], sys.argv[2])